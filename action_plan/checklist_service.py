@@ -1,7 +1,3 @@
-from django.db.models import Q
-from .models import UserDocument, ReferenceLetter, CoverLetter
-
-
 class ChecklistService:
 
     DOCUMENTS_META = {
@@ -27,7 +23,7 @@ class ChecklistService:
     def get_checklist_for_assessment(user, assessment):
 
         # Defensive safety
-        if not assessment or assessment.user != user:
+        if not assessment or assessment.user_id != user.id:
             return {
                 "checklist": [],
                 "completed": 0,
@@ -38,29 +34,26 @@ class ChecklistService:
         checklist = []
 
         # ---------------------------------------------
-        # Fetch all related objects in minimal queries
+        # Related objects: prefetched by the caller
+        # (ActionPlanService.with_task_relations) or one query each
         # ---------------------------------------------
 
-        user_docs = UserDocument.objects.filter(
-            user=user,
-            assessment=assessment
-        )
-
         docs_map = {
             doc.document_type: doc
-            for doc in user_docs
+            for doc in assessment.ap_documents.all()
+            if doc.user_id == user.id
         }
 
-        ref = (
-            ReferenceLetter.objects
-            .filter(user=user, assessment=assessment)
-            .first()
+        ref = min(
+            (r for r in assessment.ap_reference_letters.all() if r.user_id == user.id),
+            key=lambda r: r.pk,
+            default=None
         )
 
-        cover = (
-            CoverLetter.objects
-            .filter(user=user, assessment=assessment)
-            .first()
+        cover = min(
+            (c for c in assessment.ap_cover_letters.all() if c.user_id == user.id),
+            key=lambda c: c.pk,
+            default=None
         )
 
         # ---------------------------------------------
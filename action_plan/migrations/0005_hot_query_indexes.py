@@ -0,0 +1,27 @@
+# Generated by Django 6.0.2 on 2026-10-18 07:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('action_plan', '0004_completedtask_points_earned'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='coverletter',
+            index=models.Index(fields=['user', 'assessment'], name='ap_cover_user_assess_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='referenceletter',
+            index=models.Index(fields=['user', 'assessment'], name='ap_reference_user_assess_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userdocument',
+            index=models.Index(fields=['user', 'assessment'], name='ap_document_user_assess_idx'),
+        ),
+    ]
@@ -26,6 +26,11 @@ class UserDocument(models.Model):
         blank=True
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "assessment"], name="ap_document_user_assess_idx")
+        ]
+
     def __str__(self):
         return f"{self.user.email} - {self.document_type}"
 
@@ -46,6 +51,11 @@ class ReferenceLetter(models.Model):
         blank=True
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "assessment"], name="ap_reference_user_assess_idx")
+        ]
+
 
 class CoverLetter(models.Model):
     user = models.ForeignKey(
@@ -63,6 +73,11 @@ class CoverLetter(models.Model):
         blank=True
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "assessment"], name="ap_cover_user_assess_idx")
+        ]
+
 
 class CompletedTask(models.Model):
     user = models.ForeignKey(
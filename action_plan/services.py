@@ -1,6 +1,4 @@
 from assessments.models import Assessment
-from .models import CompletedTask
-from django.db.models import Sum
 
 TASK_WEIGHTS = {
     "upload_payslip": 5,
@@ -9,12 +7,17 @@ TASK_WEIGHTS = {
     "improve_cover_letter": 4,
 }
 
+# Assessment relations the task and checklist builders read.
+TASK_RELATIONS = ("completed_tasks", "ap_documents", "ap_reference_letters", "ap_cover_letters")
+
 
 class ActionPlanService:
 
     @staticmethod
     def get_latest_assessment(user):
-        return Assessment.objects.filter(user=user).order_by("-created_at").first()
+        return ActionPlanService.with_task_relations(
+            Assessment.objects.filter(user=user).order_by("-created_at")
+        ).first()
 
     @staticmethod
     def get_all_possible_tasks(assessment):
@@ -81,16 +84,23 @@ class ActionPlanService:
 
         return scaled
 
+    @staticmethod
+    def with_task_relations(queryset):
+        """Prefetch everything the task and checklist builders read, one query per relation."""
+        return queryset.prefetch_related(*TASK_RELATIONS)
+
     @staticmethod
     def generate_tasks_for_assessment(assessment):
         if not assessment:
             return []
 
-        user = assessment.user
-        completed_keys = set(
-            CompletedTask.objects.filter(user=user, assessment=assessment)
-            .values_list("task_key", flat=True)
-        )
+        user = assessment.user_id
+        completed_keys = {
+            t.task_key for t in assessment.completed_tasks.all() if t.user_id == user
+        }
+        document_types = {d.document_type for d in assessment.ap_documents.all()}
+        has_reference = any(r.file.name is not None for r in assessment.ap_reference_letters.all())
+        cover = min(assessment.ap_cover_letters.all(), key=lambda c: c.pk, default=None)
 
         all_tasks = ActionPlanService.get_all_possible_tasks(assessment)
 
@@ -98,16 +108,14 @@ class ActionPlanService:
         for task in all_tasks:
             if task["key"] in completed_keys:
                 continue
-            if task["key"] == "upload_payslip" and assessment.ap_documents.filter(document_type="payslip").exists():
+            if task["key"] == "upload_payslip" and "payslip" in document_types:
+                continue
+            if task["key"] == "upload_bank_statement" and "bank_statement" in document_types:
                 continue
-            if task["key"] == "upload_bank_statement" and assessment.ap_documents.filter(document_type="bank_statement").exists():
+            if task["key"] == "add_reference_letter" and has_reference:
                 continue
-            if task["key"] == "add_reference_letter" and assessment.ap_reference_letters.filter(file__isnull=False).exists():
+            if task["key"] == "improve_cover_letter" and cover and cover.file:
                 continue
-            if task["key"] == "improve_cover_letter":
-                cover = assessment.ap_cover_letters.first()
-                if cover and cover.file:
-                    continue
             visible_tasks.append(task)
 
         return ActionPlanService.scale_task_points(assessment, visible_tasks)
@@ -115,10 +123,10 @@ class ActionPlanService:
     @staticmethod
     def get_improvement_score_for_assessment(assessment):
         # Not used for final score anymore, but kept for possible other uses
-        return CompletedTask.objects.filter(
-            assessment=assessment,
-            user=assessment.user
-        ).aggregate(total=Sum("points_earned"))["total"] or 0
+        return sum(
+            t.points_earned for t in assessment.completed_tasks.all()
+            if t.user_id == assessment.user_id
+        )
 
     @staticmethod
     def get_final_score_for_assessment(user, assessment):
@@ -128,4 +136,20 @@ class ActionPlanService:
         # Free users see only base score (without improvements)
         if not getattr(user, "is_premium", False):
             pass
-        return min(assessment.readiness_score or 0, 100)
\ No newline at end of file
+        return min(assessment.readiness_score or 0, 100)
+
+    @staticmethod
+    def get_tasks_payload(user, assessment):
+        if not assessment:
+            return {
+                "tasks": [],
+                "base_score": 0,
+                "improvement_score": 0,
+                "final_score": 0
+            }
+        return {
+            "tasks": ActionPlanService.generate_tasks_for_assessment(assessment),
+            "base_score": assessment.readiness_score or 0,
+            "improvement_score": ActionPlanService.get_improvement_score_for_assessment(assessment),
+            "final_score": ActionPlanService.get_final_score_for_assessment(user, assessment),
+        }
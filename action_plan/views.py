@@ -8,8 +8,12 @@ from django.views.generic import TemplateView
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth import get_user_model
 from django.db import transaction
+from django.utils.decorators import method_decorator
 
+from assessments.aggregates import record_score_change
+from assessments.conditional import assessment_condition
 from assessments.models import Assessment
+from dashboard.views import build_bootstrap
 from .services import ActionPlanService, TASK_WEIGHTS
 from .models import CompletedTask, UserDocument, ReferenceLetter, CoverLetter
 from .checklist_service import ChecklistService
@@ -25,39 +29,37 @@ def require_premium(user):
         return False
 
 
-class ActionPlanPageView(LoginRequiredMixin, TemplateView):
+class BootstrapDataMixin:
+    """Embeds the /api/dashboard/bootstrap/ payload (premium pages only) as ``initial_data``."""
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["initial_data"] = build_bootstrap(self.request) if require_premium(self.request.user) else None
+        return context
+
+
+class ActionPlanPageView(LoginRequiredMixin, BootstrapDataMixin, TemplateView):
     template_name = "action_plan/action_plan.html"
 
 
 class ActionPlanTasksView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @method_decorator(assessment_condition)
     def get(self, request, assessment_id=None):
         if not require_premium(request.user):
             return Response({"detail": "Premium required"}, status=status.HTTP_403_FORBIDDEN)
 
         if assessment_id:
-            assessment = get_object_or_404(Assessment, id=assessment_id, user=request.user)
+            assessment = get_object_or_404(
+                ActionPlanService.with_task_relations(Assessment.objects.all()),
+                id=assessment_id,
+                user=request.user
+            )
         else:
             assessment = ActionPlanService.get_latest_assessment(request.user)
 
-        if not assessment:
-            return Response({
-                "tasks": [],
-                "base_score": 0,
-                "improvement_score": 0,
-                "final_score": 0
-            })
-
-        tasks = ActionPlanService.generate_tasks_for_assessment(assessment)
-        final_score = ActionPlanService.get_final_score_for_assessment(request.user, assessment)
-
-        return Response({
-            "tasks": tasks,
-            "base_score": assessment.readiness_score or 0,
-            "improvement_score": ActionPlanService.get_improvement_score_for_assessment(assessment),
-            "final_score": final_score,
-        })
+        return Response(ActionPlanService.get_tasks_payload(request.user, assessment))
 
 
 class UploadDocumentView(APIView):
@@ -113,8 +115,10 @@ class UploadDocumentView(APIView):
         # ✅ NEW SCORE = old score + points earned (capped at 100)
         old_score = assessment.readiness_score or 0
         new_score = min(old_score + points_earned, 100)
+        previous_score = assessment.readiness_score
         assessment.readiness_score = new_score
         assessment.save(update_fields=["readiness_score"])
+        record_score_change(assessment, previous_score, new_score)
 
         return Response({"final_score": new_score}, status=status.HTTP_200_OK)
 
@@ -162,8 +166,10 @@ class AddReferenceView(APIView):
 
         old_score = assessment.readiness_score or 0
         new_score = min(old_score + points_earned, 100)
+        previous_score = assessment.readiness_score
         assessment.readiness_score = new_score
         assessment.save(update_fields=["readiness_score"])
+        record_score_change(assessment, previous_score, new_score)
 
         return Response({"final_score": new_score}, status=status.HTTP_200_OK)
 
@@ -211,29 +217,40 @@ class SaveCoverLetterView(APIView):
 
         old_score = assessment.readiness_score or 0
         new_score = min(old_score + points_earned, 100)
+        previous_score = assessment.readiness_score
         assessment.readiness_score = new_score
         assessment.save(update_fields=["readiness_score"])
+        record_score_change(assessment, previous_score, new_score)
 
         return Response({"final_score": new_score}, status=status.HTTP_200_OK)
 
 
-class DocumentsHomePageView(LoginRequiredMixin, TemplateView):
+class DocumentsHomePageView(LoginRequiredMixin, BootstrapDataMixin, TemplateView):
     template_name = "action_plan/documents.html"
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["assessments"] = Assessment.objects.filter(user=self.request.user).order_by("-created_at")
+        context["assessments"] = (
+            Assessment.objects.filter(user=self.request.user)
+            .only("id", "created_at")
+            .order_by("-created_at")
+        )
         return context
 
 
 class DocumentChecklistView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @method_decorator(assessment_condition)
     def get(self, request, assessment_id):
         if not require_premium(request.user):
             return Response({"detail": "Premium required"}, status=status.HTTP_403_FORBIDDEN)
 
-        assessment = get_object_or_404(Assessment, id=assessment_id, user=request.user)
+        assessment = get_object_or_404(
+            ActionPlanService.with_task_relations(Assessment.objects.all()),
+            id=assessment_id,
+            user=request.user
+        )
         data = ChecklistService.get_checklist_for_assessment(request.user, assessment)
         return Response(data)
 
@@ -281,7 +298,9 @@ class DeleteDocumentView(APIView):
         # Subtract the points that were earned from this task (if any)
         old_score = assessment.readiness_score or 0
         new_score = max(old_score - points_to_subtract, 0)
+        previous_score = assessment.readiness_score
         assessment.readiness_score = new_score
         assessment.save(update_fields=["readiness_score"])
+        record_score_change(assessment, previous_score, new_score)
 
         return Response({"detail": "Deleted successfully", "final_score": new_score}, status=status.HTTP_200_OK)
\ No newline at end of file
@@ -35,5 +35,10 @@ class Application(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "-created_at"], name="application_user_recent_idx")
+        ]
+
     def __str__(self):
         return f"{self.property_address} - {self.status}"
\ No newline at end of file
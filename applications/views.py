@@ -38,7 +38,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         if not require_premium(self.request.user):
             return Application.objects.none()
 
-        return Application.objects.filter(user=self.request.user)
+        return Application.objects.filter(user=self.request.user).order_by("-created_at")
 
     def perform_create(self, serializer):
         if not require_premium(self.request.user):
@@ -1,3 +1,97 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import Assessment, CohortStat
+
+
+class RentToIncomeFilter(admin.SimpleListFilter):
+    title = "rent to income"
+    parameter_name = "rent_ratio"
+
+    BANDS = {
+        "affordable": (None, 0.30),
+        "acceptable": (0.30, 0.35),
+        "tight": (0.35, 0.45),
+        "high": (0.45, None),
+    }
+
+    def lookups(self, request, model_admin):
+        return [
+            ("affordable", "≤ 30%"),
+            ("acceptable", "30–35%"),
+            ("tight", "35–45%"),
+            ("high", "> 45%"),
+            ("unknown", "Unknown"),
+        ]
+
+    def queryset(self, request, queryset):
+        if self.value() == "unknown":
+            return queryset.filter(rent_to_income_ratio__isnull=True)
+        if self.value() not in self.BANDS:
+            return queryset
+        low, high = self.BANDS[self.value()]
+        if low is not None:
+            queryset = queryset.filter(rent_to_income_ratio__gt=low)
+        if high is not None:
+            queryset = queryset.filter(rent_to_income_ratio__lte=high)
+        return queryset
+
+
+class TenureFilter(admin.SimpleListFilter):
+    title = "time in role"
+    parameter_name = "tenure"
+
+    def lookups(self, request, model_admin):
+        return [
+            ("under_6", "Under 6 months"),
+            ("6_to_12", "6–11 months"),
+            ("12_plus", "12+ months"),
+            ("unknown", "Unknown"),
+        ]
+
+    def queryset(self, request, queryset):
+        value = self.value()
+        if value == "under_6":
+            return queryset.filter(months_in_role__lt=6)
+        if value == "6_to_12":
+            return queryset.filter(months_in_role__gte=6, months_in_role__lt=12)
+        if value == "12_plus":
+            return queryset.filter(months_in_role__gte=12)
+        if value == "unknown":
+            return queryset.filter(months_in_role__isnull=True)
+        return queryset
+
+
+@admin.register(Assessment)
+class AssessmentAdmin(admin.ModelAdmin):
+    list_display = (
+        "id", "full_name", "suburb", "postcode", "readiness_score", "risk_level",
+        "annual_income", "rent_to_income_ratio", "months_in_role", "document_count", "created_at",
+    )
+    list_filter = (
+        "risk_level", "employment_status", "rental_history", "document_count",
+        RentToIncomeFilter, TenureFilter,
+    )
+    search_fields = ("full_name", "suburb", "postcode", "user__email")
+    readonly_fields = Assessment.DERIVED_FIELDS
+    list_select_related = ("user",)
+
+
+@admin.register(CohortStat)
+class CohortStatAdmin(admin.ModelAdmin):
+    """Read-only: rows are maintained by assessments.aggregates."""
+    list_display = (
+        "month", "employment_status", "rental_history", "postcode", "count",
+        "mean_score", "low_count", "medium_count", "high_count", "updated_at",
+    )
+    list_filter = ("month", "employment_status", "rental_history")
+    search_fields = ("postcode",)
+    date_hierarchy = "month"
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,187 @@
+"""
+Incrementally maintained readiness-score aggregates.
+
+Score histograms: every scored assessment is counted in 101 integer bins
+(0-100) for the global scope and for its postcode and suburb, so a
+percentile lookup reads at most 101 rows per scope from the unique index
+and never scans assessments.
+
+Cohort stats: running count / score totals / risk counts per (month,
+employment status, rental history, postcode), so distribution dashboards
+sum a bounded number of pre-aggregated rows.
+
+Writers adjust both with F() updates whenever a score is set or changes.
+``manage.py rebuild_score_buckets`` and ``manage.py reconcile_cohort_stats``
+recompute them from scratch to correct any drift.
+"""
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .localities import normalize
+from .models import CohortStat, ScoreBucket
+from .scoring import risk_from_score
+
+GLOBAL = "global"
+POSTCODE = "postcode"
+SUBURB = "suburb"
+
+
+def bucket_keys(postcode, suburb):
+    """(scope, key) pairs an assessment in ``postcode``/``suburb`` counts towards."""
+    keys = [(GLOBAL, "")]
+    postcode = (postcode or "").strip()
+    if postcode:
+        keys.append((POSTCODE, postcode))
+    suburb = normalize(suburb)
+    if suburb:
+        keys.append((SUBURB, suburb))
+    return keys
+
+
+def _bin(score):
+    return max(0, min(int(score), 100))
+
+
+def add_score_change(deltas, postcode, suburb, old_score, new_score):
+    """Accumulate the bin changes for one assessment into ``deltas``."""
+    if old_score == new_score:
+        return
+    for scope, key in bucket_keys(postcode, suburb):
+        if old_score is not None:
+            deltas[(scope, key, _bin(old_score))] -= 1
+        if new_score is not None:
+            deltas[(scope, key, _bin(new_score))] += 1
+
+
+def apply_deltas(deltas):
+    for (scope, key, score), delta in deltas.items():
+        if not delta:
+            continue
+        bucket = ScoreBucket.objects.filter(scope=scope, key=key, score=score)
+        if bucket.update(count=F("count") + delta):
+            continue
+        try:
+            with transaction.atomic():
+                ScoreBucket.objects.create(scope=scope, key=key, score=score, count=delta)
+        except IntegrityError:
+            # Another writer created the bin first.
+            bucket.update(count=F("count") + delta)
+
+
+# ---- Cohort stats ----
+
+RISK_COLUMNS = {"Low": "low_count", "Medium": "medium_count", "High": "high_count"}
+
+
+def cohort_key(created_at, employment_status, rental_history, postcode):
+    month = timezone.localtime(created_at).date().replace(day=1)
+    return (month, employment_status or "", rental_history or "", (postcode or "").strip())
+
+
+def add_cohort_change(deltas, key, old_score, new_score):
+    """Accumulate one assessment's score change into ``deltas[key]``."""
+    if old_score == new_score:
+        return
+    totals = deltas[key]
+    for score, sign in ((old_score, -1), (new_score, 1)):
+        if score is None:
+            continue
+        totals["count"] += sign
+        totals["score_total"] += sign * score
+        totals["score_sq_total"] += sign * score * score
+        totals[RISK_COLUMNS[risk_from_score(score)]] += sign
+
+
+def apply_cohort_deltas(deltas):
+    now = timezone.now()
+    for (month, employment_status, rental_history, postcode), totals in deltas.items():
+        totals = {column: delta for column, delta in totals.items() if delta}
+        if not totals:
+            continue
+        cohort = CohortStat.objects.filter(
+            month=month,
+            employment_status=employment_status,
+            rental_history=rental_history,
+            postcode=postcode,
+        )
+        increments = {column: F(column) + delta for column, delta in totals.items()}
+        if cohort.update(updated_at=now, **increments):
+            continue
+        try:
+            with transaction.atomic():
+                CohortStat.objects.create(
+                    month=month,
+                    employment_status=employment_status,
+                    rental_history=rental_history,
+                    postcode=postcode,
+                    **totals
+                )
+        except IntegrityError:
+            cohort.update(updated_at=now, **increments)
+
+
+def record_score_change(assessment, old_score, new_score):
+    """Move ``assessment`` from its old score to the new one in every aggregate."""
+    deltas = Counter()
+    add_score_change(deltas, assessment.postcode, assessment.suburb, old_score, new_score)
+    apply_deltas(deltas)
+
+    cohort_deltas = defaultdict(Counter)
+    key = cohort_key(
+        assessment.created_at, assessment.employment_status,
+        assessment.rental_history, assessment.postcode
+    )
+    add_cohort_change(cohort_deltas, key, old_score, new_score)
+    apply_cohort_deltas(cohort_deltas)
+
+
+def _percentile(bins, score):
+    total = sum(bins.values())
+    if not total:
+        return None, 0
+    below = sum(count for bin_score, count in bins.items() if bin_score < score)
+    # Mid-rank: ties count as half above, half below.
+    rank = (below + bins.get(score, 0) / 2) / total
+    return round(rank * 100), total
+
+
+def score_percentiles(score, postcode=None, suburb=None):
+    """
+    Percentile rank of ``score`` among all scored assessments, and within
+    the given postcode and suburb: ``{scope: {"percentile", "sample_size"}}``.
+    A scope with no data has ``percentile`` None.
+    """
+    keys = bucket_keys(postcode, suburb)
+    condition = Q()
+    for scope, key in keys:
+        condition |= Q(scope=scope, key=key)
+
+    bins = {scope_key: {} for scope_key in keys}
+    for scope, key, bin_score, count in (
+        ScoreBucket.objects.filter(condition).values_list("scope", "key", "score", "count")
+    ):
+        bins[(scope, key)][bin_score] = count
+
+    result = {}
+    for scope, key in keys:
+        percentile, total = _percentile(bins[(scope, key)], _bin(score))
+        result[scope] = {"percentile": percentile, "sample_size": total}
+    return result
+
+
+def competitiveness(score, postcode=None, suburb=None):
+    """
+    The most local percentile with enough applicants behind it
+    (suburb, then postcode, then global) as ``(percentile, scope)``.
+    """
+    percentiles = score_percentiles(score, postcode, suburb)
+    min_sample = settings.COMPETITIVENESS_MIN_SAMPLE
+    for scope in (SUBURB, POSTCODE):
+        local = percentiles.get(scope)
+        if local and local["sample_size"] >= min_sample:
+            return local["percentile"], scope
+    return percentiles[GLOBAL]["percentile"], GLOBAL
@@ -0,0 +1,84 @@
+"""
+Conditional GET validators for the per-assessment APIs.
+
+Every score or document change saves the Assessment, which bumps
+``updated_at``, so (id, updated_at) identifies a version of everything the
+task and checklist payloads are built from. Validators are evaluated before
+the view builds its body; a matching ``If-None-Match`` /
+``If-Modified-Since`` gets a 304 straight away.
+"""
+import hashlib
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.views.decorators.http import condition
+
+from dashboard.cache import readiness_cache
+
+from .models import Assessment
+
+
+def _etag(*parts):
+    return hashlib.sha1(":".join(map(str, parts)).encode()).hexdigest()
+
+
+def _memoized(request, compute):
+    """Django calls the etag and last-modified functions separately; query once."""
+    key = "_assessment_validators"
+    if not hasattr(request, key):
+        setattr(request, key, compute())
+    return getattr(request, key)
+
+
+def _is_premium(request):
+    return getattr(request.user, "is_premium", False)
+
+
+def _single_assessment(request, assessment_id=None, **kwargs):
+    def compute():
+        if not request.user.is_authenticated:
+            return None, None
+        rows = Assessment.objects.filter(user=request.user)
+        if assessment_id:
+            rows = rows.filter(id=assessment_id)
+        else:
+            rows = rows.order_by("-created_at")
+        row = rows.values("id", "updated_at").first()
+        if row is None:
+            return None, None
+        etag = _etag(request.path, row["id"], row["updated_at"].isoformat(), _is_premium(request))
+        return etag, row["updated_at"]
+    return _memoized(request, compute)
+
+
+def _readiness(request, assessment_id=None, **kwargs):
+    """
+    The readiness payload also lists the user's other assessments, so it is
+    validated by the per-user readiness cache version instead (bumped on the
+    same writes, and a cache lookup rather than a query). Percentiles move
+    with other users' scores, so the validator also rolls over every
+    READINESS_CACHE_TTL seconds.
+    """
+    def compute():
+        if not request.user.is_authenticated:
+            return None, None
+        version = readiness_cache.version(request.user.id)
+        ttl = max(settings.READINESS_CACHE_TTL, 1)
+        window_start = int(time.time()) // ttl * ttl
+        target = assessment_id or request.GET.get("assessment_id") or "latest"
+        etag = _etag(request.path, target, version, window_start, _is_premium(request))
+        last_modified = max(version // 1_000_000_000, window_start)
+        return etag, datetime.fromtimestamp(last_modified, dt_timezone.utc)
+    return _memoized(request, compute)
+
+
+assessment_condition = condition(
+    etag_func=lambda request, *args, **kwargs: _single_assessment(request, **kwargs)[0],
+    last_modified_func=lambda request, *args, **kwargs: _single_assessment(request, **kwargs)[1],
+)
+
+readiness_condition = condition(
+    etag_func=lambda request, *args, **kwargs: _readiness(request, **kwargs)[0],
+    last_modified_func=lambda request, *args, **kwargs: _readiness(request, **kwargs)[1],
+)
@@ -0,0 +1,86 @@
+"""
+Deferred enrichment for submitted assessments.
+
+The submit view stores the score synchronously in a single INSERT and
+schedules the non-critical work (gap analysis, recommendations, the detailed
+breakdown snapshot) here once the transaction commits. A small per-process
+thread pool does the work; anything it misses (process restart, crash) is
+picked up by ``manage.py enrich_assessments``.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from dashboard.services import BREAKDOWN_VERSION, build_detailed_breakdown
+
+from .models import Assessment
+from .scoring_cache import evaluate_assessment
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.ASSESSMENT_ENRICHMENT_WORKERS,
+                    thread_name_prefix="assessment-enrichment",
+                )
+    return _executor
+
+
+def enrich_assessment(assessment_id):
+    """
+    Compute and store gap analysis, recommendations and the breakdown
+    snapshot for one assessment.
+    Returns the new status, or None if the row no longer exists.
+    """
+    assessment = Assessment.objects.filter(pk=assessment_id).first()
+    if assessment is None:
+        return None
+
+    try:
+        _, gaps, recommendations = evaluate_assessment(assessment)
+        categories = build_detailed_breakdown(assessment)
+    except Exception:
+        logger.exception("Enrichment failed for assessment %s", assessment_id)
+        Assessment.objects.filter(pk=assessment_id).update(enrichment_status=FAILED)
+        return FAILED
+
+    Assessment.objects.filter(pk=assessment_id).update(
+        gap_analysis=gaps,
+        recommendations=recommendations,
+        category_breakdown=categories,
+        breakdown_version=BREAKDOWN_VERSION,
+        enrichment_status=DONE,
+        enriched_at=timezone.now(),
+    )
+    return DONE
+
+
+def _run_in_worker(assessment_id):
+    try:
+        enrich_assessment(assessment_id)
+    finally:
+        close_old_connections()
+
+
+def schedule_enrichment(assessment_id):
+    """Enrich ``assessment_id`` after the current transaction commits."""
+    if settings.ASSESSMENT_ENRICHMENT_ASYNC:
+        transaction.on_commit(lambda: get_executor().submit(_run_in_worker, assessment_id))
+    else:
+        transaction.on_commit(lambda: enrich_assessment(assessment_id))
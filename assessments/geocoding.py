@@ -0,0 +1,164 @@
+"""
+Geoapify autocomplete client with a bounded LRU/TTL response cache.
+
+Identical in-flight lookups are coalesced: the first caller fetches from
+Geoapify and concurrent callers for the same normalized query wait for that
+result instead of issuing their own request.
+"""
+import threading
+import time
+from collections import Counter, OrderedDict
+
+import requests
+from django.conf import settings
+
+from .localities import normalize
+
+STATE_MAP = {
+    "New South Wales": "NSW",
+    "Victoria": "VIC",
+    "Queensland": "QLD",
+    "South Australia": "SA",
+    "Western Australia": "WA",
+    "Tasmania": "TAS",
+    "Northern Territory": "NT",
+    "Australian Capital Territory": "ACT",
+}
+
+
+def geoapify_autocomplete(query):
+    """Return results for ``query``, or None if Geoapify couldn't be reached."""
+    url = "https://api.geoapify.com/v1/geocode/autocomplete"
+    params = {
+        "text": query,
+        "limit": 8,
+        "format": "json",
+        "filter": "countrycode:au",
+        "apiKey": settings.GEOAPIFY_API_KEY
+    }
+
+    try:
+        response = requests.get(url, params=params, timeout=5)
+        response.raise_for_status()
+        data = response.json()
+    except Exception:
+        return None
+
+    results = []
+    for item in data.get("results", []):
+        postcode = item.get("postcode")
+        city = item.get("city") or ""
+        state = item.get("state") or ""
+        suburb = item.get("suburb") or item.get("district") or item.get("neighbourhood") or ""
+        lat = item.get("lat")
+        lon = item.get("lon")
+        state_short = STATE_MAP.get(state, state)
+        location_name = suburb if suburb else city
+        if not location_name:
+            continue
+        label = f"{location_name} {state_short} {postcode or ''}".strip()
+        results.append({
+            "label": label,
+            "postcode": postcode,
+            "city": city,
+            "state": state_short,
+            "suburb": suburb,
+            "lat": lat,
+            "lon": lon
+        })
+
+    return results
+
+
+class _InFlight:
+    __slots__ = ("done", "result")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+
+class AutocompleteCache:
+    """
+    Thread-safe LRU cache with separate TTLs for hits and empty results.
+    Fetch failures (None) are returned to waiters but never cached.
+    """
+
+    def __init__(self, max_entries, ttl, negative_ttl, wait_timeout=6):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.wait_timeout = wait_timeout
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._stats = Counter()
+
+    def get_or_fetch(self, key, fetch):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    if not value:
+                        self._stats["negative_hits"] += 1
+                    return value
+                del self._entries[key]
+                self._stats["expired"] += 1
+
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _InFlight()
+                self._stats["misses"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            call.done.wait(self.wait_timeout)
+            return call.result
+
+        result = None
+        try:
+            result = fetch()
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+                if result is None:
+                    self._stats["upstream_errors"] += 1
+                else:
+                    ttl = self.ttl if result else self.negative_ttl
+                    self._entries[key] = (time.monotonic() + ttl, result)
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+                        self._stats["evictions"] += 1
+            call.result = result
+            call.done.set()
+
+        return result
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["in_flight"] = len(self._inflight)
+        lookups = stats.get("hits", 0) + stats.get("misses", 0) + stats.get("coalesced", 0)
+        stats["hit_ratio"] = round(stats.get("hits", 0) / lookups, 4) if lookups else 0.0
+        return stats
+
+
+autocomplete_cache = AutocompleteCache(
+    max_entries=settings.GEOAPIFY_CACHE_MAX_ENTRIES,
+    ttl=settings.GEOAPIFY_CACHE_TTL,
+    negative_ttl=settings.GEOAPIFY_NEGATIVE_CACHE_TTL,
+)
+
+
+def cached_geoapify_autocomplete(query):
+    key = normalize(query)
+    if not key:
+        return []
+    return autocomplete_cache.get_or_fetch(key, lambda: geoapify_autocomplete(query)) or []
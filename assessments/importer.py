@@ -0,0 +1,156 @@
+"""
+Streaming bulk import of assessment profiles from CSV or JSONL.
+
+Records are read one at a time from the open file, validated with the
+submit schema, scored a chunk at a time through ``vectorized.score_rows`` and
+inserted with ``bulk_create``; memory use is bounded by the chunk size, not
+the file. Each chunk commits on its own together with its aggregate deltas,
+so an interrupted import can resume from the last committed row.
+
+Imported rows are left for ``manage.py enrich_assessments`` to fill in gap
+analysis and recommendations.
+"""
+import csv
+import io
+import json
+import re
+import time
+from collections import Counter, defaultdict
+
+from django.db import transaction
+
+from dashboard.cache import readiness_cache
+
+from .aggregates import add_cohort_change, add_score_change, apply_cohort_deltas, apply_deltas, cohort_key
+from .models import Assessment
+from .schema import assessment_schema, content_hash
+from .vectorized import FEATURE_FIELDS, score_rows
+
+CSV = "csv"
+JSONL = "jsonl"
+FORMATS = (CSV, JSONL)
+
+# CSV cells hold documents as "passport;medicare" (or comma / pipe separated).
+_DOCUMENT_SEPARATORS = re.compile(r"[;,|]")
+
+
+def detect_format(filename):
+    return JSONL if filename.lower().endswith((".jsonl", ".ndjson")) else CSV
+
+
+def iter_records(stream, fmt):
+    """
+    Yield ``(row_number, record, parse_error)`` from a binary stream;
+    ``record`` is None when the line could not be parsed.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    if fmt == CSV:
+        for number, record in enumerate(csv.DictReader(text), start=1):
+            documents = record.get("documents")
+            if isinstance(documents, str):
+                record["documents"] = [d.strip() for d in _DOCUMENT_SEPARATORS.split(documents) if d.strip()]
+            yield number, record, None
+        return
+
+    number = 0
+    for line in text:
+        if not line.strip():
+            continue
+        number += 1
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield number, None, f"Invalid JSON: {exc}"
+            continue
+        if not isinstance(record, dict):
+            yield number, None, "Expected a JSON object."
+            continue
+        yield number, record, None
+
+
+def import_records(records, session_key, owner=None, batch_size=1000, start_row=0,
+                   on_error=None, on_commit=None):
+    """
+    Validate, score and insert ``records`` (see ``iter_records``).
+
+    Rows numbered up to ``start_row`` are read but not processed (resume).
+    ``on_error(row_number, record, errors)`` receives each rejected row and
+    ``on_commit(rows_done, stats)`` runs after every committed chunk.
+    Returns a stats Counter (read, imported, rejected, skipped).
+    """
+    stats = Counter()
+    started = time.perf_counter()
+    chunk = []
+    last_row = start_row
+
+    def flush():
+        imported = _insert_chunk(chunk, session_key, owner, batch_size)
+        stats["imported"] += imported
+        chunk.clear()
+        if on_commit:
+            on_commit(last_row, stats)
+
+    for number, record, parse_error in records:
+        if number <= start_row:
+            stats["skipped"] += 1
+            continue
+        stats["read"] += 1
+        last_row = number
+
+        if parse_error:
+            errors = {"__all__": [parse_error]}
+        else:
+            clean, errors = assessment_schema.validate(record)
+        if errors:
+            stats["rejected"] += 1
+            if on_error:
+                on_error(number, record, errors)
+            continue
+
+        chunk.append(clean)
+        if len(chunk) >= batch_size:
+            flush()
+
+    if chunk or stats["read"]:
+        flush()
+
+    stats["elapsed_ms"] = round((time.perf_counter() - started) * 1000)
+    return stats
+
+
+def _insert_chunk(chunk, session_key, owner, batch_size):
+    if not chunk:
+        return 0
+
+    assessments = []
+    for clean in chunk:
+        assessment = Assessment(session_key=session_key, user=owner, content_hash=content_hash(clean), **clean)
+        # bulk_create skips save(), which normally fills these in.
+        assessment.set_derived_fields()
+        assessments.append(assessment)
+
+    batch = score_rows(
+        [{name: getattr(a, name) for name in FEATURE_FIELDS} for a in assessments],
+        messages=True,
+    )
+    for i, a in enumerate(assessments):
+        a.readiness_score = int(batch.score[i])
+        a.risk_level = str(batch.risk_level[i])
+        a.strengths = batch.strengths[i]
+        a.weaknesses = batch.weaknesses[i]
+
+    with transaction.atomic():
+        Assessment.objects.bulk_create(assessments, batch_size=batch_size)
+
+        bucket_deltas = Counter()
+        cohort_deltas = defaultdict(Counter)
+        for a in assessments:
+            add_score_change(bucket_deltas, a.postcode, a.suburb, None, a.readiness_score)
+            key = cohort_key(a.created_at, a.employment_status, a.rental_history, a.postcode)
+            add_cohort_change(cohort_deltas, key, None, a.readiness_score)
+        apply_deltas(bucket_deltas)
+        apply_cohort_deltas(cohort_deltas)
+        if owner is not None:
+            # bulk_create sends no signals.
+            readiness_cache.bump_on_commit(owner.pk)
+    return len(assessments)
@@ -0,0 +1,281 @@
+"""
+Offline Australian suburb/postcode index for location autocomplete.
+
+The index is a flat binary file of fixed-width records sorted by normalized
+suburb name, followed by a (postcode, record) table sorted by postcode. It is
+memory-mapped read-only, so forked workers share the same page-cache pages,
+and lookups are a bisect over the mapped records.
+
+Build it with ``python manage.py build_locality_index --download``, which
+compiles the national GeoNames AU postal code list (every locality with a
+postcode, CC BY 4.0). The bundled CSV only seeds development and tests with
+major localities.
+"""
+import csv
+import io
+import logging
+import mmap
+import re
+import struct
+import threading
+import zipfile
+from bisect import bisect_left
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+BUNDLED_CSV = Path(__file__).resolve().parent / "data" / "au_localities.csv"
+
+GEONAMES_AU_URL = "https://download.geonames.org/export/zip/AU.zip"
+GEONAMES_STATE_CODES = {
+    "new south wales": "NSW",
+    "victoria": "VIC",
+    "queensland": "QLD",
+    "south australia": "SA",
+    "western australia": "WA",
+    "tasmania": "TAS",
+    "northern territory": "NT",
+    "australian capital territory": "ACT",
+}
+
+MAGIC = b"R2LLOC1\x00"
+HEADER = struct.Struct("<8sI")
+# key, suburb, city, state, postcode, lat, lon
+RECORD = struct.Struct("<40s40s32s3s4sff")
+POSTCODE_ENTRY = struct.Struct("<4sI")
+KEY_SIZE = 40
+
+STATES = {"nsw", "vic", "qld", "sa", "wa", "tas", "nt", "act"}
+
+# Upper bound on records walked for one query when state/postcode filters
+# reject candidates, so a broad prefix can't turn into a full scan.
+MAX_SCAN = 400
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(text):
+    return _NON_ALNUM.sub(" ", (text or "").lower()).strip()
+
+
+def _encode(text, size):
+    return (text or "").encode("utf-8")[:size]
+
+
+def _decode(raw):
+    return raw.rstrip(b"\x00").decode("utf-8", errors="ignore")
+
+
+def read_csv(path):
+    """Yield rows from a suburb,city,state,postcode,lat,lon CSV."""
+    with open(path, newline="", encoding="utf-8") as handle:
+        for row in csv.DictReader(handle):
+            if row.get("suburb") and row.get("postcode"):
+                yield row
+
+
+def read_geonames(path):
+    """
+    Yield locality rows from a GeoNames postal code dump (AU.zip or AU.txt):
+    tab-separated country, postcode, place name, state name, state code,
+    region, ..., lat, lon.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".zip":
+        with zipfile.ZipFile(path) as archive:
+            name = next(n for n in archive.namelist() if n.lower().endswith(".txt") and "readme" not in n.lower())
+            with archive.open(name) as raw:
+                yield from _geonames_rows(io.TextIOWrapper(raw, encoding="utf-8"))
+    else:
+        with open(path, encoding="utf-8") as handle:
+            yield from _geonames_rows(handle)
+
+
+def _geonames_rows(lines):
+    for line in lines:
+        fields = line.rstrip("\n").split("\t")
+        if len(fields) < 11 or fields[0] != "AU":
+            continue
+        state = GEONAMES_STATE_CODES.get(fields[3].strip().lower(), fields[4].strip().upper())
+        yield {
+            "suburb": fields[2],
+            "city": fields[5],
+            "state": state,
+            "postcode": fields[1],
+            "lat": fields[9],
+            "lon": fields[10],
+        }
+
+
+def build_index(rows):
+    """Serialize locality rows into the binary index format."""
+    records = []
+    seen = set()
+    for row in rows:
+        key = normalize(row["suburb"])
+        state = (row.get("state") or "").strip().upper()
+        postcode = (row.get("postcode") or "").strip().zfill(4)
+        if not key or (key, state, postcode) in seen:
+            continue
+        seen.add((key, state, postcode))
+        try:
+            lat = float(row.get("lat") or 0)
+            lon = float(row.get("lon") or 0)
+        except ValueError:
+            lat = lon = 0.0
+        records.append((
+            _encode(key, KEY_SIZE),
+            _encode(row["suburb"].strip(), 40),
+            _encode((row.get("city") or "").strip(), 32),
+            _encode(state, 3),
+            _encode(postcode, 4),
+            lat,
+            lon,
+        ))
+
+    records.sort(key=lambda r: (r[0], r[4]))
+    postcodes = sorted((r[4], i) for i, r in enumerate(records))
+
+    parts = [HEADER.pack(MAGIC, len(records))]
+    parts.extend(RECORD.pack(*r) for r in records)
+    parts.extend(POSTCODE_ENTRY.pack(*p) for p in postcodes)
+    return b"".join(parts)
+
+
+class _FieldView:
+    """Sequence over one fixed-width field of a packed table, for bisect."""
+
+    def __init__(self, buffer, offset, stride, width, count):
+        self.buffer = buffer
+        self.offset = offset
+        self.stride = stride
+        self.width = width
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        start = self.offset + i * self.stride
+        return self.buffer[start:start + self.width]
+
+
+class LocalityIndex:
+
+    def __init__(self, buffer):
+        magic, count = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a locality index file.")
+        self.buffer = buffer
+        self.count = count
+        self.records_offset = HEADER.size
+        self.postcodes_offset = HEADER.size + count * RECORD.size
+        self.keys = _FieldView(buffer, self.records_offset, RECORD.size, KEY_SIZE, count)
+        self.postcodes = _FieldView(buffer, self.postcodes_offset, POSTCODE_ENTRY.size, 4, count)
+
+    @classmethod
+    def open(cls, path):
+        with open(path, "rb") as handle:
+            buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer)
+
+    def __len__(self):
+        return self.count
+
+    def record(self, i):
+        _, suburb, city, state, postcode, lat, lon = RECORD.unpack_from(
+            self.buffer, self.records_offset + i * RECORD.size
+        )
+        suburb = _decode(suburb)
+        state = _decode(state)
+        postcode = _decode(postcode)
+        return {
+            "label": f"{suburb} {state} {postcode}",
+            "postcode": postcode,
+            "city": _decode(city),
+            "state": state,
+            "suburb": suburb,
+            "lat": round(lat, 5),
+            "lon": round(lon, 5),
+        }
+
+    def _by_name(self, prefix):
+        prefix = _encode(prefix, KEY_SIZE)
+        i = bisect_left(self.keys, prefix)
+        while i < self.count and self.keys[i].startswith(prefix):
+            yield i
+            i += 1
+
+    def _by_postcode(self, prefix):
+        prefix = _encode(prefix, 4)
+        i = bisect_left(self.postcodes, prefix)
+        while i < self.count and self.postcodes[i].startswith(prefix):
+            _, record = POSTCODE_ENTRY.unpack_from(
+                self.buffer, self.postcodes_offset + i * POSTCODE_ENTRY.size
+            )
+            yield record
+            i += 1
+
+    def search(self, query, limit=8):
+        """
+        Prefix search: "syd", "2000", "surry hills nsw", "perth wa 6000".
+        A trailing state code and/or postcode narrow a name search.
+        """
+        tokens = normalize(query).split()
+        if not tokens:
+            return []
+
+        state = postcode = None
+        if all(token.isdigit() for token in tokens):
+            candidates = self._by_postcode("".join(tokens))
+        else:
+            while len(tokens) > 1:
+                if postcode is None and tokens[-1].isdigit():
+                    postcode = tokens.pop()
+                elif state is None and tokens[-1] in STATES:
+                    state = tokens.pop().upper()
+                else:
+                    break
+            candidates = self._by_name(" ".join(tokens))
+
+        results = []
+        for scanned, i in enumerate(candidates):
+            if scanned >= MAX_SCAN or len(results) >= limit:
+                break
+            item = self.record(i)
+            if state and item["state"] != state:
+                continue
+            if postcode and not item["postcode"].startswith(postcode):
+                continue
+            results.append(item)
+        return results
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def _load_index():
+    path = Path(settings.AU_LOCALITIES_INDEX_PATH)
+    if path.exists():
+        return LocalityIndex.open(path)
+
+    logger.warning(
+        "Locality index %s not found; building it in memory from %s. "
+        "Run `manage.py build_locality_index --download` for national coverage "
+        "shared by all workers.",
+        path, BUNDLED_CSV,
+    )
+    return LocalityIndex(build_index(read_csv(BUNDLED_CSV)))
+
+
+def get_locality_index():
+    """Process-wide index, loaded on first use (or pre-fork with --preload)."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = _load_index()
+    return _index
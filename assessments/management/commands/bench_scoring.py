@@ -0,0 +1,80 @@
+import random
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+
+from assessments.models import (
+    Assessment,
+    EMPLOYMENT_CHOICES,
+    RENTAL_HISTORY_CHOICES,
+    PROOF_OF_INCOME_CHOICES,
+    DOCUMENTS_CHOICES,
+)
+from assessments.scoring import score_assessment
+from assessments.scoring_cache import evaluate_assessment, scoring_cache
+
+
+def build_profiles(count, seed=0):
+    """Unsaved assessments shaped like real form submissions."""
+    rng = random.Random(seed)
+    suburbs = ["Sydney CBD", "Docklands", "Fortitude Valley", "Parramatta", "Fremantle", ""]
+    documents = [key for key, _ in DOCUMENTS_CHOICES]
+
+    profiles = []
+    for _ in range(count):
+        profiles.append(Assessment(
+            suburb=rng.choice(suburbs),
+            monthly_rent_budget=Decimal(rng.randrange(1200, 4500, 50)),
+            employment_status=rng.choice(EMPLOYMENT_CHOICES)[0],
+            time_in_role=rng.choice(["6 months", "2 years", "18 months", "3 weeks", ""]),
+            rental_history=rng.choice(RENTAL_HISTORY_CHOICES)[0],
+            household_income=Decimal(rng.randrange(30000, 180000, 1000)),
+            household_income_period="annual",
+            documents=rng.sample(documents, rng.randint(0, len(documents))),
+            proof_of_income=rng.choice(PROOF_OF_INCOME_CHOICES)[0],
+            moving_with_adults=rng.randint(1, 3),
+            moving_with_children=rng.randint(0, 3),
+            moving_with_pets=rng.randint(0, 3),
+            context_issues=rng.choice(["", "", "", "Previous arrears"]),
+        ))
+    return profiles
+
+
+class Command(BaseCommand):
+    help = "Microbenchmark the assessment scoring engine (per-call cost)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--profiles", type=int, default=1000)
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--memoized",
+            action="store_true",
+            help="Time evaluate_assessment (score + gap analysis via the signature cache).",
+        )
+
+    def handle(self, *args, **options):
+        profiles = build_profiles(options["profiles"], options["seed"])
+        iterations = options["iterations"]
+        score = evaluate_assessment if options["memoized"] else score_assessment
+
+        # Warm up so the first timed pass isn't paying for imports/caches.
+        for profile in profiles:
+            score(profile)
+
+        best = None
+        for _ in range(iterations):
+            start = time.perf_counter()
+            for profile in profiles:
+                score(profile)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        per_call_us = best / len(profiles) * 1_000_000
+        self.stdout.write(
+            f"{len(profiles)} profiles x {iterations} passes: "
+            f"best {per_call_us:.2f} µs/call ({1_000_000 / per_call_us:,.0f} calls/s)"
+        )
+        if options["memoized"]:
+            self.stdout.write(f"scoring cache: {scoring_cache.stats()}")
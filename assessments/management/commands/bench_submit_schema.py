@@ -0,0 +1,145 @@
+import random
+import re
+import time
+from decimal import Decimal, InvalidOperation
+
+from django.core.management.base import BaseCommand
+
+from assessments.models import (
+    Assessment,
+    EMPLOYMENT_CHOICES,
+    RENTAL_HISTORY_CHOICES,
+    PROOF_OF_INCOME_CHOICES,
+    DOCUMENTS_CHOICES,
+)
+from assessments.schema import assessment_schema
+
+
+def build_payloads(count, seed=0):
+    """JSON bodies as assessment.js posts them: strings, except counts and documents."""
+    rng = random.Random(seed)
+    suburbs = [
+        ("Sydney CBD", "Sydney", "2000", "-33.8688", "151.2093"),
+        ("Docklands", "Melbourne", "3008", "-37.8149", "144.9460"),
+        ("Fortitude Valley", "Brisbane", "4006", "-27.4570", "153.0340"),
+        ("", "", "", "", ""),
+    ]
+    documents = [key for key, _ in DOCUMENTS_CHOICES]
+
+    payloads = []
+    for _ in range(count):
+        suburb, city, postcode, lat, lon = rng.choice(suburbs)
+        payload = {
+            "full_name": rng.choice(["Alex Nguyen", "Sam Taylor", "Jordan Lee"]),
+            "postcode": postcode,
+            "suburb": suburb,
+            "city": city,
+            "lat": lat,
+            "lon": lon,
+            "employment_status": rng.choice(EMPLOYMENT_CHOICES)[0],
+            "time_in_role": rng.choice(["6 months", "2 years", "18 months", ""]),
+            "rental_history": rng.choice(RENTAL_HISTORY_CHOICES)[0],
+            "household_income_period": rng.choice(["annual", "monthly", "weekly"]),
+            "individual_income_period": "annual",
+            "documents": rng.sample(documents, rng.randint(0, len(documents))),
+            "proof_of_income": rng.choice(PROOF_OF_INCOME_CHOICES)[0],
+            "moving_with_adults": rng.randint(1, 3),
+            "moving_with_children": rng.randint(0, 3),
+            "moving_with_pets": rng.randint(0, 2),
+            "context_issues": rng.choice(["", "", "", "Previous arrears"]),
+        }
+        # The form drops empty money fields before posting.
+        if rng.random() < 0.9:
+            payload["monthly_rent_budget"] = str(rng.randrange(1200, 4500, 50))
+        if rng.random() < 0.9:
+            payload["household_income"] = f"{rng.randrange(30000, 180000, 1000)}.00"
+        if rng.random() < 0.5:
+            payload["individual_income"] = str(rng.randrange(20000, 120000, 1000))
+        payloads.append(payload)
+    return payloads
+
+
+def legacy_sanitize(data):
+    """The per-request loop AssessmentSubmitView used before the schema."""
+    allowed_fields = {field.name for field in Assessment._meta.fields}
+    clean_data = {k: v for k, v in data.items() if k in allowed_fields}
+
+    decimal_fields = ["monthly_rent_budget", "household_income", "individual_income"]
+    float_fields = ["lat", "lon"]
+    int_fields = ["moving_with_adults", "moving_with_children", "moving_with_pets"]
+
+    for field in decimal_fields:
+        value = clean_data.get(field)
+        if value in [None, "", "null"]:
+            clean_data[field] = None
+            continue
+        try:
+            cleaned = str(value).strip()
+            if not re.match(r"^\d+(\.\d{1,2})?$", cleaned):
+                clean_data[field] = None
+                continue
+            clean_data[field] = Decimal(cleaned)
+        except (InvalidOperation, ValueError, TypeError):
+            clean_data[field] = None
+
+    for field in float_fields:
+        value = clean_data.get(field)
+        try:
+            if value not in [None, "", "null"]:
+                clean_data[field] = float(str(value).strip())
+            else:
+                clean_data[field] = None
+        except (ValueError, TypeError):
+            clean_data[field] = None
+
+    for field in int_fields:
+        value = clean_data.get(field)
+        try:
+            if value not in [None, "", "null"]:
+                clean_data[field] = int(str(value).strip())
+            else:
+                clean_data[field] = 0
+        except (ValueError, TypeError):
+            clean_data[field] = 0
+
+    return clean_data
+
+
+class Command(BaseCommand):
+    help = "Benchmark the compiled assessment schema against the old sanitize loop."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--payloads", type=int, default=1000)
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def _best_us(self, func, payloads, iterations):
+        for payload in payloads:
+            func(payload)
+
+        best = None
+        for _ in range(iterations):
+            start = time.perf_counter()
+            for payload in payloads:
+                func(payload)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best / len(payloads) * 1_000_000
+
+    def handle(self, *args, **options):
+        payloads = build_payloads(options["payloads"], options["seed"])
+        iterations = options["iterations"]
+
+        invalid = sum(1 for p in payloads if assessment_schema.validate(p)[1])
+        if invalid:
+            self.stderr.write(f"{invalid} generated payloads failed validation")
+
+        legacy_us = self._best_us(legacy_sanitize, payloads, iterations)
+        schema_us = self._best_us(assessment_schema.validate, payloads, iterations)
+
+        self.stdout.write(f"{len(payloads)} payloads x {iterations} passes (best pass):")
+        self.stdout.write(f"  legacy loop: {legacy_us:.2f} µs/request")
+        self.stdout.write(f"  schema:      {schema_us:.2f} µs/request  ({legacy_us / schema_us:.1f}x)")
+        self.stdout.write(
+            "  The schema also validates choices and document keys, which the legacy loop skipped."
+        )
@@ -0,0 +1,73 @@
+import os
+import tempfile
+from pathlib import Path
+
+import requests
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from assessments.localities import (
+    BUNDLED_CSV,
+    GEONAMES_AU_URL,
+    LocalityIndex,
+    build_index,
+    read_csv,
+    read_geonames,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile localities into the memory-mapped index. --download builds the "
+        "national list from the GeoNames AU postal code dump; --source takes a "
+        "suburb,city,state,postcode,lat,lon CSV or a GeoNames AU.zip / AU.txt."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--source", help="Default: the bundled seed CSV of major localities.")
+        parser.add_argument(
+            "--download",
+            action="store_true",
+            help=f"Fetch {GEONAMES_AU_URL} and build from it.",
+        )
+        parser.add_argument("--output", default=str(settings.AU_LOCALITIES_INDEX_PATH))
+
+    def handle(self, *args, **options):
+        output = Path(options["output"])
+        output.parent.mkdir(parents=True, exist_ok=True)
+
+        if options["download"]:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                source = Path(tmpdir) / "AU.zip"
+                self.stdout.write(f"Downloading {GEONAMES_AU_URL}")
+                try:
+                    response = requests.get(GEONAMES_AU_URL, timeout=60)
+                    response.raise_for_status()
+                except requests.RequestException as exc:
+                    raise CommandError(f"Download failed: {exc}")
+                source.write_bytes(response.content)
+                data = build_index(read_geonames(source))
+        else:
+            source = Path(options["source"] or BUNDLED_CSV)
+            if not source.exists():
+                raise CommandError(f"{source} does not exist.")
+            if source.suffix.lower() in (".zip", ".txt"):
+                data = build_index(read_geonames(source))
+            else:
+                if source == BUNDLED_CSV:
+                    self.stdout.write(self.style.WARNING(
+                        "Building from the bundled seed CSV (major localities only); "
+                        "use --download for national coverage."
+                    ))
+                data = build_index(read_csv(source))
+
+        # Write beside the target and swap in atomically: running workers keep
+        # their mapping of the old file until they restart.
+        tmp = output.with_suffix(output.suffix + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, output)
+
+        index = LocalityIndex(data)
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {len(index)} localities to {output} ({len(data):,} bytes)"
+        ))
@@ -0,0 +1,47 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from assessments.enrichment import DONE, FAILED, PENDING, enrich_assessment
+from assessments.models import Assessment
+
+
+class Command(BaseCommand):
+    help = (
+        "Enrich assessments the background pool never finished "
+        "(e.g. the worker restarted before the job ran)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--stale-after",
+            type=int,
+            default=300,
+            help="Only pick up pending rows older than this many seconds.",
+        )
+        parser.add_argument("--retry-failed", action="store_true")
+        parser.add_argument("--limit", type=int, default=None)
+
+    def handle(self, *args, **options):
+        statuses = [PENDING, FAILED] if options["retry_failed"] else [PENDING]
+        cutoff = timezone.now() - timedelta(seconds=options["stale_after"])
+
+        ids = (
+            Assessment.objects
+            .filter(enrichment_status__in=statuses, created_at__lte=cutoff)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        if options["limit"]:
+            ids = ids[:options["limit"]]
+
+        done = failed = 0
+        for assessment_id in ids.iterator():
+            outcome = enrich_assessment(assessment_id)
+            if outcome == DONE:
+                done += 1
+            elif outcome == FAILED:
+                failed += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Enriched {done} assessments ({failed} failed)."))
@@ -0,0 +1,88 @@
+import json
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from assessments.importer import FORMATS, detect_format, import_records, iter_records
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream-import assessment profiles from a CSV or JSONL file: validate, "
+        "score in vectorized chunks and bulk insert. Rejected rows go to an "
+        "error file; --checkpoint makes an interrupted import resumable."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=FORMATS, help="Default: from the file extension.")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--user", help="Email of the account that will own the imported assessments.")
+        parser.add_argument("--session-key", help="Session key stored on imported rows. Default: import:<file name>.")
+        parser.add_argument("--errors", help="JSONL file for rejected rows. Default: <path>.errors.jsonl.")
+        parser.add_argument(
+            "--checkpoint",
+            help="JSON file recording the last committed row; resumes from it if present.",
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.exists():
+            raise CommandError(f"{path} does not exist.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+
+        owner = None
+        if options["user"]:
+            owner = get_user_model().objects.filter(email=options["user"]).first()
+            if owner is None:
+                raise CommandError(f"No user with email {options['user']}.")
+
+        checkpoint = Path(options["checkpoint"]) if options["checkpoint"] else None
+        start_row, errors_offset = 0, None
+        if checkpoint and checkpoint.exists():
+            state = json.loads(checkpoint.read_text())
+            start_row = state.get("rows_done", 0)
+            errors_offset = state.get("errors_offset")
+            self.stdout.write(f"Resuming after row {start_row}")
+
+        errors_path = Path(options["errors"] or f"{path}.errors.jsonl")
+        with path.open("rb") as stream, errors_path.open("a", encoding="utf-8") as errors_file:
+            if errors_offset is not None:
+                # Rows rejected after the last checkpoint are read again on
+                # resume; drop what was logged for them so they appear once.
+                errors_file.truncate(errors_offset)
+                errors_file.seek(errors_offset)
+
+            def on_error(row_number, record, errors):
+                errors_file.write(json.dumps({"row": row_number, "errors": errors, "record": record}, default=str) + "\n")
+
+            def on_commit(rows_done, stats):
+                if checkpoint:
+                    errors_file.flush()
+                    checkpoint.write_text(json.dumps({"rows_done": rows_done, "errors_offset": errors_file.tell()}))
+                self.stdout.write(f"  row {rows_done}: {stats['imported']} imported, {stats['rejected']} rejected")
+
+            stats = import_records(
+                iter_records(stream, options["format"] or detect_format(path.name)),
+                session_key=options["session_key"] or f"import:{path.name}"[:100],
+                owner=owner,
+                batch_size=options["batch_size"],
+                start_row=start_row,
+                on_error=on_error,
+                on_commit=on_commit,
+            )
+
+        if checkpoint and checkpoint.exists():
+            checkpoint.unlink()
+        if not stats["rejected"] and errors_path.exists() and not errors_path.stat().st_size:
+            errors_path.unlink()
+
+        seconds = stats["elapsed_ms"] / 1000
+        rate = stats["read"] / seconds if seconds else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {stats['imported']} of {stats['read']} rows ({stats['rejected']} rejected"
+            f"{f', errors in {errors_path}' if stats['rejected'] else ''}) "
+            f"in {seconds:.1f}s, {rate:,.0f} rows/s."
+        ))
@@ -0,0 +1,119 @@
+import gzip
+import json
+import time
+from collections import Counter, defaultdict
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from assessments.aggregates import (
+    add_cohort_change,
+    add_score_change,
+    apply_cohort_deltas,
+    apply_deltas,
+    cohort_key,
+)
+from assessments.models import Assessment
+from assessments.signals import bulk_aggregate_updates
+
+
+class Command(BaseCommand):
+    help = (
+        "Archive unclaimed anonymous assessments older than the retention "
+        "window to gzipped JSONL, then delete them in small transactions. "
+        "Expired sessions are cleared separately by clearsessions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=settings.ANONYMOUS_ASSESSMENT_RETENTION_DAYS,
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--archive-dir", default=settings.ASSESSMENT_ARCHIVE_DIR)
+        parser.add_argument(
+            "--no-archive",
+            action="store_true",
+            help="Delete without writing an archive file.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Count what would be purged without archiving or deleting.",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["older_than_days"])
+        # Served by the partial assessment_unclaimed_idx.
+        expired = Assessment.objects.filter(user__isnull=True, created_at__lt=cutoff)
+
+        if options["dry_run"]:
+            self.stdout.write(
+                f"{expired.count()} unclaimed assessments created before "
+                f"{cutoff:%Y-%m-%d} would be purged."
+            )
+            return
+
+        archive = None
+        if not options["no_archive"]:
+            archive_dir = Path(options["archive_dir"])
+            archive_dir.mkdir(parents=True, exist_ok=True)
+            archive_path = archive_dir / f"assessments-{timezone.now():%Y%m%dT%H%M%S}.jsonl.gz"
+            archive = gzip.open(archive_path, "wt", encoding="utf-8")
+
+        batch_size = options["batch_size"]
+        rows_deleted = row_bytes = 0
+        started = time.perf_counter()
+        try:
+            while True:
+                ids = list(expired.order_by("created_at").values_list("id", flat=True)[:batch_size])
+                if not ids:
+                    break
+                deleted, size = self.purge_batch(ids, archive)
+                rows_deleted += deleted
+                row_bytes += size
+        finally:
+            if archive:
+                archive.close()
+
+        elapsed = time.perf_counter() - started
+        message = f"Purged {rows_deleted} assessments (~{row_bytes / 1024:.0f} KiB of row data) in {elapsed:.1f}s."
+        if archive:
+            message += f" Archive: {archive_path} ({archive_path.stat().st_size / 1024:.0f} KiB)."
+        self.stdout.write(self.style.SUCCESS(message))
+
+    def purge_batch(self, ids, archive):
+        """Archive and delete one batch; rows claimed meanwhile are skipped."""
+        with transaction.atomic():
+            rows = list(
+                Assessment.objects
+                .select_for_update()
+                .filter(id__in=ids, user__isnull=True)
+                .values()
+            )
+            size = 0
+            bucket_deltas = Counter()
+            cohort_deltas = defaultdict(Counter)
+            for row in rows:
+                line = json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+                size += len(line.encode())
+                if archive:
+                    archive.write(line)
+                if row["readiness_score"] is not None:
+                    add_score_change(bucket_deltas, row["postcode"], row["suburb"], row["readiness_score"], None)
+                    key = cohort_key(row["created_at"], row["employment_status"], row["rental_history"], row["postcode"])
+                    add_cohort_change(cohort_deltas, key, row["readiness_score"], None)
+            if archive:
+                archive.flush()
+
+            with bulk_aggregate_updates():
+                Assessment.objects.filter(id__in=[row["id"] for row in rows]).delete()
+            apply_deltas(bucket_deltas)
+            apply_cohort_deltas(cohort_deltas)
+        return len(rows), size
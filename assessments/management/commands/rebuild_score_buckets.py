@@ -0,0 +1,67 @@
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from assessments.aggregates import GLOBAL, add_score_change
+from assessments.models import Assessment, ScoreBucket
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the readiness-score histograms from the assessments table, "
+        "replacing the incrementally maintained counts (drift correction)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report how many bins differ without writing anything.",
+        )
+
+    def handle(self, *args, **options):
+        grouped = (
+            Assessment.objects
+            .filter(readiness_score__isnull=False)
+            .values("postcode", "suburb", "readiness_score")
+            .annotate(total=Count("id"))
+            .order_by()
+        )
+
+        counts = Counter()
+        for row in grouped.iterator():
+            deltas = Counter()
+            add_score_change(deltas, row["postcode"], row["suburb"], None, row["readiness_score"])
+            for bucket in deltas:
+                counts[bucket] += row["total"]
+
+        with transaction.atomic():
+            current = {
+                (scope, key, score): count
+                for scope, key, score, count in (
+                    ScoreBucket.objects.select_for_update()
+                    .values_list("scope", "key", "score", "count")
+                )
+            }
+            drifted = sum(
+                1 for bucket in set(current) | set(counts)
+                if current.get(bucket, 0) != counts.get(bucket, 0)
+            )
+
+            if not options["dry_run"]:
+                ScoreBucket.objects.all().delete()
+                ScoreBucket.objects.bulk_create(
+                    [
+                        ScoreBucket(scope=scope, key=key, score=score, count=count)
+                        for (scope, key, score), count in counts.items()
+                    ],
+                    batch_size=1000,
+                )
+
+        scored = sum(count for (scope, _, _), count in counts.items() if scope == GLOBAL)
+        verb = "would be corrected" if options["dry_run"] else "corrected"
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(counts)} bins from {scored} scored assessments; {drifted} bins {verb}."
+        ))
@@ -0,0 +1,104 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, DateField, F, Q, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from assessments.models import Assessment, CohortStat
+from assessments.scoring import LOW_RISK_THRESHOLD, MEDIUM_RISK_THRESHOLD
+
+TOTAL_FIELDS = (
+    "count", "score_total", "score_sq_total", "low_count", "medium_count", "high_count",
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute cohort_stats from the assessments table and correct any rows "
+        "that drifted from the incrementally maintained totals."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drifted cohorts without writing anything.",
+        )
+
+    def handle(self, *args, **options):
+        score = F("readiness_score")
+        grouped = (
+            Assessment.objects
+            .filter(readiness_score__isnull=False)
+            .annotate(cohort_month=TruncMonth("created_at", output_field=DateField()))
+            .values("cohort_month", "employment_status", "rental_history", "postcode")
+            .annotate(
+                count=Count("id"),
+                score_total=Sum(score),
+                score_sq_total=Sum(score * score),
+                low_count=Count("id", filter=Q(readiness_score__gte=LOW_RISK_THRESHOLD)),
+                medium_count=Count("id", filter=Q(
+                    readiness_score__gte=MEDIUM_RISK_THRESHOLD,
+                    readiness_score__lt=LOW_RISK_THRESHOLD,
+                )),
+                high_count=Count("id", filter=Q(readiness_score__lt=MEDIUM_RISK_THRESHOLD)),
+            )
+            .order_by()
+        )
+
+        # Postcodes are normalized here rather than in SQL so the keys match
+        # aggregates.cohort_key exactly (SQL TRIM only strips spaces).
+        expected = {}
+        for row in grouped.iterator():
+            key = (
+                row["cohort_month"],
+                row["employment_status"] or "",
+                row["rental_history"] or "",
+                (row["postcode"] or "").strip(),
+            )
+            totals = expected.setdefault(key, dict.fromkeys(TOTAL_FIELDS, 0))
+            for field in TOTAL_FIELDS:
+                totals[field] += row[field] or 0
+
+        now = timezone.now()
+        with transaction.atomic():
+            current = {
+                (c.month, c.employment_status, c.rental_history, c.postcode): c
+                for c in CohortStat.objects.select_for_update()
+            }
+
+            to_create, to_update = [], []
+            for key, totals in expected.items():
+                cohort = current.pop(key, None)
+                if cohort is None:
+                    month, employment_status, rental_history, postcode = key
+                    to_create.append(CohortStat(
+                        month=month,
+                        employment_status=employment_status,
+                        rental_history=rental_history,
+                        postcode=postcode,
+                        **totals
+                    ))
+                elif any(getattr(cohort, field) != totals[field] for field in TOTAL_FIELDS):
+                    for field in TOTAL_FIELDS:
+                        setattr(cohort, field, totals[field])
+                    cohort.updated_at = now
+                    to_update.append(cohort)
+            # Cohorts whose assessments were all deleted are left at zero by
+            # the incremental updates; prune them without counting them stale.
+            to_delete = [cohort.pk for cohort in current.values()]
+            stale = sum(
+                1 for cohort in current.values()
+                if any(getattr(cohort, field) for field in TOTAL_FIELDS)
+            )
+
+            if not options["dry_run"]:
+                CohortStat.objects.bulk_create(to_create, batch_size=1000)
+                CohortStat.objects.bulk_update(to_update, [*TOTAL_FIELDS, "updated_at"], batch_size=500)
+                CohortStat.objects.filter(pk__in=to_delete).delete()
+
+        verb = "would be" if options["dry_run"] else "were"
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(expected)} cohorts: {len(to_create)} missing, {len(to_update)} drifted, "
+            f"{stale} stale {verb} corrected."
+        ))
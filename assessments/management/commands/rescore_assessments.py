@@ -0,0 +1,183 @@
+import json
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from action_plan.models import CompletedTask
+from assessments.aggregates import (
+    add_cohort_change,
+    add_score_change,
+    apply_cohort_deltas,
+    apply_deltas,
+    cohort_key,
+)
+from assessments.models import Assessment
+from assessments.vectorized import FEATURE_FIELDS, score_rows
+from dashboard.cache import readiness_cache
+
+
+RESULT_FIELDS = ["readiness_score", "risk_level", "strengths", "weaknesses"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-score every stored Assessment with the current scoring rules. "
+        "Streams keyset-paginated chunks, scores each chunk in one vectorized "
+        "pass and writes changes back with bulk_update."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=2000)
+        parser.add_argument(
+            "--checkpoint",
+            help="JSON file recording the last processed id; resumes from it if present.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Score and report differences without writing anything.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        dry_run = options["dry_run"]
+        checkpoint = Path(options["checkpoint"]) if options["checkpoint"] else None
+
+        last_id = 0
+        if checkpoint and checkpoint.exists():
+            last_id = json.loads(checkpoint.read_text()).get("last_id", 0)
+            self.stdout.write(f"Resuming after id {last_id}")
+
+        stats = Counter()
+        risk_moves = Counter()
+        started = time.perf_counter()
+
+        queryset = Assessment.objects.order_by("id").values(
+            "id", "user_id", "postcode", "created_at", *FEATURE_FIELDS, *RESULT_FIELDS
+        )
+
+        while True:
+            rows = list(
+                queryset.filter(id__gt=last_id)[:chunk_size].iterator(chunk_size=chunk_size)
+            )
+            if not rows:
+                break
+
+            bucket_deltas = Counter()
+            cohort_deltas = defaultdict(Counter)
+            changed = self.score_chunk(rows, stats, risk_moves, bucket_deltas, cohort_deltas)
+
+            if not dry_run and changed:
+                with transaction.atomic():
+                    Assessment.objects.bulk_update(changed, [*RESULT_FIELDS, "updated_at"], batch_size=500)
+                    apply_deltas(bucket_deltas)
+                    apply_cohort_deltas(cohort_deltas)
+                    # bulk_update sends no signals; drop cached readiness responses.
+                    for user_id in {a.user_id for a in changed}:
+                        readiness_cache.bump_on_commit(user_id)
+
+            last_id = rows[-1]["id"]
+            if checkpoint and not dry_run:
+                checkpoint.write_text(json.dumps({"last_id": last_id}))
+
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"  up to id {last_id}: {stats['scanned']} scanned, "
+                f"{stats['changed']} changed, {stats['scanned'] / elapsed:,.0f} rows/s"
+            )
+
+        elapsed = time.perf_counter() - started
+        self.report(stats, risk_moves, elapsed, dry_run)
+
+        if checkpoint and not dry_run and checkpoint.exists():
+            checkpoint.unlink()
+
+    def score_chunk(self, rows, stats, risk_moves, bucket_deltas, cohort_deltas):
+        """
+        Score one chunk and return unsaved Assessments for rows that changed.
+        Score histogram and cohort changes are accumulated into
+        ``bucket_deltas`` and ``cohort_deltas``.
+        """
+        batch = score_rows(rows, messages=True)
+
+        # Points earned through the action plan sit on top of the base score,
+        # so add them back rather than wiping users' progress.
+        task_points = dict(
+            CompletedTask.objects
+            .filter(assessment_id__in=[row["id"] for row in rows])
+            .values("assessment_id")
+            .annotate(total=Sum("points_earned"))
+            .values_list("assessment_id", "total")
+        )
+
+        changed = []
+        now = timezone.now()
+        for i, row in enumerate(rows):
+            stats["scanned"] += 1
+
+            score = min(int(batch.score[i]) + task_points.get(row["id"], 0), 100)
+            risk_level = str(batch.risk_level[i])
+            strengths = batch.strengths[i]
+            weaknesses = batch.weaknesses[i]
+
+            old_score = row["readiness_score"]
+            if (
+                score == old_score
+                and risk_level == row["risk_level"]
+                and strengths == row["strengths"]
+                and weaknesses == row["weaknesses"]
+            ):
+                continue
+
+            stats["changed"] += 1
+            if score != old_score:
+                add_score_change(bucket_deltas, row["postcode"], row["suburb"], old_score, score)
+                key = cohort_key(
+                    row["created_at"], row["employment_status"], row["rental_history"], row["postcode"]
+                )
+                add_cohort_change(cohort_deltas, key, old_score, score)
+                stats["score_changed"] += 1
+                delta = abs(score - (old_score or 0))
+                stats["abs_delta"] += delta
+                stats["max_delta"] = max(stats["max_delta"], delta)
+            if risk_level != row["risk_level"]:
+                risk_moves[(row["risk_level"] or "-", risk_level)] += 1
+            if strengths != row["strengths"] or weaknesses != row["weaknesses"]:
+                stats["messages_changed"] += 1
+
+            changed.append(Assessment(
+                id=row["id"],
+                user_id=row["user_id"],
+                updated_at=now,
+                readiness_score=score,
+                risk_level=risk_level,
+                strengths=strengths,
+                weaknesses=weaknesses,
+            ))
+
+        return changed
+
+    def report(self, stats, risk_moves, elapsed, dry_run):
+        scanned = stats["scanned"]
+        rate = scanned / elapsed if elapsed else 0
+        verb = "would change" if dry_run else "updated"
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{scanned} assessments scanned in {elapsed:.1f}s ({rate:,.0f} rows/s); "
+            f"{verb} {stats['changed']}"
+        ))
+        if stats["score_changed"]:
+            self.stdout.write(
+                f"  scores changed: {stats['score_changed']} "
+                f"(mean |delta| {stats['abs_delta'] / stats['score_changed']:.1f}, "
+                f"max {stats['max_delta']})"
+            )
+        if stats["messages_changed"]:
+            self.stdout.write(f"  strengths/weaknesses changed: {stats['messages_changed']}")
+        for (old, new), count in sorted(risk_moves.items()):
+            self.stdout.write(f"  risk {old} -> {new}: {count}")
@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessments', '0002_initial'),
+    ]
+
+    operations = [
+        # Existing rows were enriched inline on submit.
+        migrations.AddField(
+            model_name='assessment',
+            name='enrichment_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('done', 'Done'), ('failed', 'Failed')], db_index=True, default='done', max_length=10),
+        ),
+        migrations.AlterField(
+            model_name='assessment',
+            name='enrichment_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('done', 'Done'), ('failed', 'Failed')], db_index=True, default='pending', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='assessment',
+            name='enriched_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessments', '0003_assessment_enrichment_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assessment',
+            name='category_breakdown',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='assessment',
+            name='breakdown_version',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0.2 on 2026-10-18 06:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessments', '0004_assessment_category_breakdown'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScoreBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(choices=[('global', 'Global'), ('postcode', 'Postcode'), ('suburb', 'Suburb')], max_length=10)),
+                ('key', models.CharField(blank=True, max_length=255)),
+                ('score', models.PositiveSmallIntegerField()),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('scope', 'key', 'score'), name='unique_score_bucket')],
+            },
+        ),
+    ]
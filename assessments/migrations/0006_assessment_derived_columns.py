@@ -0,0 +1,98 @@
+# Generated by Django 6.0.2 on 2026-10-18 07:02
+
+from django.db import migrations, models
+
+DERIVED_FIELDS = ["annual_income", "months_in_role", "rent_to_income_ratio", "document_count"]
+
+# Frozen copy of assessments.scoring.derived_columns as of this migration, so
+# later scoring changes don't alter what the backfill does.
+INCOME_PERIOD_MULTIPLIERS = {"monthly": 12, "weekly": 52}
+MAX_MONTHS_IN_ROLE = 2147483647
+
+
+def parse_time_in_role(time_in_role):
+    parts = (time_in_role or "").split()
+    try:
+        number = int(parts[0])
+    except (ValueError, IndexError):
+        return None
+
+    unit = parts[1].lower() if len(parts) > 1 else "months"
+    if "year" in unit:
+        return number * 12
+    if "week" in unit:
+        return max(1, number // 4)
+    return number
+
+
+def derived_columns(assessment):
+    annual_income = None
+    if assessment.household_income is not None:
+        multiplier = INCOME_PERIOD_MULTIPLIERS.get(assessment.household_income_period, 1)
+        annual_income = assessment.household_income * multiplier
+
+    rent_to_income_ratio = None
+    budget = float(assessment.monthly_rent_budget or 0)
+    if annual_income and budget > 0:
+        rent_to_income_ratio = round(budget / (float(annual_income) / 12), 4)
+
+    months_in_role = parse_time_in_role(assessment.time_in_role)
+    if months_in_role is not None and not 0 <= months_in_role <= MAX_MONTHS_IN_ROLE:
+        months_in_role = None
+
+    documents = assessment.documents
+    return {
+        "annual_income": annual_income,
+        "months_in_role": months_in_role,
+        "rent_to_income_ratio": rent_to_income_ratio,
+        "document_count": len(documents) if isinstance(documents, list) else 0,
+    }
+
+
+def backfill_derived_columns(apps, schema_editor):
+    Assessment = apps.get_model("assessments", "Assessment")
+    queryset = Assessment.objects.order_by("id").only(
+        "id", "household_income", "household_income_period", "time_in_role",
+        "monthly_rent_budget", "documents",
+    )
+    last_id = 0
+    while True:
+        chunk = list(queryset.filter(id__gt=last_id)[:2000])
+        if not chunk:
+            break
+        for assessment in chunk:
+            for name, value in derived_columns(assessment).items():
+                setattr(assessment, name, value)
+        Assessment.objects.bulk_update(chunk, DERIVED_FIELDS, batch_size=500)
+        last_id = chunk[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessments', '0005_score_bucket'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assessment',
+            name='annual_income',
+            field=models.DecimalField(blank=True, db_index=True, decimal_places=2, max_digits=14, null=True),
+        ),
+        migrations.AddField(
+            model_name='assessment',
+            name='document_count',
+            field=models.PositiveSmallIntegerField(db_index=True, default=0),
+        ),
+        migrations.AddField(
+            model_name='assessment',
+            name='months_in_role',
+            field=models.PositiveIntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='assessment',
+            name='rent_to_income_ratio',
+            field=models.FloatField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(backfill_derived_columns, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 6.0.2 on 2026-10-18 07:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessments', '0006_assessment_derived_columns'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CohortStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('employment_status', models.CharField(blank=True, max_length=20)),
+                ('rental_history', models.CharField(blank=True, max_length=20)),
+                ('postcode', models.CharField(blank=True, max_length=20)),
+                ('count', models.IntegerField(default=0)),
+                ('score_total', models.BigIntegerField(default=0)),
+                ('score_sq_total', models.BigIntegerField(default=0)),
+                ('low_count', models.IntegerField(default=0)),
+                ('medium_count', models.IntegerField(default=0)),
+                ('high_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'cohort_stats',
+                'constraints': [models.UniqueConstraint(fields=('month', 'employment_status', 'rental_history', 'postcode'), name='unique_cohort')],
+            },
+        ),
+    ]
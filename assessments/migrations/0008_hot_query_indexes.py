@@ -0,0 +1,33 @@
+# Generated by Django 6.0.2 on 2026-10-18 07:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessments', '0007_cohort_stats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assessment',
+            index=models.Index(fields=['user', '-created_at'], name='assessment_user_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assessment',
+            index=models.Index(fields=['session_key', '-created_at'], name='assessment_session_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assessment',
+            index=models.Index(condition=models.Q(('enrichment_status__in', ['pending', 'failed'])), fields=['created_at'], name='assessment_enrich_backlog_idx'),
+        ),
+        # Covered by assessment_session_recent_idx; drop once that exists.
+        migrations.AlterField(
+            model_name='assessment',
+            name='session_key',
+            field=models.CharField(max_length=100),
+        ),
+    ]
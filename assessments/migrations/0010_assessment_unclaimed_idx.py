@@ -0,0 +1,19 @@
+# Generated by Django 6.0.2 on 2026-10-18 07:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessments', '0009_assessment_list_keyset_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assessment',
+            index=models.Index(condition=models.Q(('user__isnull', True)), fields=['created_at'], name='assessment_unclaimed_idx'),
+        ),
+    ]
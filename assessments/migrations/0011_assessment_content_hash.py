@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-18 07:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessments', '0010_assessment_unclaimed_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assessment',
+            name='content_hash',
+            field=models.CharField(blank=True, db_index=True, max_length=64),
+        ),
+    ]
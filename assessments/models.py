@@ -1,6 +1,9 @@
 from django.db import models
+from django.db.models import Q
 from django.conf import settings
 
+from .scoring import derived_columns
+
 EMPLOYMENT_CHOICES = [
     ('full_time', 'Full time'),
     ('part_time', 'Part time'),
@@ -30,6 +33,12 @@ DOCUMENTS_CHOICES = [
     ('tenant_ledger', 'Tenant ledger'),
 ]
 
+ENRICHMENT_STATUS_CHOICES = [
+    ('pending', 'Pending'),
+    ('done', 'Done'),
+    ('failed', 'Failed'),
+]
+
 
 class Assessment(models.Model):
     user = models.ForeignKey(
@@ -38,7 +47,7 @@ class Assessment(models.Model):
         on_delete=models.SET_NULL,
         related_name="assessments"
     )
-    session_key = models.CharField(max_length=100, db_index=True)
+    session_key = models.CharField(max_length=100)
 
     full_name = models.CharField(max_length=255, blank=True)
     postcode = models.CharField(max_length=20, blank=True, null=True)
@@ -78,16 +87,150 @@ class Assessment(models.Model):
 
     context_issues = models.TextField(blank=True)
 
+    # schema.content_hash of the submitted inputs; used to spot resubmissions.
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True)
+
+    # Computed from the inputs above on save (see derived_columns).
+    annual_income = models.DecimalField(max_digits=14, decimal_places=2, null=True, blank=True, db_index=True)
+    months_in_role = models.PositiveIntegerField(null=True, blank=True, db_index=True)
+    rent_to_income_ratio = models.FloatField(null=True, blank=True, db_index=True)
+    document_count = models.PositiveSmallIntegerField(default=0, db_index=True)
+
     readiness_score = models.IntegerField(null=True, blank=True)
     risk_level = models.CharField(max_length=20, blank=True)
     strengths = models.JSONField(default=list, blank=True)
     weaknesses = models.JSONField(default=list, blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
+    # Bumped by every save (including update_fields saves); the validator for
+    # conditional GETs on the dashboard and action-plan APIs.
+    updated_at = models.DateTimeField(auto_now=True)
 
     gap_analysis = models.JSONField(default=dict, blank=True)
     recommendations = models.JSONField(default=list, blank=True)
 
+    # Gap analysis and recommendations are filled in after submission.
+    enrichment_status = models.CharField(
+        max_length=10,
+        choices=ENRICHMENT_STATUS_CHOICES,
+        default='pending',
+        db_index=True
+    )
+    enriched_at = models.DateTimeField(null=True, blank=True)
+
+    # Snapshot of dashboard.services.build_detailed_breakdown; recomputed on
+    # read when breakdown_version is older than BREAKDOWN_VERSION.
+    category_breakdown = models.JSONField(default=list, blank=True)
+    breakdown_version = models.PositiveSmallIntegerField(null=True, blank=True)
+
+    DERIVED_FIELDS = ("annual_income", "months_in_role", "rent_to_income_ratio", "document_count")
+    DERIVED_FROM = frozenset({
+        "household_income", "household_income_period", "time_in_role",
+        "monthly_rent_budget", "documents",
+    })
+
+    class Meta:
+        indexes = [
+            # Dashboard / history: a user's assessments, newest first; -id
+            # keeps the keyset-paginated list (see pagination.py) sort-free.
+            models.Index(fields=["user", "-created_at", "-id"], name="assessment_user_recent_idx"),
+            # Claim + anonymous lookups by session, newest first.
+            models.Index(fields=["session_key", "-created_at"], name="assessment_session_recent_idx"),
+            # purge_anonymous_assessments: old rows nobody claimed.
+            models.Index(
+                fields=["created_at"],
+                condition=Q(user__isnull=True),
+                name="assessment_unclaimed_idx"
+            ),
+            # enrich_assessments sweep; only the (small) unfinished backlog.
+            models.Index(
+                fields=["created_at"],
+                condition=Q(enrichment_status__in=["pending", "failed"]),
+                name="assessment_enrich_backlog_idx"
+            ),
+        ]
+
+    def set_derived_fields(self):
+        for name, value in derived_columns(self).items():
+            setattr(self, name, value)
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            self.set_derived_fields()
+        elif update_fields:
+            update_fields = set(update_fields)
+            if self.DERIVED_FROM.intersection(update_fields):
+                self.set_derived_fields()
+                update_fields.update(self.DERIVED_FIELDS)
+            update_fields.add("updated_at")
+            kwargs["update_fields"] = update_fields
+        super().save(*args, **kwargs)
+
     def __str__(self):
         who = self.full_name or (self.user.email if self.user else "Anonymous")
-        return f"Assessment ({who}) - {self.session_key}"
\ No newline at end of file
+        return f"Assessment ({who}) - {self.session_key}"
+
+SCORE_BUCKET_SCOPES = [
+    ('global', 'Global'),
+    ('postcode', 'Postcode'),
+    ('suburb', 'Suburb'),
+]
+
+
+class ScoreBucket(models.Model):
+    """One bin of a readiness-score histogram; see assessments.aggregates."""
+    scope = models.CharField(max_length=10, choices=SCORE_BUCKET_SCOPES)
+    key = models.CharField(max_length=255, blank=True)
+    score = models.PositiveSmallIntegerField()
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["scope", "key", "score"],
+                name="unique_score_bucket"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.scope}:{self.key or '*'} [{self.score}] = {self.count}"
+
+
+class CohortStat(models.Model):
+    """
+    Running score totals for one (month, employment, rental history,
+    postcode) cohort; see assessments.aggregates.
+    """
+    month = models.DateField()
+    employment_status = models.CharField(max_length=20, blank=True)
+    rental_history = models.CharField(max_length=20, blank=True)
+    postcode = models.CharField(max_length=20, blank=True)
+
+    count = models.IntegerField(default=0)
+    score_total = models.BigIntegerField(default=0)
+    score_sq_total = models.BigIntegerField(default=0)
+    low_count = models.IntegerField(default=0)
+    medium_count = models.IntegerField(default=0)
+    high_count = models.IntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "cohort_stats"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["month", "employment_status", "rental_history", "postcode"],
+                name="unique_cohort"
+            )
+        ]
+
+    @property
+    def mean_score(self):
+        return self.score_total / self.count if self.count else None
+
+    def __str__(self):
+        return (
+            f"{self.month:%Y-%m} {self.employment_status or '-'}/"
+            f"{self.rental_history or '-'}/{self.postcode or '-'}: {self.count}"
+        )
@@ -0,0 +1,144 @@
+"""
+Median rent reference data shared by scoring and the dashboard.
+
+Loaded once per process into parallel arrays: suburb names are kept sorted
+for bisect lookups, and coordinates are bucketed into a fixed grid so an
+unknown suburb can fall back to the nearest known one by lat/lon. Both
+lookups stay O(log n) or better as the dataset grows.
+
+The nearest-suburb fallback only makes sense with dense coverage: against a
+handful of CBD rows it would hand every metro suburb a CBD median. It is off
+until the dataset has RENT_REFERENCE_NEAREST_MIN_ROWS rows; until then
+misses get DEFAULT_MEDIAN_RENT.
+"""
+import csv
+import math
+import threading
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+
+from django.conf import settings
+
+from .localities import normalize
+
+BUNDLED_CSV = Path(__file__).resolve().parent / "data" / "median_rents.csv"
+
+DEFAULT_MEDIAN_RENT = 2500
+
+# Grid cells are GRID_DEGREES square; a nearest-suburb query checks the
+# 3x3 block around the point, which covers NEAREST_MAX_KM at any AU latitude.
+GRID_DEGREES = 0.5
+NEAREST_MAX_KM = 25
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def _distance_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def _cell(lat, lon):
+    return (math.floor(lat / GRID_DEGREES), math.floor(lon / GRID_DEGREES))
+
+
+class RentReference:
+
+    def __init__(self, rows, nearest_min_rows=0):
+        entries = []
+        for row in rows:
+            key = normalize(row.get("suburb"))
+            try:
+                rent = int(float(row["median_monthly_rent"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+            try:
+                lat = float(row.get("lat"))
+                lon = float(row.get("lon"))
+            except (TypeError, ValueError):
+                lat = lon = math.nan
+            if key:
+                entries.append((key, lat, lon, rent))
+
+        entries.sort(key=lambda e: e[0])
+
+        self.keys = [e[0] for e in entries]
+        self.lats = array("d", (e[1] for e in entries))
+        self.lons = array("d", (e[2] for e in entries))
+        self.rents = array("i", (e[3] for e in entries))
+
+        self.nearest_enabled = len(entries) >= nearest_min_rows
+
+        self.grid = {}
+        for i, (_, lat, lon, _) in enumerate(entries):
+            if not math.isnan(lat):
+                self.grid.setdefault(_cell(lat, lon), []).append(i)
+
+    @classmethod
+    def from_csv(cls, path, nearest_min_rows=0):
+        with open(path, newline="", encoding="utf-8") as handle:
+            return cls(csv.DictReader(handle), nearest_min_rows)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def nearest(self, lat, lon, max_km=NEAREST_MAX_KM):
+        """Index of the closest suburb within ``max_km``, or None."""
+        row, col = _cell(lat, lon)
+        best = None
+        best_km = max_km
+        for dr in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                for i in self.grid.get((row + dr, col + dc), ()):
+                    km = _distance_km(lat, lon, self.lats[i], self.lons[i])
+                    if km <= best_km:
+                        best, best_km = i, km
+        return best
+
+    def _by_name(self, suburb, lat, lon):
+        key = normalize(suburb)
+        if not key:
+            return None
+        i = bisect_left(self.keys, key)
+        end = i
+        while end < len(self.keys) and self.keys[end] == key:
+            end += 1
+        if i == end:
+            return None
+        if end - i == 1 or lat is None:
+            return i
+        # Same name in several states (e.g. Paddington NSW/QLD): closest wins.
+        return min(range(i, end), key=lambda j: _distance_km(lat, lon, self.lats[j], self.lons[j]))
+
+    def median_rent(self, suburb, lat=None, lon=None, default=DEFAULT_MEDIAN_RENT):
+        if lat is None or lon is None or not (math.isfinite(lat) and math.isfinite(lon)):
+            lat = lon = None
+        i = self._by_name(suburb, lat, lon)
+        if i is None and self.nearest_enabled and lat is not None:
+            i = self.nearest(lat, lon)
+        return self.rents[i] if i is not None else default
+
+
+_reference = None
+_reference_lock = threading.Lock()
+
+
+def get_rent_reference():
+    global _reference
+    if _reference is None:
+        with _reference_lock:
+            if _reference is None:
+                _reference = RentReference.from_csv(
+                    settings.RENT_REFERENCE_PATH, settings.RENT_REFERENCE_NEAREST_MIN_ROWS
+                )
+    return _reference
+
+
+def median_rent_for(suburb, lat=None, lon=None):
+    """Monthly median rent for a suburb, falling back to the nearest by lat/lon (if enabled)."""
+    return get_rent_reference().median_rent(suburb, lat, lon)
@@ -0,0 +1,221 @@
+"""
+Precompiled validation schema for assessment payloads.
+
+The field list, coercers, choice sets and regexes are built once at import
+from the Assessment model, so validating a request is one pass over a tuple
+of (name, coercer) pairs.
+"""
+import hashlib
+import json
+import math
+import re
+from decimal import Decimal
+
+from django.db import models
+
+from .models import Assessment, DOCUMENTS_CHOICES
+
+# Fields a client may submit. Everything else on Assessment (owner, session,
+# scoring output, timestamps) is set server-side.
+INPUT_FIELDS = (
+    "full_name",
+    "postcode",
+    "suburb",
+    "city",
+    "monthly_rent_budget",
+    "lat",
+    "lon",
+    "employment_status",
+    "time_in_role",
+    "rental_history",
+    "household_income",
+    "household_income_period",
+    "individual_income",
+    "individual_income_period",
+    "documents",
+    "proof_of_income",
+    "moving_with_adults",
+    "moving_with_children",
+    "moving_with_pets",
+    "context_issues",
+)
+
+EMPTY_VALUES = (None, "", "null")
+
+# Largest value a PositiveIntegerField holds on every supported database.
+MAX_COUNT = 2147483647
+
+
+# Coercer factories return (coerce, default); _MISSING as the default means
+# "leave the field out when it isn't submitted".
+_MISSING = object()
+
+
+def _money(field):
+    # Digit limits are part of the pattern, so a match always fits the column.
+    whole_digits = field.max_digits - field.decimal_places
+    match = re.compile(rf"\d{{1,{whole_digits}}}(?:\.\d{{1,{field.decimal_places}}})?").fullmatch
+    message = (
+        f"Enter a non-negative amount with at most {whole_digits} digits "
+        f"and {field.decimal_places} decimal places."
+    )
+
+    def coerce(value):
+        if value in EMPTY_VALUES:
+            return None, None
+        cleaned = str(value).strip()
+        if not match(cleaned):
+            return None, message
+        return Decimal(cleaned), None
+    return coerce, None
+
+
+def _float(field):
+    def coerce(value):
+        if value in EMPTY_VALUES:
+            return None, None
+        try:
+            number = float(str(value).strip())
+        except (TypeError, ValueError):
+            return None, "Enter a number."
+        if not math.isfinite(number):
+            return None, "Enter a finite number."
+        return number, None
+    return coerce, None
+
+
+def _count(field):
+    def coerce(value):
+        if type(value) is int and 0 <= value <= MAX_COUNT:
+            return value, None
+        if value in EMPTY_VALUES:
+            return 0, None
+        try:
+            number = int(str(value).strip())
+        except (TypeError, ValueError):
+            return 0, "Enter a whole number."
+        if number < 0:
+            return 0, "Ensure this value is greater than or equal to 0."
+        if number > MAX_COUNT:
+            return 0, f"Ensure this value is less than or equal to {MAX_COUNT}."
+        return number, None
+    return coerce, 0
+
+
+def _choice(field):
+    allowed = frozenset(key for key, _ in field.choices)
+
+    def coerce(value):
+        if value in EMPTY_VALUES:
+            return "", None
+        if not isinstance(value, str) or value not in allowed:
+            return "", f"Select a valid choice. {value!r} is not one of the available choices."
+        return value, None
+    return coerce, _MISSING
+
+
+def _text(field):
+    max_length = field.max_length
+    empty = None if field.null else ""
+
+    def coerce(value):
+        if type(value) is str and (not max_length or len(value) <= max_length):
+            return value.strip(), None
+        if value is None:
+            return empty, None
+        if isinstance(value, (list, dict)):
+            return empty, "Enter a text value."
+        text = str(value).strip()
+        if max_length and len(text) > max_length:
+            return text[:max_length], f"Ensure this value has at most {max_length} characters."
+        return text, None
+    return coerce, _MISSING
+
+
+_DOCUMENT_KEYS = frozenset(key for key, _ in DOCUMENTS_CHOICES)
+
+
+def _documents(field):
+    def coerce(value):
+        if value in EMPTY_VALUES:
+            return [], None
+        if not isinstance(value, list):
+            value = [value]
+        documents = []
+        unknown = []
+        for item in value:
+            if item in _DOCUMENT_KEYS:
+                if item not in documents:
+                    documents.append(item)
+            else:
+                unknown.append(item)
+        if unknown:
+            return documents, f"Unknown document type(s): {', '.join(map(str, unknown))}."
+        return documents, None
+    return coerce, _MISSING
+
+
+def _coercer_for(field):
+    if isinstance(field, models.DecimalField):
+        return _money(field)
+    if isinstance(field, models.FloatField):
+        return _float(field)
+    if isinstance(field, models.PositiveIntegerField):
+        return _count(field)
+    if isinstance(field, models.JSONField):
+        return _documents(field)
+    if field.choices:
+        return _choice(field)
+    return _text(field)
+
+
+class AssessmentSchema:
+    """
+    ``validate(data)`` returns ``(clean_data, errors)``. Invalid values are
+    coerced to the field's empty value and reported in ``errors`` as
+    ``{field: [message]}``. Unknown keys are ignored.
+
+    Numeric fields are always present in ``clean_data`` (None, or 0 for
+    counts); other fields only when submitted, so model defaults apply.
+    """
+
+    def __init__(self, model, field_names):
+        compiled = []
+        for name in field_names:
+            coerce, default = _coercer_for(model._meta.get_field(name))
+            compiled.append((name, coerce, default))
+        self.fields = tuple(compiled)
+
+    def validate(self, data):
+        clean = {}
+        errors = {}
+        get = data.get
+        for name, coerce, default in self.fields:
+            value = get(name, _MISSING)
+            if value is _MISSING:
+                if default is not _MISSING:
+                    clean[name] = default
+                continue
+            clean[name], error = coerce(value)
+            if error:
+                errors[name] = [error]
+        return clean, errors
+
+
+assessment_schema = AssessmentSchema(Assessment, INPUT_FIELDS)
+
+
+def _canonical(value):
+    if isinstance(value, Decimal):
+        # 1200, 1200.0 and 1200.00 are the same amount.
+        return format(value.normalize(), "f")
+    if isinstance(value, list):
+        return sorted(value)
+    return value
+
+
+def content_hash(clean_data):
+    """SHA-256 of validated input, independent of key order and number formatting."""
+    canonical = {name: _canonical(value) for name, value in clean_data.items()}
+    payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
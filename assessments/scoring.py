@@ -0,0 +1,259 @@
+"""
+Rule-table scoring engine for rental readiness assessments.
+
+The rules below are declared once and compiled at import time into flat
+tuples, so a scoring call is a single pass over the table: one feature
+extraction, one loop, no per-request dict/regex building.
+"""
+from collections import namedtuple
+
+from .rent_reference import median_rent_for
+
+
+# Bump whenever a rule, threshold or weight changes so stored scores can be
+# told apart from ones produced by the current rules.
+SCORING_VERSION = 2
+
+INCOME_PERIOD_MULTIPLIERS = {"monthly": 12, "weekly": 52}
+
+# Largest value Assessment.months_in_role (a PositiveIntegerField) can hold.
+MAX_MONTHS_IN_ROLE = 2147483647
+
+STABLE_EMPLOYMENT = frozenset({"full_time", "self_employed"})
+POSITIVE_RENTAL_HISTORY = frozenset({"rented_locally", "owned_home"})
+
+AFFORDABLE_RENT_RATIO = 0.3
+TENURED_MONTHS = 12
+POINTS_PER_DOCUMENT = 5
+WELL_PREPARED_DOCUMENTS = 3
+MAX_HOUSEHOLD_PEOPLE = 4
+MAX_HOUSEHOLD_PETS = 2
+CONTEXT_ISSUES_PENALTY = 5
+
+LOW_RISK_THRESHOLD = 70
+MEDIUM_RISK_THRESHOLD = 40
+
+
+Features = namedtuple("Features", [
+    "monthly_budget",
+    "median_rent",
+    "employment_status",
+    "months_in_role",
+    "rental_history",
+    "annual_income",
+    "document_count",
+    "proof_of_income",
+    "household_people",
+    "pets",
+    "has_context_issues",
+])
+
+# evaluate(features, max_points) returns the points earned, or None when the
+# input is missing. Earning >= strong_at points records the strength message,
+# anything less records the weakness; None records `missing` (if any).
+Rule = namedtuple("Rule", [
+    "key", "category", "max_points", "evaluate",
+    "strong_at", "strength", "weakness", "missing",
+])
+
+ScoreResult = namedtuple("ScoreResult", [
+    "score", "risk_level", "strengths", "weaknesses", "category_scores",
+])
+
+
+def risk_from_score(score):
+    if score >= LOW_RISK_THRESHOLD:
+        return "Low"
+    if score >= MEDIUM_RISK_THRESHOLD:
+        return "Medium"
+    return "High"
+
+
+def parse_time_in_role(time_in_role):
+    """"3 years" -> 36, "8 months" -> 8, "6" -> 6; None when unparseable."""
+    parts = (time_in_role or "").split()
+    try:
+        number = int(parts[0])
+    except (ValueError, IndexError):
+        return None
+
+    unit = parts[1].lower() if len(parts) > 1 else "months"
+    if "year" in unit:
+        return number * 12
+    if "week" in unit:
+        return max(1, number // 4)
+    return number
+
+
+def derived_columns(profile):
+    """
+    Normalized inputs stored on Assessment for SQL filtering/aggregation:
+    annual household income, months in role, monthly rent / monthly income
+    and the number of documents. Unknown values are None.
+    """
+    annual_income = None
+    if profile.household_income is not None:
+        multiplier = INCOME_PERIOD_MULTIPLIERS.get(profile.household_income_period, 1)
+        annual_income = profile.household_income * multiplier
+
+    rent_to_income_ratio = None
+    budget = float(profile.monthly_rent_budget or 0)
+    if annual_income and budget > 0:
+        rent_to_income_ratio = round(budget / (float(annual_income) / 12), 4)
+
+    months_in_role = parse_time_in_role(profile.time_in_role)
+    if months_in_role is not None and not 0 <= months_in_role <= MAX_MONTHS_IN_ROLE:
+        months_in_role = None
+
+    documents = profile.documents
+    return {
+        "annual_income": annual_income,
+        "months_in_role": months_in_role,
+        "rent_to_income_ratio": rent_to_income_ratio,
+        "document_count": len(documents) if isinstance(documents, list) else 0,
+    }
+
+
+def extract_features(profile):
+    """Read everything the rules need from an Assessment (saved or not)."""
+    annual_income = float(profile.household_income or 0)
+    annual_income *= INCOME_PERIOD_MULTIPLIERS.get(profile.household_income_period, 1)
+
+    documents = profile.documents
+
+    return Features(
+        monthly_budget=float(profile.monthly_rent_budget or 0),
+        median_rent=median_rent_for(profile.suburb, profile.lat, profile.lon),
+        employment_status=profile.employment_status,
+        months_in_role=parse_time_in_role(profile.time_in_role),
+        rental_history=profile.rental_history,
+        annual_income=annual_income,
+        document_count=len(documents) if isinstance(documents, list) else 0,
+        proof_of_income=(profile.proof_of_income or "").lower(),
+        household_people=(profile.moving_with_adults or 0) + (profile.moving_with_children or 0),
+        pets=profile.moving_with_pets or 0,
+        has_context_issues=profile.context_issues not in (None, "", "None"),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Rule evaluators
+# ---------------------------------------------------------------------------
+
+def _budget(f, max_points):
+    return max_points if f.monthly_budget >= f.median_rent else 0
+
+
+def _employment(f, max_points):
+    return max_points if f.employment_status in STABLE_EMPLOYMENT else 0
+
+
+def _tenure(f, max_points):
+    if f.months_in_role is None:
+        return None
+    return max_points if f.months_in_role >= TENURED_MONTHS else 0
+
+
+def _rental_history(f, max_points):
+    return max_points if f.rental_history in POSITIVE_RENTAL_HISTORY else 0
+
+
+def _income(f, max_points):
+    if f.annual_income <= 0 or f.monthly_budget <= 0:
+        return None
+    rent_ratio = f.monthly_budget / (f.annual_income / 12)
+    return max_points if rent_ratio <= AFFORDABLE_RENT_RATIO else 0
+
+
+def _documents(f, max_points):
+    return min(f.document_count * POINTS_PER_DOCUMENT, max_points)
+
+
+def _proof_of_income(f, max_points):
+    return max_points if f.proof_of_income != "none" else 0
+
+
+def _household(f, max_points):
+    manageable = f.household_people <= MAX_HOUSEHOLD_PEOPLE and f.pets <= MAX_HOUSEHOLD_PETS
+    return max_points if manageable else 0
+
+
+def _context_issues(f, max_points):
+    return -CONTEXT_ISSUES_PENALTY if f.has_context_issues else 0
+
+
+RULES = (
+    Rule("budget", "budget", 20, _budget, 20,
+         "Budget aligns with desired suburb",
+         "Budget may be insufficient for typical rent in this suburb", None),
+    Rule("employment", "employment", 20, _employment, 20,
+         "Stable employment",
+         "Employment stability could be improved", None),
+    Rule("tenure", None, 5, _tenure, 5,
+         "Tenured in current role",
+         "Short tenure in current role", "Time in role not provided"),
+    Rule("rental_history", "rental_history", 10, _rental_history, 10,
+         "Positive rental history",
+         "Limited rental history", None),
+    # No message at all when income or rent is missing.
+    Rule("income", "income", 20, _income, 20,
+         "Affordable rent relative to income",
+         "Rent is high relative to income", None),
+    Rule("documents", "documents", 20, _documents, WELL_PREPARED_DOCUMENTS * POINTS_PER_DOCUMENT,
+         "Well-prepared documents",
+         "Insufficient documents for application", None),
+    Rule("proof_of_income", None, 5, _proof_of_income, 5,
+         "Proof of income provided",
+         "No proof of income provided", None),
+    Rule("household", "household", 5, _household, 5,
+         "Household size manageable",
+         "Household size may impact readiness", None),
+    # Penalty only: contributes nothing to the total and has no strength.
+    Rule("context_issues", None, 0, _context_issues, 0,
+         None,
+         "History/context issues reported", None),
+)
+
+
+def _compile(rules):
+    return tuple(
+        (r.evaluate, r.max_points, r.strong_at, r.strength, r.weakness, r.missing, r.category)
+        for r in rules
+    )
+
+
+_COMPILED_RULES = _compile(RULES)
+TOTAL_POSSIBLE = sum(r.max_points for r in RULES)
+
+
+def score_features(features):
+    earned = 0
+    strengths = []
+    weaknesses = []
+    category_scores = {}
+
+    for evaluate, max_points, strong_at, strength, weakness, missing, category in _COMPILED_RULES:
+        points = evaluate(features, max_points)
+        if points is None:
+            points = 0
+            if missing:
+                weaknesses.append(missing)
+        elif points >= strong_at:
+            if strength:
+                strengths.append(strength)
+        else:
+            weaknesses.append(weakness)
+
+        earned += points
+        if category:
+            category_scores[category] = int((points / max_points) * 100)
+
+    score = int((earned / TOTAL_POSSIBLE) * 100) if TOTAL_POSSIBLE > 0 else 0
+    score = max(0, min(score, 100))
+
+    return ScoreResult(score, risk_from_score(score), strengths, weaknesses, category_scores)
+
+
+def score_assessment(profile):
+    """Score an Assessment instance (it does not need to be saved)."""
+    return score_features(extract_features(profile))
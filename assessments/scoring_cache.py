@@ -0,0 +1,124 @@
+"""
+Memoized scoring + gap analysis keyed on a discretized profile signature.
+
+Apart from rent and income, every scoring input comes from a small choice
+set, and rent/income only matter through a few comparisons (budget vs the
+suburb median, rent-to-income ratio vs the affordability cutoff). Reducing a
+profile to those outcomes gives a signature with a few thousand possible
+values, so repeat profiles skip rule evaluation and gap analysis entirely.
+
+The signature must capture everything ``score_features`` and
+``generate_gap_analysis`` read; keep it in sync when either changes (and
+bump SCORING_VERSION, which also drops every cached entry).
+"""
+import threading
+from collections import Counter, OrderedDict, namedtuple
+
+from django.conf import settings
+
+from . import scoring
+from .gap_analysis import generate_gap_analysis
+from .scoring import (
+    AFFORDABLE_RENT_RATIO,
+    MAX_HOUSEHOLD_PEOPLE,
+    MAX_HOUSEHOLD_PETS,
+    POINTS_PER_DOCUMENT,
+    RULES,
+    TENURED_MONTHS,
+    extract_features,
+    score_features,
+)
+
+Evaluation = namedtuple("Evaluation", ["result", "gaps", "recommendations"])
+
+# Document counts beyond this all earn the documents rule's full points.
+_DOCUMENT_CAP = next(r.max_points for r in RULES if r.key == "documents") // POINTS_PER_DOCUMENT
+
+
+def _rent_ratio_band(features):
+    if features.annual_income <= 0 or features.monthly_budget <= 0:
+        return None
+    return features.monthly_budget / (features.annual_income / 12) <= AFFORDABLE_RENT_RATIO
+
+
+def profile_signature(profile, features):
+    months = features.months_in_role
+    documents = profile.documents
+    return (
+        scoring.SCORING_VERSION,
+        features.monthly_budget >= features.median_rent,
+        features.employment_status,
+        None if months is None else months >= TENURED_MONTHS,
+        features.rental_history,
+        _rent_ratio_band(features),
+        min(features.document_count, _DOCUMENT_CAP),
+        # gap_analysis checks the raw documents value, not the list count.
+        not documents or len(documents) < 2,
+        features.proof_of_income == "none",
+        profile.proof_of_income == "none",
+        features.household_people <= MAX_HOUSEHOLD_PEOPLE,
+        min(features.pets, MAX_HOUSEHOLD_PETS + 1),
+        features.has_context_issues,
+    )
+
+
+class ScoringCache:
+    """Thread-safe bounded LRU of signature -> Evaluation with hit metrics."""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.version = scoring.SCORING_VERSION
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = Counter()
+
+    def evaluate(self, profile):
+        features = extract_features(profile)
+        key = profile_signature(profile, features)
+
+        with self._lock:
+            if self.version != scoring.SCORING_VERSION:
+                self._entries.clear()
+                self.version = scoring.SCORING_VERSION
+                self._stats["invalidations"] += 1
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return cached
+            self._stats["misses"] += 1
+
+        result = score_features(features)
+        gaps, recommendations = generate_gap_analysis(profile, result.category_scores)
+        evaluation = Evaluation(result, gaps, recommendations)
+
+        with self._lock:
+            self._entries[key] = evaluation
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+        return evaluation
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["scoring_version"] = self.version
+        lookups = stats.get("hits", 0) + stats.get("misses", 0)
+        stats["hit_ratio"] = round(stats.get("hits", 0) / lookups, 4) if lookups else 0.0
+        return stats
+
+
+scoring_cache = ScoringCache(max_entries=settings.SCORING_CACHE_MAX_ENTRIES)
+
+
+def evaluate_assessment(profile):
+    """
+    Score and gap-analyse an Assessment (saved or not). The returned lists
+    and dicts are shared with the cache; copy before mutating.
+    """
+    return scoring_cache.evaluate(profile)
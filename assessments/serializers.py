@@ -5,3 +5,10 @@ class AssessmentSerializer(serializers.ModelSerializer):
     class Meta:
         model = Assessment
         fields = '__all__'
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Sparse fieldset: drop everything the caller didn't ask for.
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
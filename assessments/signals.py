@@ -0,0 +1,31 @@
+import threading
+from contextlib import contextmanager
+
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .aggregates import record_score_change
+from .models import Assessment
+
+_state = threading.local()
+
+
+@contextmanager
+def bulk_aggregate_updates():
+    """
+    Skip the per-row aggregate update on delete; the caller applies the
+    batch's deltas itself (see purge_anonymous_assessments).
+    """
+    _state.suspended = True
+    try:
+        yield
+    finally:
+        _state.suspended = False
+
+
+@receiver(post_delete, sender=Assessment)
+def remove_from_score_buckets(sender, instance, **kwargs):
+    if getattr(_state, "suspended", False):
+        return
+    if instance.readiness_score is not None:
+        record_score_change(instance, instance.readiness_score, None)
@@ -0,0 +1,230 @@
+"""
+What-if scoring: evaluate a grid of edited profiles in one vectorized pass.
+
+The assessment's own features are broadcast across the cartesian product of
+the requested rent, income, document-count and employment values, and the
+whole grid goes through ``vectorized.score_arrays`` at once. Nothing is
+saved.
+"""
+import numpy as np
+from django.conf import settings
+
+from .models import DOCUMENTS_CHOICES, EMPLOYMENT_CHOICES
+from .scoring import (
+    INCOME_PERIOD_MULTIPLIERS,
+    LOW_RISK_THRESHOLD,
+    MEDIUM_RISK_THRESHOLD,
+    POSITIVE_RENTAL_HISTORY,
+    STABLE_EMPLOYMENT,
+    extract_features,
+    score_features,
+)
+from .vectorized import clamp_months, score_arrays
+
+# Axis order of the returned score grid.
+AXES = ("monthly_rent_budget", "household_income", "document_count", "employment_status")
+
+MAX_AXIS_VALUES = 50
+EMPLOYMENT_KEYS = [key for key, _ in EMPLOYMENT_CHOICES]
+MAX_DOCUMENTS = len(DOCUMENTS_CHOICES)
+
+RISK_TARGETS = (("Medium", MEDIUM_RISK_THRESHOLD), ("Low", LOW_RISK_THRESHOLD))
+
+
+class SimulationError(ValueError):
+    pass
+
+
+def _number_axis(name, spec, integer=False):
+    """A list of values, or {"min", "max", "step"}; returns sorted unique floats."""
+    if isinstance(spec, dict):
+        try:
+            start = float(spec["min"])
+            stop = float(spec["max"])
+            step = float(spec.get("step") or 1)
+        except (KeyError, TypeError, ValueError):
+            raise SimulationError(f"{name}: expected numeric min, max and step.")
+        if not np.isfinite([start, stop, step]).all():
+            raise SimulationError(f"{name}: min, max and step must be finite numbers.")
+        if step <= 0 or stop < start:
+            raise SimulationError(f"{name}: step must be positive and max >= min.")
+        if (stop - start) / step + 1 > MAX_AXIS_VALUES:
+            raise SimulationError(f"{name}: at most {MAX_AXIS_VALUES} values per axis.")
+        values = np.arange(start, stop + step / 2, step)
+    elif isinstance(spec, list):
+        try:
+            values = np.array([float(v) for v in spec])
+        except (TypeError, ValueError):
+            raise SimulationError(f"{name}: values must be numbers.")
+        if not np.isfinite(values).all():
+            raise SimulationError(f"{name}: values must be finite numbers.")
+    else:
+        raise SimulationError(f"{name}: expected a list or a {{min, max, step}} range.")
+
+    if integer:
+        values = np.round(values)
+    values = np.unique(values)
+    if not len(values) or len(values) > MAX_AXIS_VALUES:
+        raise SimulationError(f"{name}: between 1 and {MAX_AXIS_VALUES} values required.")
+    if values[0] < 0:
+        raise SimulationError(f"{name}: values must be non-negative.")
+    return values
+
+
+def _employment_axis(spec):
+    if not isinstance(spec, list) or not spec:
+        raise SimulationError("employment_status: expected a non-empty list.")
+    unknown = [value for value in spec if value not in EMPLOYMENT_KEYS]
+    if unknown:
+        raise SimulationError(f"employment_status: unknown value(s) {unknown}.")
+    return [key for key in EMPLOYMENT_KEYS if key in spec]
+
+
+def build_axes(assessment, features, spec):
+    """
+    Requested axis values, always including the current value so a scenario
+    can leave that input unchanged. Missing axes stay at the current value.
+    """
+    income_multiplier = INCOME_PERIOD_MULTIPLIERS.get(assessment.household_income_period, 1)
+    current = {
+        "monthly_rent_budget": [features.monthly_budget],
+        "household_income": [features.annual_income / income_multiplier],
+        "document_count": [features.document_count],
+        "employment_status": [assessment.employment_status or ""],
+    }
+
+    axes = {}
+    for name in AXES:
+        if spec.get(name) is None:
+            axes[name] = current[name]
+        elif name == "employment_status":
+            values = _employment_axis(spec[name])
+            axes[name] = values if current[name][0] in values else current[name] + values
+        else:
+            values = _number_axis(name, spec[name], integer=(name == "document_count"))
+            if name == "document_count":
+                values = values[values <= MAX_DOCUMENTS]
+                if not len(values):
+                    raise SimulationError(f"document_count: at most {MAX_DOCUMENTS}.")
+            axes[name] = np.union1d(values, current[name]).tolist()
+    return axes
+
+
+def grid_features(features, axes, income_multiplier):
+    """Feature arrays for every combination of ``axes`` (flattened, C order)."""
+    rent, income, docs, employment = np.meshgrid(
+        np.array(axes["monthly_rent_budget"], dtype=np.float64),
+        np.array(axes["household_income"], dtype=np.float64) * income_multiplier,
+        np.array(axes["document_count"], dtype=np.int64),
+        np.array([e in STABLE_EMPLOYMENT for e in axes["employment_status"]], dtype=bool),
+        indexing="ij",
+    )
+    size = rent.size
+
+    def constant(value, dtype):
+        return np.full(size, value, dtype=dtype)
+
+    months = features.months_in_role
+    return {
+        "monthly_budget": rent.ravel(),
+        "median_rent": constant(features.median_rent, np.float64),
+        "stable_employment": employment.ravel(),
+        "months_in_role": constant(clamp_months(months), np.int64),
+        "tenure_missing": constant(months is None, bool),
+        "positive_rental_history": constant(features.rental_history in POSITIVE_RENTAL_HISTORY, bool),
+        "annual_income": income.ravel(),
+        "document_count": docs.ravel(),
+        "no_proof_of_income": constant(features.proof_of_income == "none", bool),
+        "household_people": constant(features.household_people, np.int64),
+        "pets": constant(features.pets, np.int64),
+        "has_context_issues": constant(features.has_context_issues, bool),
+    }
+
+
+def _change_costs(axes, base):
+    """
+    Rank scenarios by how much they ask of the applicant: fewest changed
+    inputs first, then the smallest relative change.
+    """
+    shape = tuple(len(axes[name]) for name in AXES)
+    rent, income, docs, employment = np.meshgrid(
+        *(np.arange(n) for n in shape), indexing="ij"
+    )
+    rent_values = np.array(axes["monthly_rent_budget"])[rent.ravel()]
+    income_values = np.array(axes["household_income"])[income.ravel()]
+    doc_values = np.array(axes["document_count"])[docs.ravel()]
+    employment_values = np.array(axes["employment_status"], dtype=object)[employment.ravel()]
+
+    rent_change = np.abs(rent_values - base["monthly_rent_budget"]) / max(base["monthly_rent_budget"], 1)
+    income_change = np.abs(income_values - base["household_income"]) / max(base["household_income"], 1)
+    doc_change = np.abs(doc_values - base["document_count"]) / MAX_DOCUMENTS
+    employment_changed = (employment_values != base["employment_status"]).astype(bool)
+
+    changed_inputs = (
+        (rent_change > 0).astype(int) + (income_change > 0) + (doc_change > 0) + employment_changed
+    )
+    magnitude = rent_change + income_change + doc_change + employment_changed
+    values = {
+        "monthly_rent_budget": rent_values,
+        "household_income": income_values,
+        "document_count": doc_values,
+        "employment_status": employment_values,
+    }
+    return changed_inputs, magnitude, values
+
+
+def simulate(assessment, spec):
+    features = extract_features(assessment)
+    income_multiplier = INCOME_PERIOD_MULTIPLIERS.get(assessment.household_income_period, 1)
+    axes = build_axes(assessment, features, spec)
+
+    shape = tuple(len(axes[name]) for name in AXES)
+    if int(np.prod(shape)) > settings.ASSESSMENT_SIMULATION_MAX_SCENARIOS:
+        raise SimulationError(
+            f"Too many scenarios ({int(np.prod(shape))}); "
+            f"the maximum is {settings.ASSESSMENT_SIMULATION_MAX_SCENARIOS}."
+        )
+
+    batch = score_arrays(grid_features(features, axes, income_multiplier))
+
+    base = {
+        "monthly_rent_budget": features.monthly_budget,
+        "household_income": features.annual_income / income_multiplier,
+        "document_count": features.document_count,
+        "employment_status": assessment.employment_status or "",
+    }
+    base_result = score_features(features)
+    base_score = base_result.score
+
+    changed_inputs, magnitude, values = _change_costs(axes, base)
+    order = np.lexsort((magnitude, changed_inputs))
+
+    cheapest = {}
+    for risk_level, threshold in RISK_TARGETS:
+        if base_score >= threshold:
+            continue
+        reaching = order[batch.score[order] >= threshold]
+        if not len(reaching):
+            cheapest[risk_level] = None
+            continue
+        i = reaching[0]
+        scenario = {name: values[name][i] for name in AXES}
+        cheapest[risk_level] = {
+            "score": int(batch.score[i]),
+            "inputs": {
+                "monthly_rent_budget": float(scenario["monthly_rent_budget"]),
+                "household_income": float(scenario["household_income"]),
+                "document_count": int(scenario["document_count"]),
+                "employment_status": scenario["employment_status"],
+            },
+            "changes": [name for name in AXES if scenario[name] != base[name]],
+        }
+
+    return {
+        "base": {"inputs": base, "score": base_score, "risk_level": base_result.risk_level},
+        "household_income_period": assessment.household_income_period,
+        "axes": {name: list(axes[name]) for name in AXES},
+        "scenario_count": int(batch.score.size),
+        "scores": batch.score.reshape(shape).tolist(),
+        "cheapest_changes": cheapest,
+    }
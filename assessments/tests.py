@@ -1,3 +1,905 @@
-from django.test import TestCase
+import copy
+import gzip
+import json
+import tempfile
+import zipfile
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from io import StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db.models import Q
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from action_plan.models import CompletedTask, CoverLetter, ReferenceLetter, UserDocument
+from applications.models import Application
+from cover_letters.models import CoverLetter as GeneratedCoverLetter
+from reports.models import TenantReport
+
+from .aggregates import add_score_change, apply_deltas, competitiveness, record_score_change, score_percentiles
+from .models import Assessment, CohortStat, DOCUMENTS_CHOICES, ScoreBucket
+from .localities import LocalityIndex
+from .rent_reference import DEFAULT_MEDIAN_RENT, RentReference, median_rent_for
+from .schema import assessment_schema, content_hash
+from .scoring import LOW_RISK_THRESHOLD, MEDIUM_RISK_THRESHOLD, risk_from_score, score_assessment
+from .vectorized import score_rows
+from .views import AssessmentListAPIView
+from .management.commands.purge_anonymous_assessments import Command as PurgeCommand
+
+User = get_user_model()
+
+
+def hot_queries(user, assessment):
+    """The per-request lookups that must stay index-driven as tables grow."""
+    return [
+        ("assessments by user", Assessment.objects.filter(user=user).order_by("-created_at")[:10]),
+        ("assessment list page", Assessment.objects.filter(user=user).filter(
+            Q(created_at__lt=assessment.created_at) | Q(created_at=assessment.created_at, id__lt=assessment.id)
+        ).order_by("-created_at", "-id")[:21]),
+        ("previous assessment", Assessment.objects.filter(user=user).exclude(id=assessment.id).order_by("-created_at")[:1]),
+        ("claim by session", Assessment.objects.filter(session_key=assessment.session_key).order_by("-created_at")[:1]),
+        ("enrichment backlog", Assessment.objects.filter(
+            enrichment_status__in=["pending", "failed"], created_at__lte=timezone.now()
+        ).values_list("id", flat=True)),
+        ("unclaimed retention", Assessment.objects.filter(
+            user__isnull=True, created_at__lt=timezone.now()
+        ).order_by("created_at").values_list("id", flat=True)[:500]),
+        ("duplicate submission", Assessment.objects.filter(
+            Q(session_key=assessment.session_key) | Q(user=user),
+            content_hash=assessment.content_hash, created_at__gte=assessment.created_at,
+        ).order_by("-created_at")[:1]),
+        ("completed tasks", CompletedTask.objects.filter(user=user, assessment=assessment)),
+        ("checklist documents", UserDocument.objects.filter(user=user, assessment=assessment)),
+        ("checklist reference", ReferenceLetter.objects.filter(user=user, assessment=assessment)[:1]),
+        ("checklist cover letter", CoverLetter.objects.filter(user=user, assessment=assessment)[:1]),
+        ("applications", Application.objects.filter(user=user).order_by("-created_at")),
+        ("cover letters", GeneratedCoverLetter.objects.filter(user=user).order_by("-created_at")),
+        ("reports", TenantReport.objects.filter(assessment__user=user).order_by("-created_at")),
+    ]
+
+
+# Ordered across a join or an OR of two index ranges, so the sort can't come
+# from an index; either way it only sorts one user's rows.
+SMALL_SORTS = {"reports", "duplicate submission"}
+
+
+def full_scans(plan, allow_sort=False):
+    """Plan lines that read a whole table (or sort one) instead of using an index."""
+    lines = plan.splitlines()
+    if connection.vendor == "sqlite":
+        return [
+            line for line in lines
+            if ("SCAN " in line and "USING" not in line)
+            or ("TEMP B-TREE" in line and not allow_sort)
+        ]
+    return [line for line in lines if "Seq Scan" in line]
+
+
+class HotQueryPlanTests(TestCase):
+    """
+    Fails when a hot query shape loses its index (a dropped index, a
+    reordered filter, a new ORDER BY) and falls back to a sequential scan.
+    """
+
+    USERS = 20
+    PER_USER = 25
+
+    @classmethod
+    def setUpTestData(cls):
+        users = User.objects.bulk_create([
+            User(email=f"plan{i}@example.com") for i in range(cls.USERS)
+        ])
+        start = timezone.now() - timedelta(days=365)
+        Assessment.objects.bulk_create([
+            Assessment(
+                user=user if n % 5 else None,
+                session_key=f"session-{user.pk}-{n}",
+                enrichment_status="done" if n else "pending",
+            )
+            for user in users for n in range(cls.PER_USER)
+        ])
+        assessments = list(Assessment.objects.exclude(user=None))
+        for i, assessment in enumerate(assessments):
+            assessment.created_at = start + timedelta(hours=i)
+        Assessment.objects.bulk_update(assessments, ["created_at"])
+
+        CompletedTask.objects.bulk_create([
+            CompletedTask(user_id=a.user_id, assessment=a, task_key="upload_payslip") for a in assessments
+        ])
+        UserDocument.objects.bulk_create([
+            UserDocument(user_id=a.user_id, assessment=a, document_type="payslip") for a in assessments
+        ])
+        ReferenceLetter.objects.bulk_create([ReferenceLetter(user_id=a.user_id, assessment=a) for a in assessments])
+        CoverLetter.objects.bulk_create([CoverLetter(user_id=a.user_id, assessment=a) for a in assessments])
+        Application.objects.bulk_create([
+            Application(user_id=a.user_id, property_address="1 Test St", date_applied=start.date())
+            for a in assessments
+        ])
+        GeneratedCoverLetter.objects.bulk_create([GeneratedCoverLetter(user_id=a.user_id) for a in assessments])
+        TenantReport.objects.bulk_create([
+            TenantReport(assessment=a, report_id=f"R-{a.pk}", score=50) for a in assessments
+        ])
+
+        cls.user = users[-1]
+        cls.assessment = Assessment.objects.filter(user=cls.user).latest("created_at")
+
+    def setUp(self):
+        with connection.cursor() as cursor:
+            if connection.vendor == "sqlite":
+                cursor.execute("ANALYZE")
+            elif connection.vendor == "postgresql":
+                cursor.execute("ANALYZE")
+                # Tiny test tables are cheaper to scan; only flag scans the
+                # planner cannot avoid because no index matches.
+                cursor.execute("SET enable_seqscan = off")
+            else:
+                self.skipTest(f"No plan check for {connection.vendor}.")
+
+    def test_hot_queries_use_indexes(self):
+        for label, queryset in hot_queries(self.user, self.assessment):
+            with self.subTest(label):
+                plan = queryset.explain()
+                self.assertEqual(
+                    full_scans(plan, allow_sort=label in SMALL_SORTS), [], f"{label}:\n{plan}"
+                )
+
+
+STRONG_PROFILE = {
+    "suburb": "Sydney CBD",
+    "monthly_rent_budget": Decimal("3000"),
+    "employment_status": "full_time",
+    "time_in_role": "3 years",
+    "rental_history": "rented_locally",
+    "household_income": Decimal("150000"),
+    "household_income_period": "annual",
+    "documents": ["passport", "driver_license", "medicare"],
+    "proof_of_income": "recent_payslip",
+    "moving_with_adults": 2,
+    "moving_with_children": 0,
+    "moving_with_pets": 1,
+}
+
+
+class ScoringEngineTests(SimpleTestCase):
+    """Expected values are what the scorer inlined in AssessmentSubmitView returned."""
+
+    def score(self, **profile):
+        return score_assessment(Assessment(**profile))
+
+    def test_strong_profile(self):
+        result = self.score(**STRONG_PROFILE)
+        self.assertEqual((result.score, result.risk_level), (95, "Low"))
+        self.assertEqual(result.strengths, [
+            "Budget aligns with desired suburb",
+            "Stable employment",
+            "Tenured in current role",
+            "Positive rental history",
+            "Affordable rent relative to income",
+            "Well-prepared documents",
+            "Proof of income provided",
+            "Household size manageable",
+        ])
+        self.assertEqual(result.weaknesses, [])
+        self.assertEqual(result.category_scores, {
+            "budget": 100, "employment": 100, "rental_history": 100,
+            "income": 100, "documents": 75, "household": 100,
+        })
+
+    def test_missing_income_and_tenure(self):
+        result = self.score(
+            suburb="Bondi", monthly_rent_budget=Decimal("1800"), employment_status="part_time",
+            time_in_role="", rental_history="first_time_renter", household_income=None,
+            documents=[], proof_of_income="none", moving_with_adults=1,
+        )
+        self.assertEqual((result.score, result.risk_level), (4, "High"))
+        self.assertEqual(result.strengths, ["Household size manageable"])
+        # Missing income earns nothing and reports nothing.
+        self.assertEqual(result.weaknesses, [
+            "Budget may be insufficient for typical rent in this suburb",
+            "Employment stability could be improved",
+            "Time in role not provided",
+            "Limited rental history",
+            "Insufficient documents for application",
+            "No proof of income provided",
+        ])
+        self.assertEqual(result.category_scores["income"], 0)
+
+    def test_context_issues_and_document_cap(self):
+        result = self.score(
+            suburb="Docklands", monthly_rent_budget=Decimal("2400"), employment_status="self_employed",
+            time_in_role="6 weeks", rental_history="owned_home",
+            household_income=Decimal("2000"), household_income_period="weekly",
+            documents=[key for key, _ in DOCUMENTS_CHOICES], proof_of_income="bank_statements",
+            moving_with_adults=3, moving_with_children=2,
+            context_issues="Broken lease in 2021",
+        )
+        self.assertEqual((result.score, result.risk_level), (85, "Low"))
+        self.assertEqual(result.category_scores["documents"], 100)
+        self.assertEqual(result.category_scores["household"], 0)
+        self.assertEqual(result.weaknesses, [
+            "Short tenure in current role",
+            "Household size may impact readiness",
+            "History/context issues reported",
+        ])
+
+    def test_risk_thresholds(self):
+        self.assertEqual(
+            [risk_from_score(s) for s in (LOW_RISK_THRESHOLD, LOW_RISK_THRESHOLD - 1,
+                                          MEDIUM_RISK_THRESHOLD, MEDIUM_RISK_THRESHOLD - 1)],
+            ["Low", "Medium", "Medium", "High"],
+        )
+        profile = {
+            "monthly_rent_budget": Decimal("2500"), "employment_status": "full_time",
+            "time_in_role": "1 year", "rental_history": "rented_locally",
+            "documents": ["passport", "medicare"], "proof_of_income": "recent_payslip",
+        }
+        self.assertEqual(self.score(**profile)[:2], (71, "Low"))
+        self.assertEqual(self.score(**profile, context_issues="Late payments")[:2], (66, "Medium"))
+
+        profile = {"employment_status": "full_time", "rental_history": "rented_locally", "proof_of_income": "recent_payslip"}
+        self.assertEqual(self.score(**profile, documents=["passport"])[:2], (42, "Medium"))
+        self.assertEqual(self.score(**profile)[:2], (38, "High"))
+
+
+class VectorizedScoringTests(SimpleTestCase):
+
+    PROFILES = [
+        STRONG_PROFILE,
+        {},
+        {**STRONG_PROFILE, "household_income": None, "time_in_role": "", "context_issues": "Eviction"},
+        {**STRONG_PROFILE, "household_income_period": "weekly", "suburb": "Docklands", "moving_with_pets": 3},
+        {**STRONG_PROFILE, "documents": [key for key, _ in DOCUMENTS_CHOICES], "proof_of_income": "none"},
+        {**STRONG_PROFILE, "monthly_rent_budget": Decimal("0"), "employment_status": "student"},
+        # Parses, but far outside int64 on either side.
+        {**STRONG_PROFILE, "time_in_role": "-99999999999999999999999 years"},
+        {**STRONG_PROFILE, "time_in_role": "99999999999999999999999 years"},
+        {**STRONG_PROFILE, "time_in_role": "-3 weeks"},
+    ]
+
+    def test_matches_the_scalar_scorer(self):
+        batch = score_rows(self.PROFILES, messages=True)
+        for i, profile in enumerate(self.PROFILES):
+            with self.subTest(profile=profile):
+                expected = score_assessment(Assessment(**profile))
+                self.assertEqual(int(batch.score[i]), expected.score)
+                self.assertEqual(str(batch.risk_level[i]), expected.risk_level)
+                self.assertEqual(batch.strengths[i], expected.strengths)
+                self.assertEqual(batch.weaknesses[i], expected.weaknesses)
+                self.assertEqual(
+                    {category: int(scores[i]) for category, scores in batch.category_scores.items()},
+                    expected.category_scores,
+                )
+
+
+class RescoreAssessmentsTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="rescore@example.com", password="pw")
+        # Stored with a stale score, as if written by older rules.
+        self.assessments = []
+        for name in ("A", "B", "C"):
+            assessment = Assessment.objects.create(
+                user=self.user, session_key="rescore", full_name=name, postcode="2000",
+                readiness_score=10, risk_level="High", **STRONG_PROFILE
+            )
+            record_score_change(assessment, None, 10)
+            self.assessments.append(assessment)
+        CompletedTask.objects.create(
+            user=self.user, assessment=self.assessments[0], task_key="upload_payslip", points_earned=3
+        )
+        self.expected = score_assessment(self.assessments[0]).score
+
+    def rescore(self, *args):
+        call_command("rescore_assessments", "--chunk-size", "2", *args, stdout=StringIO())
+
+    def scores(self):
+        return list(Assessment.objects.order_by("id").values_list("readiness_score", flat=True))
+
+    def bins(self):
+        return dict(ScoreBucket.objects.filter(scope="global").exclude(count=0).values_list("score", "count"))
+
+    def test_rescore(self):
+        self.rescore()
+        self.assertEqual(self.scores(), [self.expected + 3, self.expected, self.expected])
+        self.assertEqual(self.bins(), {self.expected + 3: 1, self.expected: 2})
+        cohort = CohortStat.objects.get(postcode="2000")
+        self.assertEqual((cohort.count, cohort.score_total), (3, 3 * self.expected + 3))
+        self.assertEqual(cohort.low_count, 3)
+
+        assessment = Assessment.objects.get(pk=self.assessments[1].pk)
+        self.assertEqual(assessment.risk_level, "Low")
+        self.assertEqual(assessment.strengths, score_assessment(assessment).strengths)
+
+    def test_resume_from_checkpoint(self):
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = Path(directory) / "rescore.json"
+            checkpoint.write_text(json.dumps({"last_id": self.assessments[0].pk}))
+            self.rescore("--checkpoint", str(checkpoint))
+            self.assertFalse(checkpoint.exists())
+        self.assertEqual(self.scores(), [10, self.expected, self.expected])
+        self.assertEqual(self.bins(), {10: 1, self.expected: 2})
+
+    def test_dry_run_writes_nothing(self):
+        self.rescore("--dry-run")
+        self.assertEqual(self.scores(), [10, 10, 10])
+        self.assertEqual(self.bins(), {10: 3})
+        self.assertEqual(CohortStat.objects.get(postcode="2000").score_total, 30)
+
+
+class AssessmentScoreBatchTests(TestCase):
+    url = "/api/assessment/score-batch/"
+
+    def setUp(self):
+        self.client.force_login(User.objects.create_user(email="agency@example.com", password="pw"))
+        # As an agency would send them: plain JSON, amounts as strings.
+        self.profiles = json.loads(json.dumps([
+            {**STRONG_PROFILE, "reference": "strong"},
+            {"employment_status": "student", "time_in_role": "-99999999999999999999999 years", "reference": "edge"},
+            {"employment_status": "astronaut", "monthly_rent_budget": "-5", "reference": "invalid"},
+        ], default=str))
+
+    def post(self, profiles):
+        return self.client.post(self.url, profiles, content_type="application/json")
+
+    def test_scores_match_the_scalar_scorer(self):
+        response = self.post(self.profiles)
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual([r["reference"] for r in results], ["strong", "edge", "invalid"])
+        for profile, result in zip(self.profiles[:2], results):
+            clean_data, _ = assessment_schema.validate(profile)
+            expected = score_assessment(Assessment(**clean_data))
+            self.assertEqual(
+                (result["readiness_score"], result["risk_level"], result["category_scores"]),
+                (expected.score, expected.risk_level, expected.category_scores),
+            )
+
+    def test_invalid_profiles_get_their_field_errors(self):
+        invalid = self.post(self.profiles).json()["results"][2]
+        self.assertEqual(set(invalid["errors"]), {"employment_status", "monthly_rent_budget"})
+        self.assertNotIn("readiness_score", invalid)
+
+    def test_stateless(self):
+        self.post(self.profiles)
+        self.assertFalse(Assessment.objects.exists())
+        self.assertFalse(ScoreBucket.objects.exists())
+
+    @override_settings(ASSESSMENT_SCORE_BATCH_MAX_SIZE=2)
+    def test_batch_too_large(self):
+        self.assertEqual(self.post(self.profiles).status_code, 413)
+        self.assertEqual(self.post(self.profiles[:2]).status_code, 200)
+
+
+class ScoreHistogramTests(TestCase):
+
+    def submit(self, profile):
+        response = self.client.post("/api/assessment/submit/", profile, content_type="application/json")
+        return Assessment.objects.get(pk=response.json()["id"])
+
+    def assertNoDrift(self):
+        out = StringIO()
+        call_command("rebuild_score_buckets", "--dry-run", stdout=out)
+        self.assertIn("; 0 bins would be corrected", out.getvalue())
+
+    def test_incremental_bins_match_a_rebuild(self):
+        profile = json.loads(json.dumps(STRONG_PROFILE, default=str))
+        first = self.submit({**profile, "full_name": "A", "postcode": "2000"})
+        self.submit({**profile, "full_name": "B", "postcode": "2000", "suburb": "The Rocks"})
+        self.submit({"full_name": "C", "postcode": "3006", "suburb": "Southbank"})
+        self.assertNoDrift()
+
+        # As the action plan does when a task is completed.
+        previous_score = first.readiness_score
+        first.readiness_score = previous_score - 7
+        first.save(update_fields=["readiness_score"])
+        record_score_change(first, previous_score, first.readiness_score)
+        self.assertNoDrift()
+
+        call_command("rescore_assessments", stdout=StringIO())
+        first.refresh_from_db()
+        self.assertEqual(first.readiness_score, previous_score)
+        self.assertNoDrift()
+
+        first.delete()
+        self.assertNoDrift()
+
+    @override_settings(COMPETITIVENESS_MIN_SAMPLE=3)
+    def test_competitiveness_falls_back_to_wider_scopes(self):
+        deltas = Counter()
+        for postcode, suburb, score in (
+            ("2000", "Sydney CBD", 40), ("2000", "Sydney CBD", 60), ("2000", "The Rocks", 80),
+            ("3006", "Southbank", 20), ("3006", "Southbank", 90),
+        ):
+            add_score_change(deltas, postcode, suburb, None, score)
+        apply_deltas(deltas)
+
+        # Two Sydney CBD scores are too few; the postcode has three.
+        self.assertEqual(competitiveness(60, "2000", "Sydney CBD"), (50, "postcode"))
+        self.assertEqual(competitiveness(60, "4000", "Brisbane CBD"), (50, "global"))
+
+        deltas = Counter()
+        add_score_change(deltas, "2000", "sydney  cbd", None, 50)
+        apply_deltas(deltas)
+        self.assertEqual(competitiveness(60, "2000", "Sydney CBD"), (83, "suburb"))
+        self.assertEqual(score_percentiles(60, "2000", "Sydney CBD")["global"], {"percentile": 58, "sample_size": 6})
+
+
+class CohortStatsTests(TestCase):
+
+    def reconcile(self):
+        out = StringIO()
+        call_command("reconcile_cohort_stats", "--dry-run", stdout=out)
+        return out.getvalue()
+
+    @override_settings(TIME_ZONE="Australia/Sydney")
+    def test_incremental_totals_match_a_reconcile(self):
+        profile = json.loads(json.dumps(STRONG_PROFILE, default=str))
+        # 1am on 1 June in Sydney, still May in UTC.
+        month_boundary = datetime(2026, 5, 31, 15, tzinfo=dt_timezone.utc)
+        with mock.patch("django.utils.timezone.now", return_value=month_boundary):
+            for name in ("A", "B"):
+                self.client.post(
+                    "/api/assessment/submit/", {**profile, "full_name": name, "postcode": "2000"},
+                    content_type="application/json",
+                )
+        # Saved outside the form (admin, shell), so the postcode is untrimmed.
+        untrimmed = Assessment.objects.create(
+            session_key="cohort", postcode=" 2000\t", readiness_score=35, **STRONG_PROFILE
+        )
+        record_score_change(untrimmed, None, 35)
+
+        june = CohortStat.objects.get(postcode="2000", month=date(2026, 6, 1))
+        self.assertEqual(june.count, 2)
+        self.assertIn("0 missing, 0 drifted, 0 stale", self.reconcile())
+
+        first = Assessment.objects.get(full_name="A")
+        previous_score = first.readiness_score
+        first.readiness_score = 50
+        first.save(update_fields=["readiness_score"])
+        record_score_change(first, previous_score, 50)
+        self.assertIn("0 missing, 0 drifted, 0 stale", self.reconcile())
+
+        Assessment.objects.filter(full_name__in=["A", "B"]).delete()
+        untrimmed.delete()
+        self.assertIn("0 missing, 0 drifted, 0 stale", self.reconcile())
+
+
+class AssessmentListTests(TestCase):
+    url = "/api/assessment/list/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="list@example.com", password="pw")
+        other = User.objects.create_user(email="other@example.com", password="pw")
+        Assessment.objects.bulk_create(
+            [Assessment(user=cls.user, session_key="list", full_name=f"A{i}") for i in range(105)]
+            + [Assessment(user=other, session_key="other")]
+        )
+        # Many rows share a timestamp; the cursor must break ties by id.
+        created_at = timezone.now()
+        Assessment.objects.filter(user=cls.user).update(created_at=created_at)
+        Assessment.objects.filter(user=cls.user, full_name__in=["A0", "A1"]).update(
+            created_at=created_at - timedelta(days=1)
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_cursor_walk_visits_every_row_once(self):
+        seen = []
+        url = f"{self.url}?page_size=30&fields=id"
+        while url:
+            data = self.client.get(url).json()
+            seen += [row["id"] for row in data["results"]]
+            url = data["next"]
+        expected = list(
+            Assessment.objects.filter(user=self.user).order_by("-created_at", "-id").values_list("id", flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+    def test_page_size_is_capped(self):
+        data = self.client.get(f"{self.url}?page_size=1000").json()
+        self.assertEqual(len(data["results"]), 100)
+        self.assertIsNotNone(data["next"])
+
+    def test_unknown_fields_are_rejected(self):
+        response = self.client.get(f"{self.url}?fields=id,password")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("fields", response.json())
+
+    def test_sparse_fieldsets(self):
+        with CaptureQueriesContext(connection) as queries:
+            data = self.client.get(f"{self.url}?fields=id,full_name&page_size=2").json()
+        self.assertEqual([set(row) for row in data["results"]], [{"id", "full_name"}] * 2)
+        select = [q["sql"] for q in queries if "assessments_assessment" in q["sql"]][-1]
+        self.assertNotIn("risk_level", select)
+
+        row = self.client.get(f"{self.url}?page_size=1").json()["results"][0]
+        self.assertEqual(set(row), set(AssessmentListAPIView.SUMMARY_FIELDS))
+
+
+class PurgeAnonymousAssessmentsTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="purge@example.com", password="pw")
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.archive_dir = Path(directory.name)
+
+        old = timezone.now() - timedelta(days=200)
+        self.expired = [self.create(f"old-{n}", old + timedelta(minutes=n), score=30 + n) for n in range(3)]
+        self.claimed = self.create("claimed", old, score=80, user=self.user)
+        self.recent = self.create("recent", timezone.now(), score=90)
+
+    def create(self, session_key, created_at, score, user=None):
+        assessment = Assessment.objects.create(
+            user=user, session_key=session_key, postcode="2000", readiness_score=score
+        )
+        Assessment.objects.filter(pk=assessment.pk).update(created_at=created_at)
+        assessment.refresh_from_db()
+        record_score_change(assessment, None, score)
+        return assessment
+
+    def purge(self, *args):
+        call_command(
+            "purge_anonymous_assessments", "--older-than-days", "90", "--batch-size", "2",
+            "--archive-dir", str(self.archive_dir), *args, stdout=StringIO(),
+        )
+
+    def remaining(self):
+        return set(Assessment.objects.values_list("session_key", flat=True))
+
+    def assertAggregatesMatch(self):
+        out = StringIO()
+        call_command("rebuild_score_buckets", "--dry-run", stdout=out)
+        self.assertIn("; 0 bins would be corrected", out.getvalue())
+        out = StringIO()
+        call_command("reconcile_cohort_stats", "--dry-run", stdout=out)
+        self.assertIn("0 missing, 0 drifted, 0 stale", out.getvalue())
+
+    def test_purges_only_expired_unclaimed_rows(self):
+        self.purge()
+        self.assertEqual(self.remaining(), {"claimed", "recent"})
+        self.assertEqual(
+            dict(ScoreBucket.objects.filter(scope="global").exclude(count=0).values_list("score", "count")),
+            {80: 1, 90: 1},
+        )
+        self.assertAggregatesMatch()
+
+        [archive] = self.archive_dir.glob("*.jsonl.gz")
+        with gzip.open(archive, "rt") as handle:
+            archived = [json.loads(line) for line in handle]
+        self.assertEqual(
+            [(row["id"], row["readiness_score"]) for row in archived],
+            [(a.pk, a.readiness_score) for a in self.expired],
+        )
+
+    def test_row_claimed_between_batches_survives(self):
+        purge_batch = PurgeCommand.purge_batch
+        late = self.expired[2]
+
+        def claim_then_purge(command, ids, archive):
+            # The user signs up after the batch's ids were read.
+            if late.pk in ids:
+                Assessment.objects.filter(pk=late.pk).update(user=self.user)
+            return purge_batch(command, ids, archive)
+
+        with mock.patch.object(PurgeCommand, "purge_batch", claim_then_purge):
+            self.purge()
+        self.assertEqual(self.remaining(), {"claimed", "recent", late.session_key})
+        self.assertAggregatesMatch()
+
+    def test_dry_run_deletes_nothing(self):
+        self.purge("--dry-run")
+        self.assertEqual(Assessment.objects.count(), 5)
+        self.assertFalse(any(self.archive_dir.iterdir()))
+
+
+class RentReferenceTests(SimpleTestCase):
+
+    def test_unknown_suburb_gets_the_default_with_the_bundled_placeholder(self):
+        # Parramatta is ~20 km from Darling Harbour (3200); it must not inherit it.
+        self.assertEqual(median_rent_for("Parramatta", -33.8150, 151.0011), DEFAULT_MEDIAN_RENT)
+        self.assertEqual(median_rent_for("Bondi", -33.8915, 151.2767), DEFAULT_MEDIAN_RENT)
+        self.assertEqual(median_rent_for("Darling Harbour", -33.8748, 151.1987), 3200)
+        # Only the suburbs the original scorer priced; "Sydney" was always the default.
+        self.assertEqual(median_rent_for("Sydney", -33.8688, 151.2093), DEFAULT_MEDIAN_RENT)
+
+    def test_nearest_fallback_needs_enough_rows(self):
+        rows = [{"suburb": "Darling Harbour", "lat": "-33.8748", "lon": "151.1987", "median_monthly_rent": "3200"}]
+        parramatta = ("Parramatta", -33.8150, 151.0011)
+        self.assertEqual(RentReference(rows, nearest_min_rows=2).median_rent(*parramatta), DEFAULT_MEDIAN_RENT)
+        self.assertEqual(RentReference(rows, nearest_min_rows=1).median_rent(*parramatta), 3200)
+
+    def test_non_finite_coordinates_are_ignored(self):
+        rows = [{"suburb": "Darling Harbour", "lat": "-33.8748", "lon": "151.1987", "median_monthly_rent": "3200"}]
+        reference = RentReference(rows, nearest_min_rows=1)
+        self.assertEqual(reference.median_rent("Parramatta", float("nan"), float("inf")), DEFAULT_MEDIAN_RENT)
+        self.assertEqual(reference.median_rent("Darling Harbour", float("nan"), 151.0), 3200)
+
+
+class AssessmentSubmitValidationTests(TestCase):
+    url = "/api/assessment/submit/"
+
+    def submit(self, data):
+        return self.client.post(self.url, data, content_type="application/json")
+
+    def test_invalid_fields_are_rejected(self):
+        response = self.submit({
+            "full_name": "Invalid",
+            "monthly_rent_budget": "12.345",
+            "lat": "nan",
+            "lon": "inf",
+            "employment_status": "astronaut",
+            "moving_with_adults": "-1",
+            "moving_with_pets": 10 ** 20,
+            "documents": ["passport", "library_card"],
+        })
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()["errors"]), {
+            "monthly_rent_budget", "lat", "lon", "employment_status",
+            "moving_with_adults", "moving_with_pets", "documents",
+        })
+        self.assertFalse(Assessment.objects.exists())
+
+    def test_valid_values_are_coerced(self):
+        response = self.submit({
+            "full_name": "  Valid  ",
+            "monthly_rent_budget": "1200.50",
+            "lat": "-33.87",
+            "lon": 151.2,
+            "moving_with_adults": "2",
+            "moving_with_pets": "",
+            "documents": ["passport", "passport", "medicare"],
+        })
+        self.assertEqual(response.status_code, 200)
+        assessment = Assessment.objects.get()
+        self.assertEqual(assessment.full_name, "Valid")
+        self.assertEqual(assessment.monthly_rent_budget, Decimal("1200.50"))
+        self.assertEqual((assessment.lat, assessment.lon), (-33.87, 151.2))
+        self.assertEqual((assessment.moving_with_adults, assessment.moving_with_pets), (2, 0))
+        self.assertEqual(assessment.documents, ["passport", "medicare"])
+
+
+class DuplicateSubmissionTests(TestCase):
+    url = "/api/assessment/submit/"
+    PROFILE = {
+        "full_name": "Repeat",
+        "monthly_rent_budget": "1200",
+        "employment_status": "full_time",
+        "documents": ["passport", "medicare"],
+    }
+
+    def submit(self, client=None, profile=PROFILE):
+        response = (client or self.client).post(self.url, profile, content_type="application/json")
+        return response.json()["id"]
+
+    def test_resubmission_inside_the_window_returns_the_earlier_result(self):
+        first = self.submit()
+        self.assertEqual(self.submit(), first)
+        self.assertEqual(Assessment.objects.count(), 1)
+
+    def test_resubmission_after_the_window_is_a_new_assessment(self):
+        first = self.submit()
+        Assessment.objects.update(created_at=timezone.now() - timedelta(seconds=601))
+        self.assertNotEqual(self.submit(), first)
+        self.assertEqual(Assessment.objects.count(), 2)
+
+    @override_settings(ASSESSMENT_DUPLICATE_WINDOW_SECONDS=0)
+    def test_window_zero_disables_the_check(self):
+        self.assertNotEqual(self.submit(), self.submit())
+
+    def test_other_sessions_and_users_do_not_match(self):
+        first = self.submit()
+        self.assertNotEqual(self.submit(client=self.client_class()), first)
+
+        alice, bob = self.client_class(), self.client_class()
+        alice.force_login(User.objects.create_user(email="alice@example.com", password="pw"))
+        bob.force_login(User.objects.create_user(email="bob@example.com", password="pw"))
+        self.assertNotEqual(self.submit(client=alice), self.submit(client=bob))
+        self.assertEqual(Assessment.objects.count(), 4)
+
+    def test_content_hash_ignores_key_and_document_order(self):
+        clean, _ = assessment_schema.validate(self.PROFILE)
+        reordered, _ = assessment_schema.validate({
+            "documents": ["medicare", "passport"],
+            "employment_status": "full_time",
+            "monthly_rent_budget": "1200.00",
+            "full_name": "Repeat",
+        })
+        self.assertEqual(content_hash(clean), content_hash(reordered))
+        changed, _ = assessment_schema.validate({**self.PROFILE, "monthly_rent_budget": "1300"})
+        self.assertNotEqual(content_hash(clean), content_hash(changed))
+
+
+class DerivedColumnTests(TestCase):
+
+    def test_time_in_role_too_large_for_the_column_is_stored_as_unknown(self):
+        response = self.client.post("/api/assessment/submit/", {
+            "full_name": "Overflow",
+            "monthly_rent_budget": "1200",
+            "household_income": "90000",
+            "household_income_period": "annual",
+            "employment_status": "full_time",
+            "time_in_role": "99999999999999999999 years",
+            "documents": ["passport"],
+        }, content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(Assessment.objects.get().months_in_role)
+
+
+class AssessmentSimulateTests(TestCase):
+    SPEC = {
+        "monthly_rent_budget": {"min": 1000, "max": 4000, "step": 500},
+        "household_income": [50000, 90000, 150000],
+        "document_count": {"min": 0, "max": 4},
+        "employment_status": ["full_time", "part_time"],
+    }
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="simulate@example.com", password="pw")
+        User.objects.filter(pk=self.user.pk).update(is_premium=True)
+        self.assessment = Assessment.objects.create(
+            user=self.user, session_key="simulate", suburb="Sydney",
+            monthly_rent_budget=3500, household_income=60000, household_income_period="annual",
+            employment_status="part_time", documents=["passport"],
+        )
+        self.client.force_login(self.user)
+        self.url = f"/api/assessment/{self.assessment.id}/simulate/"
+
+    def simulate(self, spec):
+        return self.client.post(self.url, spec, content_type="application/json")
+
+    def scalar_score(self, rent, income, documents, employment):
+        profile = copy.copy(self.assessment)
+        profile.monthly_rent_budget = Decimal(str(rent))
+        profile.household_income = Decimal(str(income))
+        profile.documents = ["passport"] * int(documents)
+        profile.employment_status = employment
+        return score_assessment(profile).score
+
+    def test_grid_matches_the_scalar_scorer(self):
+        data = self.simulate(self.SPEC).json()
+        axes = data["axes"]
+        # The current values (3500 rent, 60000 income, 1 document) are always included.
+        self.assertEqual(axes["monthly_rent_budget"], [1000, 1500, 2000, 2500, 3000, 3500, 4000])
+        self.assertEqual(axes["household_income"], [50000, 60000, 90000, 150000])
+        self.assertEqual(data["scenario_count"], 7 * 4 * 5 * 2)
+        for i, rent in enumerate(axes["monthly_rent_budget"]):
+            for j, income in enumerate(axes["household_income"]):
+                for k, documents in enumerate(axes["document_count"]):
+                    for m, employment in enumerate(axes["employment_status"]):
+                        self.assertEqual(
+                            data["scores"][i][j][k][m],
+                            self.scalar_score(rent, income, documents, employment),
+                        )
+
+    def test_cheapest_change_crosses_the_threshold(self):
+        data = self.simulate(self.SPEC).json()
+        self.assertLess(data["base"]["score"], LOW_RISK_THRESHOLD)
+        low = data["cheapest_changes"]["Low"]
+        self.assertGreaterEqual(low["score"], LOW_RISK_THRESHOLD)
+        inputs = low["inputs"]
+        self.assertEqual(low["score"], self.scalar_score(
+            inputs["monthly_rent_budget"], inputs["household_income"],
+            inputs["document_count"], inputs["employment_status"],
+        ))
+        self.assertTrue(low["changes"])
+        self.assertTrue(all(inputs[name] != data["base"]["inputs"][name] for name in low["changes"]))
+
+    def test_extreme_time_in_role(self):
+        for time_in_role in ("-99999999999999999999999 years", "99999999999999999999999 years"):
+            Assessment.objects.filter(pk=self.assessment.pk).update(time_in_role=time_in_role)
+            self.assessment.time_in_role = time_in_role
+            data = self.simulate(self.SPEC).json()
+            self.assertEqual(data["base"]["score"], score_assessment(self.assessment).score)
+            self.assertEqual(data["scores"][0][0][0][0], self.scalar_score(1000, 50000, 0, "full_time"))
+
+    def test_premium_required(self):
+        User.objects.filter(pk=self.user.pk).update(is_premium=False)
+        self.assertEqual(self.simulate(self.SPEC).status_code, 403)
+
+    def test_bad_input_is_rejected(self):
+        for spec in (
+            {"monthly_rent_budget": {"min": 0, "max": "nan"}},
+            {"monthly_rent_budget": ["nan", 100]},
+            {"household_income": [100, "inf"]},
+            {"monthly_rent_budget": {"min": 0, "max": 1000000, "step": 1}},
+            {"employment_status": ["astronaut"]},
+        ):
+            response = self.simulate(spec)
+            self.assertEqual(response.status_code, 400, spec)
+            self.assertIn("detail", response.json())
+
+
+class ImportAssessmentsTests(TestCase):
+    HEADER = "full_name,monthly_rent_budget,household_income,household_income_period,employment_status,documents,notes\n"
+
+    @staticmethod
+    def row(name, employment="full_time", notes=""):
+        return f"{name},1500,90000,annual,{employment},passport;medicare,{notes}\n"
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.dir = Path(directory.name)
+        self.path = self.dir / "profiles.csv"
+        self.errors = self.dir / "errors.jsonl"
+        self.checkpoint = self.dir / "checkpoint.json"
+
+    def run_import(self):
+        call_command(
+            "import_assessments", str(self.path), "--batch-size", "2",
+            "--errors", str(self.errors), "--checkpoint", str(self.checkpoint), stdout=StringIO(),
+        )
+
+    def test_resume_after_an_interrupted_import(self):
+        good = self.HEADER + self.row("A") + self.row("B") + self.row("C", employment="astronaut")
+        # Row D straddles the reader's first 8 KiB block, so the undecodable
+        # row E stops the import after the first chunk (A, B) committed and
+        # after C was rejected.
+        good += self.row("D", notes="x" * 9000)
+        self.path.write_bytes(good.encode() + b"E\xff,1500,90000,annual,full_time,passport,\n")
+        with self.assertRaises(UnicodeDecodeError):
+            self.run_import()
+        self.assertEqual(json.loads(self.checkpoint.read_text())["rows_done"], 2)
+        self.assertEqual(Assessment.objects.count(), 2)
+
+        self.path.write_text(good + self.row("E"))
+        self.run_import()
+
+        self.assertEqual(sorted(Assessment.objects.values_list("full_name", flat=True)), ["A", "B", "D", "E"])
+        self.assertEqual([json.loads(line)["row"] for line in self.errors.read_text().splitlines()], [3])
+        self.assertFalse(self.checkpoint.exists())
+
+    def test_batch_size_must_be_positive(self):
+        self.path.write_text(self.HEADER + self.row("A"))
+        with self.assertRaises(CommandError):
+            call_command("import_assessments", str(self.path), "--batch-size", "0")
+
+    def test_staff_upload(self):
+        content = self.HEADER + self.row("A") + self.row("B", employment="astronaut")
+        upload = SimpleUploadedFile("profiles.csv", content.encode())
+        staff = User.objects.create_superuser(email="import@example.com", password="pw")
+        self.client.force_login(staff)
+        data = self.client.post("/api/assessment/import/", {"file": upload}).json()
+        self.assertEqual((data["imported"], data["rejected"], data["rows_done"]), (1, 1, 2))
+        self.assertEqual(data["errors"][0]["row"], 2)
+
+        self.client.force_login(User.objects.create_user(email="not-staff@example.com", password="pw"))
+        upload.seek(0)
+        self.assertEqual(self.client.post("/api/assessment/import/", {"file": upload}).status_code, 403)
+
+
+class LocalityIndexTests(SimpleTestCase):
+    GEONAMES = (
+        "AU\t2150\tParramatta\tNew South Wales\tNSW\tParramatta\t\t\t\t-33.8150\t151.0011\t4\n"
+        "AU\t4064\tPaddington\tQueensland\tQLD\tBrisbane\t\t\t\t-27.4598\t152.9999\t4\n"
+        "AU\t2021\tPaddington\tNew South Wales\tNSW\tSydney\t\t\t\t-33.8842\t151.2318\t4\n"
+    )
+
+    def test_build_from_geonames_dump(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = Path(directory) / "AU.zip"
+            with zipfile.ZipFile(source, "w") as archive:
+                archive.writestr("AU.txt", self.GEONAMES)
+                archive.writestr("readme.txt", "GeoNames postal codes")
+            output = Path(directory) / "au_localities.bin"
+            call_command("build_locality_index", "--source", str(source), "--output", str(output), stdout=StringIO())
+
+            index = LocalityIndex.open(output)
+            self.assertEqual(len(index), 3)
+            self.assertEqual(
+                [(r["suburb"], r["state"], r["postcode"]) for r in index.search("paddington qld")],
+                [("Paddington", "QLD", "4064")],
+            )
+            self.assertEqual(index.search("2150")[0]["city"], "Parramatta")
@@ -4,8 +4,15 @@ from . import views
 urlpatterns = [
     path('assessment/', views.AssessmentPageView.as_view(), name='assessment-page'),
     path('api/location-autocomplete/', views.location_autocomplete, name='location-autocomplete'),
+    path('api/location-autocomplete/stats/', views.LocationAutocompleteStatsView.as_view(), name='location-autocomplete-stats'),
     path('api/assessment/submit/', views.AssessmentSubmitView.as_view(), name='assessment-submit'),
+    path('api/assessment/cohorts/', views.CohortStatsView.as_view(), name='assessment-cohorts'),
+    path('api/assessment/scoring-cache/stats/', views.ScoringCacheStatsView.as_view(), name='scoring-cache-stats'),
+    path('api/assessment/score-batch/', views.AssessmentScoreBatchView.as_view(), name='assessment-score-batch'),
+    path('api/assessment/import/', views.AssessmentImportView.as_view(), name='assessment-import'),
     path('api/assessment/claim-latest/', views.ClaimLatestAssessmentView.as_view(), name='assessment-claim-latest'),
     path("api/assessment/list/", views.AssessmentListAPIView.as_view(), name="assessment-list"),
     path("api/assessment/<int:pk>/", views.AssessmentDetailAPIView.as_view(), name="assessment-detail"),
+    path("api/assessment/<int:pk>/enrichment/", views.AssessmentEnrichmentView.as_view(), name="assessment-enrichment"),
+    path("api/assessment/<int:pk>/simulate/", views.AssessmentSimulateView.as_view(), name="assessment-simulate"),
 ]
\ No newline at end of file
@@ -0,0 +1,226 @@
+"""
+NumPy form of the scoring rules in ``assessments.scoring``.
+
+Scores a whole chunk of profiles at once. Feature extraction reuses the
+scalar ``extract_features`` so both paths read inputs identically; only the
+rule evaluation and score arithmetic are vectorized.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from .scoring import (
+    AFFORDABLE_RENT_RATIO,
+    CONTEXT_ISSUES_PENALTY,
+    LOW_RISK_THRESHOLD,
+    MAX_HOUSEHOLD_PEOPLE,
+    MAX_HOUSEHOLD_PETS,
+    MAX_MONTHS_IN_ROLE,
+    MEDIUM_RISK_THRESHOLD,
+    POINTS_PER_DOCUMENT,
+    POSITIVE_RENTAL_HISTORY,
+    RULES,
+    STABLE_EMPLOYMENT,
+    TENURED_MONTHS,
+    TOTAL_POSSIBLE,
+    extract_features,
+)
+
+
+# Assessment fields the scoring rules read.
+FEATURE_FIELDS = (
+    "monthly_rent_budget",
+    "suburb",
+    "lat",
+    "lon",
+    "employment_status",
+    "time_in_role",
+    "rental_history",
+    "household_income",
+    "household_income_period",
+    "documents",
+    "proof_of_income",
+    "moving_with_adults",
+    "moving_with_children",
+    "moving_with_pets",
+    "context_issues",
+)
+
+BatchScores = namedtuple("BatchScores", [
+    "score", "risk_level", "category_scores", "strengths", "weaknesses", "rule_points",
+])
+
+
+class _Row(dict):
+    """Attribute access over a ``.values()`` dict; absent fields read as None."""
+    __getattr__ = dict.get
+
+
+def clamp_months(months):
+    """
+    Months in role as an int64-safe value, -1 when unknown. Only ever
+    compared against TENURED_MONTHS, so clamping absurd inputs of either
+    sign leaves the outcome unchanged.
+    """
+    if months is None:
+        return -1
+    return max(-1, min(months, MAX_MONTHS_IN_ROLE))
+
+
+def rows_to_arrays(rows):
+    """Turn dicts keyed by Assessment field names into feature arrays."""
+    features = [extract_features(_Row(row)) for row in rows]
+    if not features:
+        columns = [()] * 11
+    else:
+        columns = list(zip(*features))
+
+    (monthly_budget, median_rent, employment_status, months_in_role,
+     rental_history, annual_income, document_count, proof_of_income,
+     household_people, pets, has_context_issues) = columns
+
+    months = np.array([clamp_months(m) for m in months_in_role], dtype=np.int64)
+
+    return {
+        "monthly_budget": np.array(monthly_budget, dtype=np.float64),
+        "median_rent": np.array(median_rent, dtype=np.float64),
+        "stable_employment": np.array([e in STABLE_EMPLOYMENT for e in employment_status], dtype=bool),
+        "months_in_role": months,
+        "tenure_missing": np.array([m is None for m in months_in_role], dtype=bool),
+        "positive_rental_history": np.array([r in POSITIVE_RENTAL_HISTORY for r in rental_history], dtype=bool),
+        "annual_income": np.array(annual_income, dtype=np.float64),
+        "document_count": np.array(document_count, dtype=np.int64),
+        "no_proof_of_income": np.array([p == "none" for p in proof_of_income], dtype=bool),
+        "household_people": np.array(household_people, dtype=np.int64),
+        "pets": np.array(pets, dtype=np.int64),
+        "has_context_issues": np.array(has_context_issues, dtype=bool),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Vector rule evaluators: (points array, missing mask or None)
+# ---------------------------------------------------------------------------
+
+def _budget(f, max_points):
+    return np.where(f["monthly_budget"] >= f["median_rent"], max_points, 0), None
+
+
+def _employment(f, max_points):
+    return np.where(f["stable_employment"], max_points, 0), None
+
+
+def _tenure(f, max_points):
+    missing = f["tenure_missing"]
+    tenured = ~missing & (f["months_in_role"] >= TENURED_MONTHS)
+    return np.where(tenured, max_points, 0), missing
+
+
+def _rental_history(f, max_points):
+    return np.where(f["positive_rental_history"], max_points, 0), None
+
+
+def _income(f, max_points):
+    budget = f["monthly_budget"]
+    annual = f["annual_income"]
+    missing = (annual <= 0) | (budget <= 0)
+    monthly_income = annual / 12
+    rent_ratio = np.divide(budget, monthly_income, out=np.ones_like(budget), where=~missing)
+    affordable = ~missing & (rent_ratio <= AFFORDABLE_RENT_RATIO)
+    return np.where(affordable, max_points, 0), missing
+
+
+def _documents(f, max_points):
+    return np.minimum(f["document_count"] * POINTS_PER_DOCUMENT, max_points), None
+
+
+def _proof_of_income(f, max_points):
+    return np.where(f["no_proof_of_income"], 0, max_points), None
+
+
+def _household(f, max_points):
+    manageable = (f["household_people"] <= MAX_HOUSEHOLD_PEOPLE) & (f["pets"] <= MAX_HOUSEHOLD_PETS)
+    return np.where(manageable, max_points, 0), None
+
+
+def _context_issues(f, max_points):
+    return np.where(f["has_context_issues"], -CONTEXT_ISSUES_PENALTY, 0), None
+
+
+VECTOR_RULES = {
+    "budget": _budget,
+    "employment": _employment,
+    "tenure": _tenure,
+    "rental_history": _rental_history,
+    "income": _income,
+    "documents": _documents,
+    "proof_of_income": _proof_of_income,
+    "household": _household,
+    "context_issues": _context_issues,
+}
+
+assert set(VECTOR_RULES) == {r.key for r in RULES}, "vector rules out of sync with scoring.RULES"
+
+
+def risk_levels(scores):
+    return np.select(
+        [scores >= LOW_RISK_THRESHOLD, scores >= MEDIUM_RISK_THRESHOLD],
+        ["Low", "Medium"],
+        default="High",
+    )
+
+
+def score_arrays(features, messages=False):
+    """
+    Score every profile in ``features`` (see ``rows_to_arrays``) in one pass.
+
+    With ``messages=True`` the per-row strengths/weaknesses lists are built
+    too; they are the only part that needs a Python loop over rows.
+    """
+    size = len(features["monthly_budget"])
+    earned = np.zeros(size, dtype=np.int64)
+    category_scores = {}
+    rule_points = {}
+    outcomes = []
+
+    for rule in RULES:
+        points, missing = VECTOR_RULES[rule.key](features, rule.max_points)
+        points = np.broadcast_to(points, (size,))
+        if missing is not None:
+            points = np.where(missing, 0, points)
+        earned += points
+        rule_points[rule.key] = points
+
+        if rule.category:
+            category_scores[rule.category] = ((points / rule.max_points) * 100).astype(np.int64)
+
+        if messages:
+            outcomes.append((rule, points, missing))
+
+    score = ((earned / TOTAL_POSSIBLE) * 100).astype(np.int64)
+    score = np.clip(score, 0, 100)
+
+    strengths = weaknesses = None
+    if messages:
+        strengths = [[] for _ in range(size)]
+        weaknesses = [[] for _ in range(size)]
+        for rule, points, missing in outcomes:
+            strong = points >= rule.strong_at
+            if missing is not None:
+                strong &= ~missing
+                if rule.missing:
+                    for i in np.flatnonzero(missing):
+                        weaknesses[i].append(rule.missing)
+                weak = ~strong & ~missing
+            else:
+                weak = ~strong
+            if rule.strength:
+                for i in np.flatnonzero(strong):
+                    strengths[i].append(rule.strength)
+            for i in np.flatnonzero(weak):
+                weaknesses[i].append(rule.weakness)
+
+    return BatchScores(score, risk_levels(score), category_scores, strengths, weaknesses, rule_points)
+
+
+def score_rows(rows, messages=False):
+    return score_arrays(rows_to_arrays(rows), messages=messages)
@@ -1,28 +1,70 @@
-import re
-import requests
-from decimal import Decimal, InvalidOperation
+import time
+from datetime import datetime, timedelta
 
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Q, Sum
 from django.http import JsonResponse
+from django.utils import timezone
 from django.views.generic import TemplateView
 from rest_framework import status
-from rest_framework.authentication import SessionAuthentication
+from rest_framework.authentication import SessionAuthentication, TokenAuthentication
+from rest_framework.exceptions import ValidationError
 from rest_framework.generics import ListAPIView, RetrieveAPIView
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.parsers import JSONParser, MultiPartParser
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import Assessment
+from .models import Assessment, CohortStat
 from .serializers import AssessmentSerializer
-from .gap_analysis import generate_gap_analysis
+from .aggregates import record_score_change
+from .enrichment import DONE, schedule_enrichment
+from .geocoding import autocomplete_cache, cached_geoapify_autocomplete
+from .importer import FORMATS as IMPORT_FORMATS, detect_format, import_records, iter_records
+from .localities import get_locality_index
+from .pagination import CreatedAtCursorPagination
+from .parsers import JSONLinesParser, JSONLParser
+from .schema import assessment_schema, content_hash
+from .scoring_cache import evaluate_assessment, scoring_cache
+from .simulation import SimulationError, simulate
+from .vectorized import score_rows
+
+User = get_user_model()
 
 
 class AssessmentListAPIView(ListAPIView):
+    """
+    A user's assessments, newest first, a page at a time. ``?fields=a,b``
+    picks the columns to load and return; the default is a slim summary
+    that leaves the JSON blobs in the database.
+    """
     serializer_class = AssessmentSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
+
+    SUMMARY_FIELDS = (
+        "id", "full_name", "created_at", "suburb", "postcode",
+        "readiness_score", "risk_level", "enrichment_status",
+    )
+
+    def get_fields(self):
+        requested = self.request.query_params.get("fields")
+        if not requested:
+            return self.SUMMARY_FIELDS
+        fields = [name.strip() for name in requested.split(",") if name.strip()]
+        known = {field.name for field in Assessment._meta.concrete_fields}
+        unknown = [name for name in fields if name not in known]
+        if unknown:
+            raise ValidationError({"fields": f"Unknown field(s): {', '.join(unknown)}."})
+        return fields
 
     def get_queryset(self):
-        return Assessment.objects.filter(user=self.request.user).order_by("-created_at")
+        return Assessment.objects.filter(user=self.request.user).only(*self.get_fields())
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault("fields", self.get_fields())
+        return super().get_serializer(*args, **kwargs)
 
 
 class AssessmentDetailAPIView(RetrieveAPIView):
@@ -49,58 +91,107 @@ def location_autocomplete(request):
     if not query or len(query) < 2:
         return JsonResponse([], safe=False)
 
-    url = "https://api.geoapify.com/v1/geocode/autocomplete"
-    params = {
-        "text": query,
-        "limit": 8,
-        "format": "json",
-        "filter": "countrycode:au",
-        "apiKey": settings.GEOAPIFY_API_KEY
-    }
-
-    try:
-        response = requests.get(url, params=params, timeout=5)
-        data = response.json()
-    except Exception:
-        return JsonResponse([], safe=False)
-
-    STATE_MAP = {
-        "New South Wales": "NSW",
-        "Victoria": "VIC",
-        "Queensland": "QLD",
-        "South Australia": "SA",
-        "Western Australia": "WA",
-        "Tasmania": "TAS",
-        "Northern Territory": "NT",
-        "Australian Capital Territory": "ACT",
-    }
-
-    results = []
-    for item in data.get("results", []):
-        postcode = item.get("postcode")
-        city = item.get("city") or ""
-        state = item.get("state") or ""
-        suburb = item.get("suburb") or item.get("district") or item.get("neighbourhood") or ""
-        lat = item.get("lat")
-        lon = item.get("lon")
-        state_short = STATE_MAP.get(state, state)
-        location_name = suburb if suburb else city
-        if not location_name:
-            continue
-        label = f"{location_name} {state_short} {postcode or ''}".strip()
-        results.append({
-            "label": label,
-            "postcode": postcode,
-            "city": city,
-            "state": state_short,
-            "suburb": suburb,
-            "lat": lat,
-            "lon": lon
-        })
+    # Served from the in-process suburb/postcode index; Geoapify is only
+    # consulted for queries the bundled dataset doesn't cover.
+    results = get_locality_index().search(query, limit=8)
+    if not results and settings.GEOAPIFY_API_KEY:
+        results = cached_geoapify_autocomplete(query)
 
     return JsonResponse(results, safe=False)
 
 
+class LocationAutocompleteStatsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(autocomplete_cache.stats())
+
+
+class ScoringCacheStatsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(scoring_cache.stats())
+
+
+class CohortStatsView(APIView):
+    """
+    Staff read API over the pre-aggregated cohort_stats table.
+
+    ``?group_by=`` any of month, employment_status, rental_history, postcode
+    (comma separated); filters: ``from``/``to`` (YYYY-MM), employment_status,
+    rental_history, postcode.
+    """
+    permission_classes = [IsAdminUser]
+
+    DIMENSIONS = ("month", "employment_status", "rental_history", "postcode")
+    TOTALS = ("count", "score_total", "score_sq_total", "low_count", "medium_count", "high_count")
+
+    def get(self, request):
+        params = request.query_params
+        group_by = [d for d in params.get("group_by", "").split(",") if d]
+        unknown = [d for d in group_by if d not in self.DIMENSIONS]
+        if unknown:
+            return Response(
+                {"detail": f"Unknown group_by dimension(s): {', '.join(unknown)}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        queryset = CohortStat.objects.all()
+        for name in ("employment_status", "rental_history", "postcode"):
+            if name in params:
+                queryset = queryset.filter(**{name: params[name]})
+        try:
+            if params.get("from"):
+                queryset = queryset.filter(month__gte=datetime.strptime(params["from"], "%Y-%m").date())
+            if params.get("to"):
+                queryset = queryset.filter(month__lte=datetime.strptime(params["to"], "%Y-%m").date())
+        except ValueError:
+            return Response({"detail": "from/to must be YYYY-MM."}, status=status.HTTP_400_BAD_REQUEST)
+
+        sums = {name: Sum(name) for name in self.TOTALS}
+        if group_by:
+            rows = queryset.values(*group_by).annotate(**sums).order_by(*group_by)
+        else:
+            rows = [queryset.aggregate(**sums)]
+
+        results = []
+        for row in rows:
+            count = row["count"] or 0
+            if not count:
+                continue
+            mean = row["score_total"] / count
+            variance = max(row["score_sq_total"] / count - mean * mean, 0)
+            results.append({
+                **{name: row[name] for name in group_by},
+                "count": count,
+                "mean_score": round(mean, 2),
+                "stddev": round(variance ** 0.5, 2),
+                "risk": {
+                    "Low": row["low_count"],
+                    "Medium": row["medium_count"],
+                    "High": row["high_count"],
+                },
+            })
+
+        return Response({"group_by": group_by, "results": results})
+
+
+def find_recent_duplicate(digest, session_key, user):
+    window = settings.ASSESSMENT_DUPLICATE_WINDOW_SECONDS
+    if not window:
+        return None
+    owner = Q(session_key=session_key)
+    if user.is_authenticated:
+        owner |= Q(user=user)
+    return (
+        Assessment.objects
+        .filter(owner, content_hash=digest, created_at__gte=timezone.now() - timedelta(seconds=window))
+        .order_by("-created_at")
+        .first()
+    )
+
+
 class AssessmentSubmitView(APIView):
     authentication_classes = [SessionAuthentication]
     permission_classes = [AllowAny]
@@ -126,230 +217,242 @@ class AssessmentSubmitView(APIView):
             else:
                 data[key] = value
 
-        # Only allow valid model fields
-        allowed_fields = {field.name for field in Assessment._meta.fields}
-        clean_data = {k: v for k, v in data.items() if k in allowed_fields}
+        # ---- Validate ----
+        clean_data, errors = assessment_schema.validate(data)
+        if errors:
+            return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        # ---- Resubmission of the same form: return the earlier result ----
+        digest = content_hash(clean_data)
+        duplicate = find_recent_duplicate(digest, session_key, request.user)
+        if duplicate is not None:
+            return Response(AssessmentSerializer(duplicate).data, status=status.HTTP_200_OK)
+
         clean_data["session_key"] = session_key
+        clean_data["content_hash"] = digest
         if request.user.is_authenticated:
             clean_data["user"] = request.user
 
-        # ---- Sanitize numeric fields ----
-        decimal_fields = ["monthly_rent_budget", "household_income", "individual_income"]
-        float_fields = ["lat", "lon"]
-        int_fields = ["moving_with_adults", "moving_with_children", "moving_with_pets"]
+        # ---- Score, then persist in a single INSERT ----
+        assessment = Assessment(**clean_data)
+        result = evaluate_assessment(assessment).result
+        assessment.readiness_score = result.score
+        assessment.risk_level = result.risk_level
+        assessment.strengths = result.strengths
+        assessment.weaknesses = result.weaknesses
+        assessment.save(force_insert=True)
+        record_score_change(assessment, None, assessment.readiness_score)
 
-        for field in decimal_fields:
-            value = clean_data.get(field)
-            if value in [None, "", "null"]:
-                clean_data[field] = None
-                continue
-            try:
-                cleaned = str(value).strip()
-                if not re.match(r"^\d+(\.\d{1,2})?$", cleaned):
-                    clean_data[field] = None
-                    continue
-                clean_data[field] = Decimal(cleaned)
-            except (InvalidOperation, ValueError, TypeError):
-                clean_data[field] = None
-
-        for field in float_fields:
-            value = clean_data.get(field)
-            try:
-                if value not in [None, "", "null"]:
-                    clean_data[field] = float(str(value).strip())
-                else:
-                    clean_data[field] = None
-            except (ValueError, TypeError):
-                clean_data[field] = None
-
-        for field in int_fields:
-            value = clean_data.get(field)
-            try:
-                if value not in [None, "", "null"]:
-                    clean_data[field] = int(str(value).strip())
-                else:
-                    clean_data[field] = 0
-            except (ValueError, TypeError):
-                clean_data[field] = 0
-
-        # ---- Create assessment ----
-        assessment = Assessment.objects.create(**clean_data)
-
-        # ---- Scoring ----
-        earned_points = 0
-        total_possible = 0
-        strengths = []
-        weaknesses = []
-        category_scores = {}
-
-        # 1️⃣ Budget vs location
-        budget_points = 0
-        budget_max = 20
+        # Gap analysis/recommendations are filled in after the response;
+        # clients poll the enrichment endpoint for them.
+        schedule_enrichment(assessment.id)
+
+        serializer = AssessmentSerializer(assessment)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class AssessmentEnrichmentView(APIView):
+    """Poll target for the deferred gap analysis of a submitted assessment."""
+    authentication_classes = [SessionAuthentication]
+    permission_classes = [AllowAny]
+
+    def get(self, request, pk):
+        assessment = (
+            Assessment.objects
+            .filter(pk=pk)
+            .only(
+                "user_id", "session_key", "enrichment_status", "enriched_at",
+                "gap_analysis", "recommendations"
+            )
+            .first()
+        )
+        if assessment is None:
+            return Response({"detail": "Assessment not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        user_id = request.user.id if request.user.is_authenticated else None
+        owns = user_id is not None and assessment.user_id == user_id
+        if not owns and assessment.session_key != request.session.session_key:
+            return Response(
+                {"detail": "You do not have access to this assessment."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        data = {"id": assessment.id, "enrichment_status": assessment.enrichment_status}
+        if assessment.enrichment_status == DONE:
+            data["enriched_at"] = assessment.enriched_at
+            data["gap_analysis"] = assessment.gap_analysis
+            data["recommendations"] = assessment.recommendations
+        return Response(data, status=status.HTTP_200_OK)
+
+
+class AssessmentSimulateView(APIView):
+    """
+    What-if scores for a premium user's assessment over ranges of rent
+    budget, income, document count and employment. Nothing is saved.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk):
+        if not getattr(request.user, "is_premium", False):
+            return Response(
+                {"detail": "Premium required.", "is_premium": False},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        assessment = Assessment.objects.filter(pk=pk, user=request.user).first()
+        if assessment is None:
+            return Response({"detail": "Assessment not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        if not isinstance(request.data, dict):
+            return Response({"detail": "Expected a JSON object."}, status=status.HTTP_400_BAD_REQUEST)
+
+        started = time.perf_counter()
         try:
-            monthly_budget = float(assessment.monthly_rent_budget or 0)
-            suburb_median_rent = {
-                "Sydney CBD": 3000, "Darling Harbour": 3200, "The Rocks": 3100,
-                "Melbourne CBD": 2500, "Docklands": 2400, "Southbank": 2600,
-                "Brisbane CBD": 2000, "Fortitude Valley": 2100,
-            }
-            median_rent = suburb_median_rent.get(assessment.suburb or "", 2500)
-            # Fixed: budget must be >= median to be sufficient
-            if monthly_budget >= median_rent:
-                budget_points = 20
-                strengths.append("Budget aligns with desired suburb")
-            else:
-                weaknesses.append("Budget may be insufficient for typical rent in this suburb")
-        except (ValueError, TypeError):
-            weaknesses.append("Budget not provided")
-        earned_points += budget_points
-        total_possible += budget_max
-        category_scores["budget"] = int((budget_points / budget_max) * 100)
-
-        # 2️⃣ Employment
-        employment_points = 0
-        employment_max = 20
-        if assessment.employment_status in ["full_time", "self_employed"]:
-            employment_points = 20
-            strengths.append("Stable employment")
-        else:
-            weaknesses.append("Employment stability could be improved")
-        earned_points += employment_points
-        total_possible += employment_max
-        category_scores["employment"] = int((employment_points / employment_max) * 100)
-
-        # 3️⃣ Time in role
-        tenure_points = 0
-        tenure_max = 5
+            result = simulate(assessment, request.data)
+        except SimulationError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        response = Response({"assessment_id": assessment.id, **result}, status=status.HTTP_200_OK)
+        response["Server-Timing"] = f"simulate;dur={elapsed_ms:.2f}"
+        return response
+
+
+class AssessmentImportView(APIView):
+    """
+    Staff upload of a CSV/JSONL file of profiles (multipart field ``file``),
+    streamed through the same importer as ``manage.py import_assessments``.
+    Re-upload with ``start_row`` set to the returned ``rows_done`` to resume
+    an interrupted import.
+    """
+    permission_classes = [IsAdminUser]
+    parser_classes = [MultiPartParser]
+    MAX_RETURNED_ERRORS = 100
+
+    def post(self, request):
+        upload = request.FILES.get("file")
+        if upload is None:
+            return Response({"detail": "Upload a CSV or JSONL file as 'file'."}, status=status.HTTP_400_BAD_REQUEST)
+
+        fmt = request.data.get("format") or detect_format(upload.name)
+        if fmt not in IMPORT_FORMATS:
+            return Response({"detail": f"format must be one of {', '.join(IMPORT_FORMATS)}."}, status=status.HTTP_400_BAD_REQUEST)
         try:
-            parts = (assessment.time_in_role or "").split()
-            number = int(parts[0])
-            unit = parts[1].lower() if len(parts) > 1 else "months"
-            if "year" in unit:
-                months_in_role = number * 12
-            elif "week" in unit:
-                months_in_role = max(1, number // 4)
-            else:
-                months_in_role = number
-            if months_in_role >= 12:
-                tenure_points = 5
-                strengths.append("Tenured in current role")
+            batch_size = max(1, int(request.data.get("batch_size") or 1000))
+            start_row = max(0, int(request.data.get("start_row") or 0))
+        except ValueError:
+            return Response({"detail": "batch_size and start_row must be integers."}, status=status.HTTP_400_BAD_REQUEST)
+
+        owner = None
+        if request.data.get("user_email"):
+            owner = User.objects.filter(email=request.data["user_email"]).first()
+            if owner is None:
+                return Response({"detail": "No user with that email."}, status=status.HTTP_400_BAD_REQUEST)
+
+        errors = []
+
+        def on_error(row_number, record, row_errors):
+            if len(errors) < self.MAX_RETURNED_ERRORS:
+                errors.append({"row": row_number, "errors": row_errors})
+
+        progress = {"rows_done": start_row}
+
+        def on_commit(rows_done, stats):
+            progress["rows_done"] = rows_done
+
+        upload.seek(0)
+        stats = import_records(
+            iter_records(upload.file, fmt),
+            session_key=f"import:{upload.name}"[:100],
+            owner=owner,
+            batch_size=batch_size,
+            start_row=start_row,
+            on_error=on_error,
+            on_commit=on_commit,
+        )
+
+        seconds = stats["elapsed_ms"] / 1000
+        return Response({
+            "read": stats["read"],
+            "imported": stats["imported"],
+            "rejected": stats["rejected"],
+            "rows_done": progress["rows_done"],
+            "rows_per_second": round(stats["read"] / seconds) if seconds else None,
+            "elapsed_ms": stats["elapsed_ms"],
+            "errors": errors,
+        }, status=status.HTTP_200_OK)
+
+
+class AssessmentScoreBatchView(APIView):
+    """
+    Stateless scoring for partner agencies: no sessions, no Assessment rows.
+    Accepts a JSON array or a JSONL body of profiles and scores the whole
+    batch in one vectorized pass. Profiles that fail validation come back
+    with their field errors instead of a score.
+    """
+    authentication_classes = [SessionAuthentication, TokenAuthentication]
+    permission_classes = [IsAuthenticated]
+    parser_classes = [JSONParser, JSONLinesParser, JSONLParser]
+
+    def post(self, request):
+        profiles = request.data
+        if not isinstance(profiles, list):
+            return Response(
+                {"detail": "Expected a JSON array or JSONL body of profiles."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        max_size = settings.ASSESSMENT_SCORE_BATCH_MAX_SIZE
+        if len(profiles) > max_size:
+            return Response(
+                {"detail": f"Batch too large: {len(profiles)} profiles (maximum {max_size})."},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+            )
+
+        started = time.perf_counter()
+
+        rows = []
+        valid = []
+        errors = {}
+        for index, profile in enumerate(profiles):
+            if not isinstance(profile, dict):
+                return Response(
+                    {"detail": f"Profile at index {index} is not an object."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            clean_data, profile_errors = assessment_schema.validate(profile)
+            if profile_errors:
+                errors[index] = profile_errors
             else:
-                weaknesses.append("Short tenure in current role")
-        except (ValueError, IndexError):
-            weaknesses.append("Time in role not provided")
-        earned_points += tenure_points
-        total_possible += tenure_max
-        # No category score for tenure (optional)
-
-        # 4️⃣ Rental history
-        rental_points = 0
-        rental_max = 10
-        if assessment.rental_history in ["rented_locally", "owned_home"]:
-            rental_points = 10
-            strengths.append("Positive rental history")
-        else:
-            weaknesses.append("Limited rental history")
-        earned_points += rental_points
-        total_possible += rental_max
-        category_scores["rental_history"] = int((rental_points / rental_max) * 100)
-
-        # 5️⃣ Income vs rent
-        income_points = 0
-        income_max = 20
-        try:
-            household_income_annual = float(assessment.household_income or 0)
-            if assessment.household_income_period == "monthly":
-                household_income_annual *= 12
-            elif assessment.household_income_period == "weekly":
-                household_income_annual *= 52
-            monthly_rent = float(assessment.monthly_rent_budget or 0)
-            if household_income_annual > 0 and monthly_rent > 0:
-                rent_ratio = monthly_rent / (household_income_annual / 12)
-                if rent_ratio <= 0.3:
-                    income_points = 20
-                    strengths.append("Affordable rent relative to income")
-                else:
-                    weaknesses.append("Rent is high relative to income")
-        except (ValueError, TypeError):
-            weaknesses.append("Income information incomplete")
-        earned_points += income_points
-        total_possible += income_max
-        category_scores["income"] = int((income_points / income_max) * 100)
-
-        # 6️⃣ Documents
-        docs_points = 0
-        docs_max = 20
-        num_docs = len(assessment.documents) if isinstance(assessment.documents, list) else 0
-        docs_points = min(num_docs * 5, 20)
-        if num_docs >= 3:
-            strengths.append("Well-prepared documents")
-        else:
-            weaknesses.append("Insufficient documents for application")
-        earned_points += docs_points
-        total_possible += docs_max
-        category_scores["documents"] = int((docs_points / docs_max) * 100)
-
-        # 7️⃣ Proof of income
-        proof_points = 0
-        proof_max = 5
-        if (assessment.proof_of_income or "").lower() != "none":
-            proof_points = 5
-            strengths.append("Proof of income provided")
-        else:
-            weaknesses.append("No proof of income provided")
-        earned_points += proof_points
-        total_possible += proof_max
-
-        # 8️⃣ Household composition
-        household_points = 0
-        household_max = 5
-        adults = assessment.moving_with_adults or 0
-        children = assessment.moving_with_children or 0
-        pets = assessment.moving_with_pets or 0
-        total_people = adults + children
-        if total_people <= 4 and pets <= 2:
-            household_points = 5
-            strengths.append("Household size manageable")
-        else:
-            weaknesses.append("Household size may impact readiness")
-        earned_points += household_points
-        total_possible += household_max
-        category_scores["household"] = int((household_points / household_max) * 100)
-
-        # Context issues penalty
-        if assessment.context_issues not in [None, "", "None"]:
-            weaknesses.append("History/context issues reported")
-            earned_points -= 5
-
-        # Final score (capped 0-100)
-        score = int((earned_points / total_possible) * 100) if total_possible > 0 else 0
-        score = max(0, min(score, 100))
-
-        # Risk level
-        if score >= 70:
-            risk_level = "Low"
-        elif score >= 40:
-            risk_level = "Medium"
-        else:
-            risk_level = "High"
-
-        # Gap analysis
-        gaps, recommendations = generate_gap_analysis(assessment, category_scores)
-
-        # Save results
-        assessment.readiness_score = score
-        assessment.risk_level = risk_level
-        assessment.strengths = strengths
-        assessment.weaknesses = weaknesses
-        assessment.gap_analysis = gaps
-        assessment.recommendations = recommendations
-        assessment.save(update_fields=[
-            "readiness_score", "risk_level", "strengths", "weaknesses",
-            "gap_analysis", "recommendations"
-        ])
+                rows.append(clean_data)
+                valid.append(index)
+
+        batch = score_rows(rows)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        results = [
+            {"index": index, "reference": profile.get("reference"), "errors": errors[index]}
+            if index in errors else None
+            for index, profile in enumerate(profiles)
+        ]
+        categories = list(batch.category_scores)
+        for position, index in enumerate(valid):
+            results[index] = {
+                "index": index,
+                "reference": profiles[index].get("reference"),
+                "readiness_score": int(batch.score[position]),
+                "risk_level": str(batch.risk_level[position]),
+                "category_scores": {
+                    category: int(batch.category_scores[category][position])
+                    for category in categories
+                },
+            }
 
-        serializer = AssessmentSerializer(assessment)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        response = Response({"count": len(results), "results": results}, status=status.HTTP_200_OK)
+        response["X-Batch-Size"] = str(len(results))
+        response["X-Scoring-Time-Ms"] = f"{elapsed_ms:.2f}"
+        response["Server-Timing"] = f"score;dur={elapsed_ms:.2f}"
+        return response
 
 
 class ClaimLatestAssessmentView(APIView):
@@ -133,6 +133,19 @@ else:
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# The readiness response cache is invalidated by bumping per-user version
+# keys, so every worker process must see the same backend: a per-process
+# cache (LocMemCache) would keep serving stale responses from the workers
+# that didn't handle the write. Defaults to the database cache (run
+# ``manage.py createcachetable``); set CACHE_BACKEND/CACHE_LOCATION for
+# e.g. django.core.cache.backends.redis.RedisCache.
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.db.DatabaseCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "django_cache"),
+    }
+}
+
 
 
 # AUTH
@@ -163,6 +176,63 @@ REST_FRAMEWORK = {
 
 
 
+# ASSESSMENTS
+ASSESSMENT_SCORE_BATCH_MAX_SIZE = int(os.getenv("ASSESSMENT_SCORE_BATCH_MAX_SIZE", "500"))
+
+# Gap analysis/recommendations run on a per-process thread pool after submit.
+# Set ASSESSMENT_ENRICHMENT_ASYNC=False to run them inline on commit instead.
+ASSESSMENT_ENRICHMENT_ASYNC = os.getenv("ASSESSMENT_ENRICHMENT_ASYNC", "True") == "True"
+ASSESSMENT_ENRICHMENT_WORKERS = int(os.getenv("ASSESSMENT_ENRICHMENT_WORKERS", "2"))
+
+# purge_anonymous_assessments: unclaimed anonymous assessments older than
+# this are archived (gzipped JSONL) to ASSESSMENT_ARCHIVE_DIR and deleted.
+ANONYMOUS_ASSESSMENT_RETENTION_DAYS = int(os.getenv("ANONYMOUS_ASSESSMENT_RETENTION_DAYS", "90"))
+ASSESSMENT_ARCHIVE_DIR = os.getenv("ASSESSMENT_ARCHIVE_DIR", str(BASE_DIR / "archive" / "assessments"))
+
+# An identical submission from the same session/user within this many seconds
+# returns the earlier assessment instead of creating a new one (0 disables).
+ASSESSMENT_DUPLICATE_WINDOW_SECONDS = int(os.getenv("ASSESSMENT_DUPLICATE_WINDOW_SECONDS", "600"))
+
+# Default page size for /api/assessment/list/ (?page_size= up to 100).
+ASSESSMENT_LIST_PAGE_SIZE = int(os.getenv("ASSESSMENT_LIST_PAGE_SIZE", "20"))
+
+# Memoized score + gap analysis per discretized profile signature (per process).
+SCORING_CACHE_MAX_ENTRIES = int(os.getenv("SCORING_CACHE_MAX_ENTRIES", "4096"))
+
+# Upper bound on the what-if grid size for /api/assessment/<id>/simulate/.
+ASSESSMENT_SIMULATION_MAX_SCENARIOS = int(os.getenv("ASSESSMENT_SIMULATION_MAX_SCENARIOS", "10000"))
+
+# Suburb/postcode percentiles are only shown once this many applicants back them.
+COMPETITIVENESS_MIN_SAMPLE = int(os.getenv("COMPETITIVENESS_MIN_SAMPLE", "30"))
+
+# Cached /api/free-readiness/ and /api/detailed-readiness/ responses expire
+# after this many seconds even without a write (percentiles, "days ago").
+READINESS_CACHE_TTL = int(os.getenv("READINESS_CACHE_TTL", "300"))
+
+# Geoapify fallback cache (per worker process). Empty results are cached
+# for the shorter negative TTL.
+GEOAPIFY_CACHE_MAX_ENTRIES = int(os.getenv("GEOAPIFY_CACHE_MAX_ENTRIES", "5000"))
+GEOAPIFY_CACHE_TTL = int(os.getenv("GEOAPIFY_CACHE_TTL", "86400"))
+GEOAPIFY_NEGATIVE_CACHE_TTL = int(os.getenv("GEOAPIFY_NEGATIVE_CACHE_TTL", "3600"))
+
+# suburb,state,postcode,lat,lon,median_monthly_rent CSV used for scoring.
+RENT_REFERENCE_PATH = os.getenv(
+    "RENT_REFERENCE_PATH",
+    str(BASE_DIR / "assessments" / "data" / "median_rents.csv"),
+)
+
+# Unknown suburbs fall back to the nearest reference suburb by lat/lon only
+# when the dataset has at least this many rows; the bundled placeholder does not.
+RENT_REFERENCE_NEAREST_MIN_ROWS = int(os.getenv("RENT_REFERENCE_NEAREST_MIN_ROWS", "1000"))
+
+# Built by `manage.py build_locality_index`; memory-mapped by every worker.
+AU_LOCALITIES_INDEX_PATH = os.getenv(
+    "AU_LOCALITIES_INDEX_PATH",
+    str(BASE_DIR / "assessments" / "data" / "au_localities.bin"),
+)
+
+
+
 # STATIC & MEDIA FILES
 STATIC_URL  = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
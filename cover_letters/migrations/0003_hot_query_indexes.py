@@ -0,0 +1,19 @@
+# Generated by Django 6.0.2 on 2026-10-18 07:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cover_letters', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='coverletter',
+            index=models.Index(fields=['user', '-created_at'], name='coverletter_user_recent_idx'),
+        ),
+    ]
@@ -73,6 +73,9 @@ class CoverLetter(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["user", "-created_at"], name="coverletter_user_recent_idx")
+        ]
 
     def __str__(self):
         return f"{self.user.email} - CoverLetter #{self.id}"
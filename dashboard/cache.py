@@ -0,0 +1,79 @@
+"""
+Versioned per-user cache for the readiness APIs.
+
+Responses are stored under ``readiness:<user>:<version>:<variant>``. Any write
+that can change a user's readiness output (see dashboard.signals) bumps the
+user's version once the transaction commits, so old entries are never read
+again and simply expire; nothing has to be deleted.
+"""
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def _version_key(user_id):
+    return f"readiness:v:{user_id}"
+
+
+def _new_version():
+    # A timestamp rather than a counter: it never collides with versions of
+    # entries still in the cache after the key is evicted, and doubles as the
+    # Last-Modified time for conditional GETs (see assessments.conditional).
+    return time.time_ns()
+
+
+class ReadinessCache:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = Counter()
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def version(self, user_id):
+        version = cache.get(_version_key(user_id))
+        if version is None:
+            version = _new_version()
+            if not cache.add(_version_key(user_id), version, timeout=None):
+                version = cache.get(_version_key(user_id), version)
+        return version
+
+    def bump(self, user_id):
+        cache.set(_version_key(user_id), _new_version(), timeout=None)
+        self._count("invalidations")
+
+    def bump_on_commit(self, user_id):
+        if user_id is not None:
+            transaction.on_commit(lambda: self.bump(user_id))
+
+    def respond(self, user_id, variant, build):
+        """Cached response data for ``variant``, or ``build()`` (a Response) on a miss."""
+        key = f"readiness:{user_id}:{self.version(user_id)}:{variant}"
+        data = cache.get(key)
+        if data is not None:
+            self._count("hits")
+            return Response(data, status=status.HTTP_200_OK)
+
+        self._count("misses")
+        response = build()
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, timeout=settings.READINESS_CACHE_TTL)
+        return response
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats.get("hits", 0) + stats.get("misses", 0)
+        stats["hit_ratio"] = round(stats.get("hits", 0) / lookups, 4) if lookups else 0.0
+        return stats
+
+
+readiness_cache = ReadinessCache()
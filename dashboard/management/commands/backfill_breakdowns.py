@@ -0,0 +1,60 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from assessments.models import Assessment
+from dashboard.services import BREAKDOWN_FIELDS, BREAKDOWN_VERSION, build_detailed_breakdown
+
+
+SNAPSHOT_FIELDS = ["category_breakdown", "breakdown_version"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Store detailed-breakdown snapshots for assessments that have none or "
+        "whose snapshot predates the current BREAKDOWN_VERSION."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rebuild every snapshot, even ones already at the current version.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+
+        queryset = Assessment.objects.order_by("id").only("id", *BREAKDOWN_FIELDS)
+        if not options["force"]:
+            queryset = queryset.filter(
+                Q(breakdown_version__isnull=True) | ~Q(breakdown_version=BREAKDOWN_VERSION)
+            )
+
+        last_id = 0
+        updated = 0
+        started = time.perf_counter()
+
+        while True:
+            chunk = list(queryset.filter(id__gt=last_id)[:chunk_size])
+            if not chunk:
+                break
+
+            for assessment in chunk:
+                assessment.category_breakdown = build_detailed_breakdown(assessment)
+                assessment.breakdown_version = BREAKDOWN_VERSION
+
+            with transaction.atomic():
+                Assessment.objects.bulk_update(chunk, SNAPSHOT_FIELDS, batch_size=500)
+
+            updated += len(chunk)
+            last_id = chunk[-1].id
+            elapsed = time.perf_counter() - started
+            self.stdout.write(f"  up to id {last_id}: {updated} snapshots, {updated / elapsed:,.0f} rows/s")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Stored {updated} breakdown snapshots (version {BREAKDOWN_VERSION})."
+        ))
@@ -1,3 +1,74 @@
+from django.db.models import F, Q, Window
+from django.db.models.functions import Lag, RowNumber
+
+from assessments.models import Assessment
+from assessments.rent_reference import median_rent_for
+from assessments.scoring import RULES, risk_from_score
+from assessments.vectorized import FEATURE_FIELDS, score_rows
+
+# Bump whenever build_detailed_breakdown (or the data it reads, such as the
+# median rent reference) changes so stored snapshots get recomputed.
+BREAKDOWN_VERSION = 1
+
+# Assessment fields build_detailed_breakdown reads.
+BREAKDOWN_FIELDS = (
+    "monthly_rent_budget",
+    "suburb",
+    "lat",
+    "lon",
+    "employment_status",
+    "time_in_role",
+    "rental_history",
+    "household_income",
+    "household_income_period",
+    "documents",
+    "proof_of_income",
+    "context_issues",
+)
+
+
+# How many recent assessments the readiness APIs list as history.
+READINESS_HISTORY_SIZE = 10
+
+# Assessment fields build_readiness_response reads (breakdown, gap analysis,
+# income/rent figures and history); leaves the stored result blobs unloaded.
+READINESS_FIELDS = tuple(dict.fromkeys((
+    "id", "user", "created_at", "readiness_score", "risk_level", "postcode",
+    "individual_income", "individual_income_period", "moving_with_pets",
+    "category_breakdown", "breakdown_version",
+    *BREAKDOWN_FIELDS,
+)))
+
+
+def load_readiness_context(user, assessment_id=None):
+    """
+    One windowed query for the readiness APIs: returns ``(assessment, history)``
+    where ``assessment`` is the requested one (default: the latest) and
+    ``history`` the user's READINESS_HISTORY_SIZE most recent, newest first.
+    Every row carries ``previous_score``, the score of the assessment made
+    just before it (None for the first).
+    """
+    rows = (
+        Assessment.objects
+        .filter(user=user)
+        .only(*READINESS_FIELDS)
+        .annotate(
+            previous_score=Window(Lag("readiness_score"), order_by=[F("created_at").asc(), F("id").asc()]),
+            recency=Window(RowNumber(), order_by=[F("created_at").desc(), F("id").desc()]),
+        )
+        .order_by("-created_at", "-id")
+    )
+
+    if assessment_id is None:
+        history = list(rows[:READINESS_HISTORY_SIZE])
+        return (history[0] if history else None), history
+
+    rows = list(rows.filter(Q(recency__lte=READINESS_HISTORY_SIZE) | Q(id=assessment_id)))
+    assessment = next((row for row in rows if row.id == assessment_id), None)
+    history = [row for row in rows if row.recency <= READINESS_HISTORY_SIZE]
+    return assessment, history
+
+
 def normalize_income_to_annual(income, period):
     try:
         income = float(income or 0)
@@ -26,14 +97,6 @@ def parse_months_in_role(time_in_role: str) -> int:
         return 0
 
 
-def risk_from_score(score: int) -> str:
-    if score >= 70:
-        return "Low"
-    if score >= 40:
-        return "Medium"
-    return "High"
-
-
 def build_detailed_breakdown(a):
     categories = []
 
@@ -223,12 +286,7 @@ def build_detailed_breakdown(a):
     rental_score = categories[2]["score"]
     docs_score = categories[3]["score"]
 
-    suburb_median_rent = {
-        'Sydney CBD': 3000, 'Darling Harbour': 3200, 'The Rocks': 3100,
-        'Melbourne CBD': 2500, 'Docklands': 2400, 'Southbank': 2600,
-        'Brisbane CBD': 2000, 'Fortitude Valley': 2100
-    }
-    median_rent = suburb_median_rent.get(a.suburb or "", 2500)
+    median_rent = median_rent_for(a.suburb, a.lat, a.lon)
     location_score = 70 if float(a.monthly_rent_budget or 0) <= median_rent else 40
     why_overall.append("Target rent compared to typical rent in your chosen suburb.")
 
@@ -258,4 +316,95 @@ def build_detailed_breakdown(a):
         "landlords_look_for": landlord_overall
     })
 
-    return categories
\ No newline at end of file
+    return categories
+
+def get_detailed_breakdown(a):
+    """
+    Stored breakdown snapshot for ``a``, rebuilt (and saved) only when it is
+    missing or was produced by an older BREAKDOWN_VERSION.
+    """
+    if a.breakdown_version == BREAKDOWN_VERSION and a.category_breakdown:
+        return a.category_breakdown
+
+    categories = build_detailed_breakdown(a)
+    a.category_breakdown = categories
+    a.breakdown_version = BREAKDOWN_VERSION
+    if a.pk:
+        Assessment.objects.filter(pk=a.pk).update(
+            category_breakdown=categories,
+            breakdown_version=BREAKDOWN_VERSION
+        )
+    return categories
+
+
+def get_detailed_breakdowns(assessments):
+    """
+    Batch form of get_detailed_breakdown: every stale snapshot is rebuilt
+    and all of them are saved with a single bulk_update.
+    """
+    stale = []
+    breakdowns = []
+    for a in assessments:
+        if a.breakdown_version != BREAKDOWN_VERSION or not a.category_breakdown:
+            a.category_breakdown = build_detailed_breakdown(a)
+            a.breakdown_version = BREAKDOWN_VERSION
+            stale.append(a)
+        breakdowns.append(a.category_breakdown)
+    if stale:
+        Assessment.objects.bulk_update(stale, ["category_breakdown", "breakdown_version"])
+    return breakdowns
+
+
+# Fields compare_assessments reads.
+COMPARE_FIELDS = tuple(dict.fromkeys((
+    "id", "created_at", "readiness_score", "risk_level",
+    "category_breakdown", "breakdown_version",
+    *BREAKDOWN_FIELDS, *FEATURE_FIELDS,
+)))
+
+
+def compare_assessments(assessments):
+    """
+    Side-by-side view of ``assessments`` (oldest first): each one's category
+    scores, then for every consecutive pair the category deltas and the
+    scoring rules whose points changed, plus the overall score trajectory.
+    """
+    breakdowns = get_detailed_breakdowns(assessments)
+    batch = score_rows([{name: getattr(a, name) for name in FEATURE_FIELDS} for a in assessments])
+
+    items = []
+    for i, (a, categories) in enumerate(zip(assessments, breakdowns)):
+        items.append({
+            "id": a.id,
+            "created_at": a.created_at.isoformat(),
+            "readiness_score": a.readiness_score or 0,
+            "risk_level": a.risk_level,
+            "categories": {c["category"]: c["score"] for c in categories},
+            "rule_points": {rule.key: int(batch.rule_points[rule.key][i]) for rule in RULES},
+        })
+
+    changes = []
+    for before, after in zip(items, items[1:]):
+        changes.append({
+            "from": before["id"],
+            "to": after["id"],
+            "score_delta": after["readiness_score"] - before["readiness_score"],
+            "category_deltas": {
+                category: score - before["categories"].get(category, 0)
+                for category, score in after["categories"].items()
+            },
+            "rules_changed": [
+                {"rule": rule.key, "from": before["rule_points"][rule.key], "to": after["rule_points"][rule.key]}
+                for rule in RULES
+                if before["rule_points"][rule.key] != after["rule_points"][rule.key]
+            ],
+        })
+
+    return {
+        "assessments": items,
+        "changes": changes,
+        "trajectory": [
+            {"id": item["id"], "created_at": item["created_at"], "score": item["readiness_score"]}
+            for item in items
+        ],
+    }
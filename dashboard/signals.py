@@ -0,0 +1,20 @@
+from django.db.models.signals import post_delete, post_save
+
+from action_plan.models import CompletedTask, CoverLetter, ReferenceLetter, UserDocument
+from assessments.models import Assessment
+
+from .cache import readiness_cache
+
+# Writes that change what the readiness APIs return for the owning user.
+# Bulk writes that bypass signals (rescore_assessments, import_assessments)
+# bump the affected users themselves.
+READINESS_SOURCES = (Assessment, CompletedTask, UserDocument, ReferenceLetter, CoverLetter)
+
+
+def invalidate_readiness_cache(sender, instance, **kwargs):
+    readiness_cache.bump_on_commit(instance.user_id)
+
+
+for model in READINESS_SOURCES:
+    post_save.connect(invalidate_readiness_cache, sender=model)
+    post_delete.connect(invalidate_readiness_cache, sender=model)
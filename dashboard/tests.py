@@ -1,3 +1,228 @@
-from django.test import TestCase
+from datetime import timedelta
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from action_plan.models import UserDocument
+from assessments.models import Assessment
+from reports.models import TenantReport
+
+from .services import READINESS_HISTORY_SIZE
+
+User = get_user_model()
+
+
+# Query budgets count database round trips; keep the cache out of them.
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class ReadinessResponseQueryTests(APITestCase):
+    """build_readiness_response must not grow queries with the user's history."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="readiness@example.com", password="pw")
+        start = timezone.now() - timedelta(days=30)
+        cls.assessments = []
+        for i in range(15):
+            assessment = Assessment.objects.create(
+                user=cls.user,
+                session_key="readiness",
+                suburb="Sydney",
+                monthly_rent_budget=2000,
+                household_income=90000,
+                household_income_period="annual",
+                employment_status="full_time",
+                documents=["passport"],
+                readiness_score=40 + i,
+            )
+            assessment.created_at = start + timedelta(days=i)
+            assessment.save(update_fields=["created_at"])
+            cls.assessments.append(assessment)
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+        # Store the breakdown snapshots so every request is a pure read.
+        self.client.get("/api/free-readiness/")
+        for assessment in self.assessments:
+            self.client.get("/api/free-readiness/", {"assessment_id": assessment.id})
+        cache.clear()
+
+    def test_latest_assessment_query_budget(self):
+        # Assessments + history (one windowed query), score histogram.
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/free-readiness/")
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["assessment_id"], self.assessments[-1].id)
+        self.assertEqual(data["score_prev"], self.assessments[-2].readiness_score)
+        self.assertEqual(len(data["previous_assessments"]), READINESS_HISTORY_SIZE)
+
+    def test_older_assessment_query_budget(self):
+        target = self.assessments[2]
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/free-readiness/", {"assessment_id": target.id})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["assessment_id"], target.id)
+        self.assertEqual(data["score_prev"], self.assessments[1].readiness_score)
+        self.assertEqual(
+            [item["id"] for item in data["previous_assessments"]],
+            [a.id for a in reversed(self.assessments)][:READINESS_HISTORY_SIZE],
+        )
+
+    def test_other_users_assessment_is_not_found(self):
+        other = User.objects.create_user(email="other@example.com", password="pw")
+        self.client.force_authenticate(other)
+        response = self.client.get("/api/free-readiness/", {"assessment_id": self.assessments[0].id})
+        self.assertEqual(response.status_code, 404)
+
+    def test_invalid_assessment_ids_are_not_found(self):
+        for assessment_id in ("0", "abc", "99999999999999999999"):
+            response = self.client.get("/api/free-readiness/", {"assessment_id": assessment_id})
+            self.assertEqual(response.status_code, 404, assessment_id)
+            self.assertEqual(response.json()["detail"], "Assessment not found.")
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class ReadinessCacheTests(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email="cached@example.com", password="pw")
+        self.assessment = Assessment.objects.create(
+            user=self.user, session_key="cached", readiness_score=50, documents=["passport"]
+        )
+        self.client.force_authenticate(self.user)
+
+    def test_repeat_reads_are_served_from_cache_until_a_write(self):
+        first = self.client.get("/api/free-readiness/").json()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get("/api/free-readiness/").json(), first)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assessment.readiness_score = 65
+            self.assessment.save(update_fields=["readiness_score"])
+
+        self.assertEqual(self.client.get("/api/free-readiness/").json()["score"], 65)
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class DashboardBootstrapTests(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email="bootstrap@example.com", password="pw")
+        User.objects.filter(pk=self.user.pk).update(is_premium=True)
+        self.user.refresh_from_db()
+        self.assessments = [
+            Assessment.objects.create(
+                user=self.user, session_key="bootstrap", readiness_score=50 + i, documents=["passport"]
+            )
+            for i in range(3)
+        ]
+        self.latest = self.assessments[-1]
+        for document_type in ("payslip", "bank_statement"):
+            UserDocument.objects.create(
+                user=self.user, assessment=self.latest, document_type=document_type,
+                file=f"action_plan/documents/{document_type}.pdf"
+            )
+        for assessment in self.assessments:
+            TenantReport.objects.create(assessment=assessment, report_id=f"R2L-{assessment.id}", score=50)
+        self.client.force_authenticate(self.user)
+
+    def test_payload_matches_the_separate_endpoints(self):
+        data = self.client.get("/api/dashboard/bootstrap/").json()
+        self.assertEqual(data["assessment_id"], self.latest.id)
+        self.assertEqual(data["readiness"], self.client.get("/api/detailed-readiness/").json())
+        self.assertEqual(data["tasks"], self.client.get(f"/tasks/{self.latest.id}/").json())
+        self.assertEqual(data["checklist"], self.client.get(f"/checklist/{self.latest.id}/").json())
+        self.assertEqual(data["reports"], self.client.get("/list/").json())
+        self.assertEqual(
+            [a["id"] for a in data["assessments"]["results"]],
+            [a.id for a in reversed(self.assessments)],
+        )
+
+    def test_query_budget(self):
+        self.client.get("/api/dashboard/bootstrap/")
+        # Assessment list, selected assessment, its four prefetched relations
+        # and the report list; readiness comes from the cache.
+        with self.assertNumQueries(7):
+            response = self.client.get("/api/dashboard/bootstrap/")
+        self.assertEqual(response.status_code, 200)
+
+    def test_other_users_assessment_is_not_found(self):
+        other = User.objects.create_user(email="bootstrap-other@example.com", password="pw")
+        self.client.force_authenticate(other)
+        response = self.client.get("/api/dashboard/bootstrap/", {"assessment_id": self.latest.id})
+        self.assertEqual(response.status_code, 404)
+
+    def test_assessment_id_zero_is_not_found(self):
+        response = self.client.get("/api/dashboard/bootstrap/", {"assessment_id": "0"})
+        self.assertEqual(response.status_code, 404)
+
+
+class EmbeddedInitialDataTests(APITestCase):
+
+    def test_dashboard_home_embeds_the_readiness_payload(self):
+        cache.clear()
+        user = User.objects.create_user(email="embedded@example.com", password="pw")
+        Assessment.objects.create(user=user, session_key="embedded", readiness_score=60, documents=["passport"])
+        self.client.force_login(user)
+
+        response = self.client.get("/dashboard/home/")
+        self.assertEqual(response.context["initial_data"], self.client.get("/api/free-readiness/").json())
+        self.assertContains(response, '<script id="initial-data" type="application/json">')
+
+
+class AssessmentCompareTests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="compare@example.com", password="pw")
+        User.objects.filter(pk=self.user.pk).update(is_premium=True)
+        self.user.refresh_from_db()
+        profile = dict(
+            user=self.user, session_key="compare", suburb="Sydney",
+            household_income=90000, household_income_period="annual",
+        )
+        self.before = Assessment.objects.create(
+            **profile, monthly_rent_budget=3500, employment_status="part_time",
+            documents=["passport"], readiness_score=40,
+        )
+        self.after = Assessment.objects.create(
+            **profile, monthly_rent_budget=2000, employment_status="full_time",
+            documents=["passport"], readiness_score=65,
+        )
+        self.client.force_authenticate(self.user)
+        self.url = f"/api/assessments/compare/?ids={self.before.id},{self.after.id}"
+
+    def test_deltas_and_changed_rules(self):
+        data = self.client.get(self.url).json()
+        before, after = data["assessments"]
+        change = data["changes"][0]
+
+        self.assertEqual((change["from"], change["to"]), (self.before.id, self.after.id))
+        self.assertEqual(change["score_delta"], 25)
+        self.assertEqual(change["category_deltas"], {
+            category: score - before["categories"][category]
+            for category, score in after["categories"].items()
+        })
+        changed = {rule["rule"] for rule in change["rules_changed"]}
+        self.assertIn("budget", changed)
+        self.assertIn("employment", changed)
+        self.assertNotIn("documents", changed)
+        self.assertEqual([point["score"] for point in data["trajectory"]], [40, 65])
+
+    def test_loads_assessments_in_one_query(self):
+        self.client.get(self.url)  # store the breakdown snapshots
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_bad_ids(self):
+        for ids in ("1,99999999999999999999", "1,x", str(self.before.id)):
+            self.assertEqual(self.client.get("/api/assessments/compare/", {"ids": ids}).status_code, 400, ids)
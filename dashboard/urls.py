@@ -13,6 +13,18 @@ urlpatterns = [
         name="free-readiness"
     ),
 
+    path(
+        "api/dashboard/bootstrap/",
+        views.DashboardBootstrapView.as_view(),
+        name="dashboard-bootstrap"
+    ),
+
+    path(
+        "api/readiness-cache/stats/",
+        views.ReadinessCacheStatsView.as_view(),
+        name="readiness-cache-stats"
+    ),
+
     # PREMIUM API
     path(
         "api/detailed-readiness/",
@@ -26,6 +38,12 @@ urlpatterns = [
         name="detailed-readiness-detail"
     ),
 
+    path(
+        "api/assessments/compare/",
+        views.AssessmentCompareView.as_view(),
+        name="assessment-compare"
+    ),
+
     # Premium scoring
     path(
         'api/calculate-detailed-analysis/',
@@ -1,16 +1,44 @@
+from urllib.parse import urlencode
+
 from django.shortcuts import render, redirect
 from django.contrib.auth import get_user_model
+from django.urls import reverse
 from assessments.models import Assessment
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework import status
-from .services import build_detailed_breakdown, normalize_income_to_annual
+from .cache import readiness_cache
+from action_plan.checklist_service import ChecklistService
+from action_plan.services import ActionPlanService
+from assessments.pagination import CreatedAtCursorPagination
+from assessments.serializers import AssessmentSerializer
+from reports.serializers import TenantReportSerializer
+from reports.views import user_reports
+from .services import (
+    COMPARE_FIELDS,
+    compare_assessments,
+    get_detailed_breakdown,
+    load_readiness_context,
+    normalize_income_to_annual,
+)
 from django.utils import timezone
+from django.utils.decorators import method_decorator
+from assessments.aggregates import competitiveness
+from assessments.conditional import readiness_condition
 from assessments.gap_analysis import generate_gap_analysis
+from assessments.rent_reference import median_rent_for
 
 User = get_user_model()
 
+# Largest BigAutoField primary key; bigger ids overflow the query.
+MAX_ASSESSMENT_ID = 2 ** 63 - 1
+
+# Assessment list embedded in the bootstrap payload; longer lists continue
+# through the paginated /api/assessment/list/ ("next").
+BOOTSTRAP_ASSESSMENT_FIELDS = ("id", "full_name", "created_at", "readiness_score", "risk_level")
+BOOTSTRAP_ASSESSMENT_LIMIT = 100
+
 
 def require_premium(user):
     """Check if user has premium access (cached on user model)."""
@@ -20,44 +48,81 @@ def require_premium(user):
 def dashboard_home(request):
     if not request.user.is_authenticated:
         return redirect("login")
+    premium = require_premium(request.user)
+    # The same payload the page would fetch from /api/(free|detailed)-readiness/,
+    # embedded with json_script so the first paint needs no extra request.
     return render(request, "dashboard/dashboard_home.html", {
-        "is_premium": require_premium(request.user)
+        "is_premium": premium,
+        "initial_data": readiness_data(request, premium),
     })
 
 
 def detailed_analysis(request):
     if not request.user.is_authenticated:
         return redirect("login")
+    premium = require_premium(request.user)
+    initial_data = None
+    if premium:
+        assessments = recent_assessment_summaries(request.user)
+        initial_data = {
+            "assessments": assessments,
+            "readiness": readiness_data(request, True, assessments[0]["id"]) if assessments else None,
+        }
     return render(request, "dashboard/detailed_analysis.html", {
-        "is_premium": require_premium(request.user)
+        "is_premium": premium,
+        "initial_data": initial_data,
     })
 
 
-def build_readiness_response(request, premium=False):
-    assessment_id = request.query_params.get("assessment_id")
-
-    if assessment_id:
-        try:
-            assessment = Assessment.objects.get(
-                id=assessment_id,
-                user=request.user
-            )
-        except Assessment.DoesNotExist:
-            return Response(
-                {"detail": "Assessment not found."},
-                status=status.HTTP_404_NOT_FOUND
-            )
-    else:
-        assessment = (
+def recent_assessment_summaries(user, limit=10):
+    return [
+        {
+            "id": a.id,
+            "full_name": a.full_name or "Anonymous",
+            "created_at": a.created_at.isoformat(),
+            "monthly_rent_budget": float(a.monthly_rent_budget or 0),
+            "postcode": a.postcode,
+            "score": a.readiness_score or 0,
+            "risk_level": a.risk_level,
+        }
+        for a in (
             Assessment.objects
-            .filter(user=request.user)
-            .order_by("-created_at")
-            .first()
+            .filter(user=user)
+            .only("id", "full_name", "created_at", "monthly_rent_budget", "postcode", "readiness_score", "risk_level")
+            .order_by("-created_at")[:limit]
+        )
+    ]
+
+
+def requested_assessment_id(request, assessment_id=None):
+    """
+    The path or ``?assessment_id=`` value as an int, None for "latest".
+    Raises ValueError for anything that cannot be an assessment id.
+    """
+    if assessment_id is None:
+        assessment_id = request.GET.get("assessment_id") or None
+    if assessment_id is None:
+        return None
+    assessment_id = int(assessment_id)
+    if not 0 <= assessment_id <= MAX_ASSESSMENT_ID:
+        raise ValueError(assessment_id)
+    return assessment_id
+
+
+def build_readiness_response(request, premium=False, assessment_id=None):
+    try:
+        assessment_id = requested_assessment_id(request, assessment_id)
+    except ValueError:
+        return Response(
+            {"detail": "Assessment not found."},
+            status=status.HTTP_404_NOT_FOUND
         )
 
+    assessment, history = load_readiness_context(request.user, assessment_id)
+
     if not assessment:
         return Response(
-            {"detail": "No assessment found."},
+            {"detail": "No assessment found." if assessment_id is None else "Assessment not found."},
             status=status.HTTP_404_NOT_FOUND
         )
 
@@ -66,16 +131,8 @@ def build_readiness_response(request, premium=False):
     # Ensure it's within 0-100
     final_score = max(0, min(final_score, 100))
 
-    # Get previous assessment for trend
-    previous_assessment = (
-        Assessment.objects
-        .filter(user=request.user)
-        .exclude(id=assessment.id)
-        .order_by("-created_at")
-        .first()
-    )
-
-    score_prev = previous_assessment.readiness_score if previous_assessment else final_score
+    # Trend against the assessment made just before this one
+    score_prev = assessment.previous_score
     if score_prev is None:
         score_prev = final_score
     score_prev = max(0, min(score_prev, 100))
@@ -88,21 +145,10 @@ def build_readiness_response(request, premium=False):
     income_weekly = round((annual_income / 52), 2) if annual_income else 0
     target_rent_weekly = round((float(assessment.monthly_rent_budget or 0) / 4), 2)
 
-    suburb_median_rent = {
-        'Sydney CBD': 3000,
-        'Darling Harbour': 3200,
-        'The Rocks': 3100,
-        'Melbourne CBD': 2500,
-        'Docklands': 2400,
-        'Southbank': 2600,
-        'Brisbane CBD': 2000,
-        'Fortitude Valley': 2100,
-    }
-
-    avg_rent_monthly = suburb_median_rent.get(assessment.suburb or "", 2500)
+    avg_rent_monthly = median_rent_for(assessment.suburb, assessment.lat, assessment.lon)
     avg_rent_weekly = round(avg_rent_monthly / 4, 2)
 
-    categories = build_detailed_breakdown(assessment)
+    categories = get_detailed_breakdown(assessment)
 
     breakdown = [
         {"key": c["category"], "value": c["score"]}
@@ -110,7 +156,9 @@ def build_readiness_response(request, premium=False):
     ]
 
     approval_probability = min(95, max(25, final_score))
-    competitiveness_percentile = min(95, max(10, int(final_score * 0.9)))
+    competitiveness_percentile, competitiveness_scope = competitiveness(
+        final_score, assessment.postcode, assessment.suburb
+    )
 
     risk_signals = sorted(
         [
@@ -142,13 +190,6 @@ def build_readiness_response(request, premium=False):
 
     now = timezone.now()
 
-    # Limit to last 10 assessments for performance
-    all_assessments = list(
-        Assessment.objects
-        .filter(user=request.user)
-        .order_by("-created_at")[:10]
-    )
-
     previous_list = [
         {
             "id": item.id,
@@ -156,7 +197,7 @@ def build_readiness_response(request, premium=False):
             "created_at": item.created_at.date().isoformat(),
             "days_ago": (now - item.created_at).days,
         }
-        for item in all_assessments
+        for item in history
     ]
 
     steps = [
@@ -176,6 +217,7 @@ def build_readiness_response(request, premium=False):
         "score_prev": score_prev,
         "approval_probability": approval_probability,
         "competitiveness_percentile": competitiveness_percentile,
+        "competitiveness_scope": competitiveness_scope,
         "risk_signals": risk_signals,
         "next_best_action": next_best_action,
         "last_assessment": assessment.created_at.isoformat(),
@@ -195,27 +237,171 @@ def build_readiness_response(request, premium=False):
     }, status=status.HTTP_200_OK)
 
 
+def readiness_data(request, premium=False, assessment_id=None):
+    """The readiness payload as plain data, or None if there is nothing to show."""
+    response = cached_readiness_response(request, premium, assessment_id)
+    return response.data if response.status_code == status.HTTP_200_OK else None
+
+
+def cached_readiness_response(request, premium=False, assessment_id=None):
+    if assessment_id is None:
+        assessment_id = request.GET.get("assessment_id") or None
+    variant = "{}:{}".format("premium" if premium else "free", "latest" if assessment_id is None else assessment_id)
+    return readiness_cache.respond(
+        request.user.id, variant,
+        lambda: build_readiness_response(request, premium, assessment_id)
+    )
+
+
 class FreeReadinessView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @method_decorator(readiness_condition)
     def get(self, request):
-        return build_readiness_response(request, premium=False)
+        return cached_readiness_response(request, premium=False)
+
+
+def build_bootstrap(request, assessment_id=None):
+    """
+    Everything the action plan, documents and reports pages start from:
+    the assessment list, the (cached) readiness payload, tasks and checklist
+    for the selected assessment and the user's reports. The user, premium
+    status and assessment are resolved once and related rows are loaded a
+    relation at a time, so the query count does not grow with the data.
+    Returns None if ``assessment_id`` is not one of the user's assessments.
+    """
+    user = request.user
+    premium = require_premium(user)
+
+    rows = list(
+        Assessment.objects
+        .filter(user=user)
+        .only(*BOOTSTRAP_ASSESSMENT_FIELDS)
+        .order_by("-created_at", "-id")[:BOOTSTRAP_ASSESSMENT_LIMIT + 1]
+    )
+    listed, more = rows[:BOOTSTRAP_ASSESSMENT_LIMIT], len(rows) > BOOTSTRAP_ASSESSMENT_LIMIT
+    next_page = None
+    if more:
+        next_page = "{}?{}".format(reverse("assessment-list"), urlencode({
+            "fields": ",".join(BOOTSTRAP_ASSESSMENT_FIELDS),
+            "page_size": BOOTSTRAP_ASSESSMENT_LIMIT,
+            "cursor": CreatedAtCursorPagination.encode_cursor(listed[-1].created_at, listed[-1].pk),
+        }))
+
+    try:
+        assessment_id = requested_assessment_id(request, assessment_id)
+    except ValueError:
+        return None
+    if assessment_id is None and listed:
+        assessment_id = listed[0].id
+
+    assessment = None
+    if assessment_id is not None:
+        assessment = Assessment.objects.filter(user=user, id=assessment_id).only("id", "user", "readiness_score")
+        if premium:
+            assessment = ActionPlanService.with_task_relations(assessment)
+        assessment = assessment.first()
+        if assessment is None:
+            return None
+
+    return {
+        "assessment_id": assessment_id,
+        "is_premium": premium,
+        "assessments": {
+            "results": AssessmentSerializer(listed, many=True, fields=BOOTSTRAP_ASSESSMENT_FIELDS).data,
+            "next": next_page,
+        },
+        "readiness": readiness_data(request, premium, assessment_id) if assessment else None,
+        # Premium-only sections, as on their own endpoints.
+        "tasks": ActionPlanService.get_tasks_payload(user, assessment) if premium else None,
+        "checklist": (
+            ChecklistService.get_checklist_for_assessment(user, assessment) if premium else None
+        ),
+        "reports": TenantReportSerializer(user_reports(user), many=True, context={"request": request}).data,
+    }
+
+
+class DashboardBootstrapView(APIView):
+    """
+    /api/dashboard/bootstrap/?assessment_id= — the composite payload of
+    build_bootstrap, so a page loads in one round trip instead of five.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        data = build_bootstrap(request)
+        if data is None:
+            return Response(
+                {"detail": "Assessment not found."},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(data, status=status.HTTP_200_OK)
+
+
+class ReadinessCacheStatsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(readiness_cache.stats())
 
 
 class DetailedReadinessAnalysisView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @method_decorator(readiness_condition)
     def get(self, request, assessment_id=None):
         if not require_premium(request.user):
             return Response(
                 {"detail": "Premium required.", "is_premium": False},
                 status=status.HTTP_403_FORBIDDEN
             )
-        # If assessment_id is provided, pass it via query_params
-        if assessment_id:
-            request.query_params = request.query_params.copy()
-            request.query_params['assessment_id'] = assessment_id
-        return build_readiness_response(request, premium=True)
+        return cached_readiness_response(request, premium=True, assessment_id=assessment_id)
+
+
+class AssessmentCompareView(APIView):
+    """
+    /api/assessments/compare/?ids=1,2,3 — category breakdowns, per-pair
+    deltas and changed rules for up to MAX_ASSESSMENTS of the user's
+    assessments, loaded in one query.
+    """
+    permission_classes = [IsAuthenticated]
+    MAX_ASSESSMENTS = 10
+
+    def get(self, request):
+        if not require_premium(request.user):
+            return Response(
+                {"detail": "Premium required.", "is_premium": False},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        try:
+            ids = list(dict.fromkeys(
+                int(value) for value in request.query_params.get("ids", "").split(",") if value.strip()
+            ))
+        except ValueError:
+            return Response({"detail": "ids must be comma-separated integers."}, status=status.HTTP_400_BAD_REQUEST)
+        if any(not 0 < value <= MAX_ASSESSMENT_ID for value in ids):
+            return Response({"detail": "ids out of range."}, status=status.HTTP_400_BAD_REQUEST)
+        if not 2 <= len(ids) <= self.MAX_ASSESSMENTS:
+            return Response(
+                {"detail": f"Provide between 2 and {self.MAX_ASSESSMENTS} assessment ids."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        assessments = list(
+            Assessment.objects
+            .filter(user=request.user, id__in=ids)
+            .only(*COMPARE_FIELDS)
+            .order_by("created_at", "id")
+        )
+        missing = set(ids) - {a.id for a in assessments}
+        if missing:
+            return Response(
+                {"detail": "Assessment not found.", "ids": sorted(missing)},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        return Response(compare_assessments(assessments), status=status.HTTP_200_OK)
 
 
 class CalculateCategoryScoresView(APIView):
@@ -240,7 +426,7 @@ class CalculateCategoryScoresView(APIView):
                     status=status.HTTP_404_NOT_FOUND
                 )
 
-            categories = build_detailed_breakdown(assessment)
+            categories = get_detailed_breakdown(assessment)
 
             return Response({
                 "assessment_id": assessment.id,
@@ -252,27 +438,10 @@ class CalculateCategoryScoresView(APIView):
             }, status=status.HTTP_200_OK)
 
         # List all assessments (limited to last 10 for performance)
-        assessments = (
-            Assessment.objects
-            .filter(user=request.user)
-            .order_by('-created_at')[:10]
-        )
-
-        data = [
-            {
-                "id": a.id,
-                "full_name": a.full_name or "Anonymous",
-                "created_at": a.created_at.isoformat(),
-                "monthly_rent_budget": float(a.monthly_rent_budget or 0),
-                "postcode": a.postcode,
-                "score": a.readiness_score or 0,
-                "risk_level": a.risk_level,
-            }
-            for a in assessments
-        ]
+        data = recent_assessment_summaries(request.user)
 
         return Response({
             "assessments": data,
             "count": len(data),
             "is_premium": True
-        }, status=status.HTTP_200_OK)
\ No newline at end of file
+        }, status=status.HTTP_200_OK)
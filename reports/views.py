@@ -18,13 +18,18 @@ class ReportsPageView(TemplateView):
     template_name = "reports/reports_page.html"
 
 
+def user_reports(user):
+    # The serializer reads the assessment's name and date: join it in.
+    return TenantReport.objects.filter(
+        assessment__user=user
+    ).select_related("assessment").order_by("-created_at")
+
+
 class ReportListView(ListAPIView):
     serializer_class = TenantReportSerializer
 
     def get_queryset(self):
-        return TenantReport.objects.filter(
-            assessment__user=self.request.user
-        ).order_by("-created_at")
+        return user_reports(self.request.user)
 
 
 class GenerateTenantReport(APIView):
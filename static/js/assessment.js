@@ -182,6 +182,12 @@ document.addEventListener('DOMContentLoaded', function () {
             body: JSON.stringify(data)
         })
             .then(res => {
+                if (res.status === 400) {
+                    return res.json().then(body => {
+                        const messages = Object.values(body.errors || {}).flat();
+                        throw new Error(messages.join('\n') || `HTTP ${res.status}`);
+                    });
+                }
                 if (!res.ok) throw new Error(`HTTP ${res.status}`);
                 return res.json();
             })
@@ -211,6 +217,10 @@ document.addEventListener('DOMContentLoaded', function () {
                             <ul>
                                 ${(result.weaknesses || []).map(w => `<li>${escapeHtml(w)}</li>`).join('')}
                             </ul>
+                            <div id="recommendations" style="display:none;">
+                                <h3 style="margin-top:15px;">Recommendations:</h3>
+                                <ul id="recommendationsList"></ul>
+                            </div>
                         </div>
                         <div style="margin-top:25px;">
                             <button onclick="location.reload()" 
@@ -224,10 +234,11 @@ document.addEventListener('DOMContentLoaded', function () {
                         </div>
                     </div>
                 `;
+                pollEnrichment(result.id);
             })
             .catch(error => {
                 console.error('Submission error:', error);
-                alert('Something went wrong. Please try again.');
+                alert(`Something went wrong. Please try again.\n\n${error.message}`);
             })
             .finally(() => {
                 if (submitBtn) submitBtn.disabled = false;
@@ -236,6 +247,26 @@ document.addEventListener('DOMContentLoaded', function () {
 });
 
 // ========== Helper Functions ==========
+// Gap analysis is computed after submit; poll briefly and show it when ready.
+function pollEnrichment(assessmentId, attempt = 0) {
+    if (!assessmentId || attempt >= 10) return;
+    fetch(`/api/assessment/${assessmentId}/enrichment/`, { credentials: 'same-origin' })
+        .then(res => (res.ok ? res.json() : null))
+        .then(data => {
+            if (!data || data.enrichment_status === 'failed') return;
+            if (data.enrichment_status !== 'done') {
+                setTimeout(() => pollEnrichment(assessmentId, attempt + 1), 1000);
+                return;
+            }
+            const recommendations = data.recommendations || [];
+            const list = document.getElementById('recommendationsList');
+            if (!list || !recommendations.length) return;
+            list.innerHTML = recommendations.map(r => `<li>${escapeHtml(r.suggestion)}</li>`).join('');
+            document.getElementById('recommendations').style.display = 'block';
+        })
+        .catch(() => {});
+}
+
 function getRiskColor(risk) {
     switch (risk) {
         case 'Low': return '#198754';